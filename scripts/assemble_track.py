@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Assemble the final voice track from a TTS manifest
+Every segment WAV is placed at its manifest time_start and streamed into one
+WAV/FLAC block by block, with short crossfades, silence in the gaps and a
+warning for each segment that runs past its time_end. Segments are
+loudness-matched on the way in: each gets the gain that brings its measured
+integrated loudness to the target (files themselves are left untouched).
+"""
+import argparse
+import json
+import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.audio.assembler import (
+    BLOCK_SECONDS, CROSSFADE_MS, OVERRUN_POLICIES, SHIFT, Placement, TrackAssembler,
+)
+from utils.audio.loudness import DEFAULT_LOUDNESS_CACHE, DEFAULT_TARGET_LUFS, PEAK_CEILING_DB, LoudnessCache
+from utils.audio.store import resolve
+from utils.text.vtt import format_timestamp, parse_timestamp
+
+
+def placements_from_manifest(manifest, audio_dir: Path):
+    return [
+        Placement(resolve(audio_dir / item['audio_file']), parse_timestamp(item['time_start']),
+                  parse_timestamp(item['time_end']) if item.get('time_end') else None,
+                  label=f"{item['segment']:02d} {item['speaker']}: {item['section']}")
+        for item in manifest
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Lay manifest segments onto one timeline and render the track')
+    parser.add_argument('--manifest', default='output/tts/10min/manifest.json', help='TTS manifest')
+    parser.add_argument('--output', default='output/tts/10min_track.wav', help='Track file (.wav or .flac)')
+    parser.add_argument('--overrun', choices=OVERRUN_POLICIES, default=SHIFT,
+                        help='Segment longer than its slot: shift later segments, truncate it, or overlap')
+    parser.add_argument('--crossfade-ms', type=int, default=CROSSFADE_MS, help='Fade at every segment edge')
+    parser.add_argument('--block-seconds', type=float, default=BLOCK_SECONDS, help='Render block size')
+    parser.add_argument('--sample-rate', type=int, help='Track sample rate (default: from the first segment)')
+    parser.add_argument('--channels', type=int, default=1, help='Track channels')
+    parser.add_argument('--target-lufs', type=float, default=DEFAULT_TARGET_LUFS, help='Per-segment loudness target')
+    parser.add_argument('--peak-ceiling-db', type=float, default=PEAK_CEILING_DB,
+                        help='Normalization never pushes a segment peak above this')
+    parser.add_argument('--no-normalize', action='store_true', help='Keep every segment at its recorded level')
+    parser.add_argument('--loudness-cache', default=DEFAULT_LOUDNESS_CACHE, help='Measurements keyed by audio hash')
+    args = parser.parse_args()
+
+    manifest_file = Path(args.manifest)
+    with open(manifest_file) as f:
+        manifest = json.load(f)
+    placements = placements_from_manifest(manifest, manifest_file.parent)
+
+    loudness = {}
+    if not args.no_normalize:
+        cache = LoudnessCache(args.loudness_cache)
+        loudness = cache.measure_all(p.path for p in placements if p.path.exists())
+        cache.save()
+        for placement in placements:
+            if placement.path in loudness:
+                placement.gain = loudness[placement.path].gain(args.target_lufs, args.peak_ceiling_db)
+
+    assembler = TrackAssembler(args.sample_rate, args.channels, args.crossfade_ms, args.overrun, args.block_seconds)
+    result = assembler.assemble(placements, Path(args.output))
+    sr = result.sample_rate
+
+    target = 'no normalization' if args.no_normalize else f'normalized to {args.target_lufs:g} LUFS'
+    print(f"🎚️  Assembling {len(placements)} segments ({args.overrun} on overrun, {target})\n")
+    warnings = 0
+    for segment in result.segments:
+        label = segment.placement.label
+        if segment.missing:
+            warnings += 1
+            print(f"   ⚠️  {label}: missing {segment.placement.path.name}, slot left silent")
+            continue
+        shift = (segment.start - segment.scheduled) / sr
+        line = (f"   {format_timestamp(segment.start * 1000 // sr)} {label[:48]:48} "
+                f"{segment.source_frames / sr:6.1f}s")
+        if segment.slot_end is not None:
+            line += f" / {(segment.slot_end - segment.scheduled) / sr:.0f}s slot"
+        measured = loudness.get(segment.placement.path)
+        if measured is not None:
+            line += f", {measured.lufs:5.1f} LUFS {20 * math.log10(segment.placement.gain):+5.1f} dB"
+        if shift > 0:
+            line += f", shifted +{shift:.1f}s"
+        overrun = segment.overrun() / sr
+        if overrun > 0:
+            warnings += 1
+            line = line.replace('   ', '   ⚠️  ', 1) + f", overruns by {overrun:.1f}s"
+        # Late only because of an earlier overrun, which is already flagged
+        spill = segment.spill() / sr
+        if spill > 0:
+            line += f", pushed {spill:.1f}s past its slot"
+        print(line)
+
+    if result.clipped_samples:
+        print(f"\n   ⚠️  {result.clipped_samples} samples clipped where segments overlap")
+    print(f"\n✅ {result.output}: {format_timestamp(int(result.duration_s * 1000))} at {sr} Hz, "
+          f"rendered in {result.elapsed:.2f}s" + (f" ({warnings} warnings)" if warnings else ''))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -39,13 +39,15 @@ DEVICE="${1:-cpu}"
 echo "🖥️  Using device: $DEVICE"
 echo ""
 
-# Generate TTS
+# Prepare manifest, then synthesize through the API server
+# (start it first: cd fish-speech && python tools/api_server.py --device $DEVICE)
 echo "🎙️  Generating TTS audio..."
 python scripts/generate_tts_10min.py "$DEVICE"
+python scripts/generate_tts_audio.py --concurrency "${TTS_CONCURRENCY:-2}"
 
 echo ""
 echo "✅ TTS generation complete!"
 echo "📁 Output: output/tts/10min/"
 echo ""
 echo "Generated files:"
-ls -lh output/tts/10min/*.wav 2>/dev/null || echo "No audio files generated"
+ls -lh output/tts/10min/*.flac 2>/dev/null || echo "No audio files generated"
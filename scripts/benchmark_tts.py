@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Benchmark the TTS generation pipeline against mock Fish Speech servers
+Runs generate_tts_audio.py unchanged (manifest, chunk jobs, scheduler, client,
+stitching) for each server/concurrency configuration and reports throughput
+and per-chunk tail latency. No model, GPU or network needed. With --check it
+is a smoke test: every segment must render with a real RTF, and a second run
+against the same cache must be served without any request.
+"""
+import argparse
+import json
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.voice_clone.metrics import load_records
+from utils.voice_clone.mock_server import LatencyModel, MockFishServer
+
+GENERATE_SCRIPT = Path(__file__).parent / 'generate_tts_audio.py'
+
+
+def parse_list(spec: str):
+    return [int(n) for n in spec.split(',') if n.strip()]
+
+
+def percentile(values, q):
+    return float(np.percentile(values, q)) if values else 0.0
+
+
+def run_config(manifest, segments, n_servers, concurrency, latency, workdir: Path, name: str = None,
+               cache_dir: Path = None):
+    """One full generation run against fresh mock servers; returns its measurements"""
+    run_dir = workdir / (name or f's{n_servers}-c{concurrency}')
+    run_dir.mkdir(parents=True)
+    manifest_file = run_dir / 'manifest.json'
+    with open(manifest_file, 'w') as f:
+        json.dump(manifest, f)
+
+    with ExitStack() as stack:
+        servers = [stack.enter_context(MockFishServer(latency=latency, seed=n)) for n in range(n_servers)]
+        cmd = [sys.executable, str(GENERATE_SCRIPT), '--manifest', str(manifest_file),
+               '--segments', segments, '--concurrency', str(concurrency), '--retries', '0',
+               '--references-dir', str(run_dir / 'references'), '--label', 'benchmark']
+        cmd += ['--cache-dir', str(cache_dir)] if cache_dir else ['--no-cache']
+        for server in servers:
+            cmd += ['--api-url', server.url]
+        started = time.perf_counter()
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+        elapsed = time.perf_counter() - started
+        requests = sum(s.requests for s in servers)
+        encodes = sum(s.encodes for s in servers)
+
+    if proc.returncode != 0:
+        raise RuntimeError(f'generation failed ({n_servers} servers, concurrency {concurrency}):\n{proc.stdout[-2000:]}')
+
+    # A run served entirely from cache synthesizes nothing and writes no metrics
+    metrics_file = run_dir / 'metrics.jsonl'
+    records = load_records(metrics_file) if metrics_file.exists() else []
+    chunks = [r for r in records if r['type'] == 'chunk']
+    summary = next((r for r in records if r['type'] == 'run'), {'elapsed': 0.0, 'chars': 0, 'audio_seconds': 0.0,
+                                                               'effective_rtf': None})
+    latencies = [r['wall_time'] for r in chunks]
+    waits = [r['queue_wait'] for r in chunks]
+    rendered, selected = (int(n) for n in re.search(r'✅ Segments: (\d+)/(\d+)', proc.stdout).groups())
+    cache_hits = 0
+    if cache_dir and (cache_dir / 'index.json').exists():
+        with open(cache_dir / 'index.json') as f:
+            cache_hits = json.load(f)['stats']['hits']
+    return {
+        'servers': n_servers,
+        'concurrency': concurrency,
+        'segments': selected,
+        'segments_rendered': rendered,
+        'chunks': len(chunks),
+        'requests': requests,
+        'reference_encodes': encodes,
+        'cache_hits': cache_hits,
+        'elapsed': round(elapsed, 3),
+        'generation_time': summary['elapsed'],
+        'chars_per_second': round(summary['chars'] / summary['elapsed'], 1) if summary['elapsed'] else None,
+        'audio_per_second': round(summary['audio_seconds'] / summary['elapsed'], 2) if summary['elapsed'] else None,
+        'effective_rtf': summary['effective_rtf'],
+        'p50': round(percentile(latencies, 50), 3),
+        'p95': round(percentile(latencies, 95), 3),
+        'p99': round(percentile(latencies, 99), 3),
+        'max': round(max(latencies, default=0.0), 3),
+        'queue_wait_p95': round(percentile(waits, 95), 3),
+    }
+
+
+def check(results, cold, warm):
+    """Smoke-test failures (empty when the pipeline behaves)"""
+    failures = []
+    for r in results + [cold]:
+        config = f"{r['servers']} server(s) × {r['concurrency']}"
+        if not r['segments'] or r['segments_rendered'] != r['segments']:
+            failures.append(f"{config}: {r['segments_rendered']}/{r['segments']} segments rendered")
+        if not r['chunks']:
+            failures.append(f"{config}: no chunks synthesized")
+        if not r['effective_rtf']:
+            failures.append(f"{config}: no real-time factor (no audio produced)")
+    # The cumulative index counts the cold run's misses and the warm run's hits
+    if warm['requests'] or warm['cache_hits'] != cold['chunks']:
+        failures.append(f"cached rerun: {warm['cache_hits']}/{cold['chunks']} chunks from cache, "
+                        f"{warm['requests']} requests sent")
+    if warm['segments_rendered'] != warm['segments']:
+        failures.append(f"cached rerun: {warm['segments_rendered']}/{warm['segments']} segments rendered")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark TTS generation against mock Fish Speech servers')
+    parser.add_argument('--manifest', default='output/tts/10min/manifest.json', help='Manifest to generate')
+    parser.add_argument('--segments', default='all', help="Segments to generate (all, 1-3, 4-6, 1,5)")
+    parser.add_argument('--servers', default='1,2', help='Comma-separated server counts to sweep')
+    parser.add_argument('--concurrency', default='1,2,4', help='Comma-separated per-server concurrency to sweep')
+    parser.add_argument('--overhead', type=float, default=0.05, help='Mock per-request overhead (s)')
+    parser.add_argument('--per-char', type=float, default=0.002, help='Mock synthesis cost per character (s)')
+    parser.add_argument('--reference-encode', type=float, default=0.2, help='Mock cost of a cold reference voice (s)')
+    parser.add_argument('--server-slots', type=int, default=1, help='Requests each mock server processes at once')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Relative latency jitter (0.1 = ±10%%)')
+    parser.add_argument('--output', help='Write the results as JSON')
+    parser.add_argument('--check', action='store_true',
+                        help='Smoke test: also rerun against a warm cache and fail on missing segments, cache misses '
+                             'or a zero real-time factor')
+    args = parser.parse_args()
+
+    manifest_file = Path(args.manifest)
+    if not manifest_file.exists():
+        print(f"❌ Manifest not found: {manifest_file}")
+        print("   Run: python scripts/generate_tts_10min.py")
+        return 1
+    with open(manifest_file) as f:
+        manifest = json.load(f)
+
+    latency = LatencyModel(overhead=args.overhead, per_char=args.per_char, reference_encode=args.reference_encode,
+                           concurrency=args.server_slots, jitter=args.jitter)
+    print("⏱️  TTS Pipeline Benchmark (mock Fish Speech)\n")
+    print(f"   📄 Manifest: {manifest_file} (segments {args.segments})")
+    print(f"   🐟 Mock latency: {latency.overhead}s + {latency.per_char}s/char, "
+          f"{latency.reference_encode}s cold voice, {latency.concurrency} slot(s)/server\n")
+
+    results = []
+    workdir = Path(tempfile.mkdtemp(prefix='tts-bench-'))
+    try:
+        for n_servers in parse_list(args.servers):
+            for concurrency in parse_list(args.concurrency):
+                result = run_config(manifest, args.segments, n_servers, concurrency, latency, workdir)
+                results.append(result)
+                print(f"   {n_servers} server(s) × {concurrency}: {result['chunks']} chunks in "
+                      f"{result['generation_time']:.2f}s")
+        if args.check:
+            n_servers, concurrency = parse_list(args.servers)[0], parse_list(args.concurrency)[0]
+            cache_dir = workdir / 'cache'
+            cold = run_config(manifest, args.segments, n_servers, concurrency, latency, workdir, 'cache-cold', cache_dir)
+            warm = run_config(manifest, args.segments, n_servers, concurrency, latency, workdir, 'cache-warm', cache_dir)
+            print(f"   cached rerun: {warm['cache_hits']}/{cold['chunks']} chunks from cache, "
+                  f"{warm['requests']} requests")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"\n{'servers':>7} {'conc':>4} {'chunks':>6} {'time':>7} {'chars/s':>8} {'audio/s':>8} "
+          f"{'p50':>6} {'p95':>6} {'p99':>6} {'wait95':>6} {'enc':>4}")
+    for r in results:
+        print(f"{r['servers']:>7} {r['concurrency']:>4} {r['chunks']:>6} {r['generation_time']:>6.2f}s "
+              f"{r['chars_per_second'] or 0:>8.1f} {r['audio_per_second'] or 0:>8.2f} "
+              f"{r['p50']:>6.2f} {r['p95']:>6.2f} {r['p99']:>6.2f} {r['queue_wait_p95']:>6.2f} "
+              f"{r['reference_encodes']:>4}")
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, 'w') as f:
+            json.dump({'latency': vars(latency), 'segments': args.segments, 'results': results}, f, indent=2)
+        print(f"\n📄 Results: {output}")
+
+    if args.check:
+        failures = check(results, cold, warm)
+        if failures:
+            print("\n❌ Smoke test failed:")
+            for failure in failures:
+                print(f"   {failure}")
+            return 1
+        print("\n✅ Smoke test passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Build / query the rewrite memory
+Snapshots the id-keyed hand rewrite tables (REWRITES, HIGHLY_PROFESSIONAL_REWRITES)
+as (original → rewrite) pairs against the transcript the ids were written for,
+so the rewrites keep applying after re-transcription. With --check, shows
+which segments of another transcript would get a stored rewrite.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from create_highly_professional_rewrites import REWRITES
+from create_professional_script import HIGHLY_PROFESSIONAL_REWRITES
+from utils.text.rewrite_memory import DEFAULT_MEMORY, SUGGEST_THRESHOLD, TABLE_RECORDING, Entry, RewriteMemory
+
+TABLES = {
+    'REWRITES': REWRITES,
+    'HIGHLY_PROFESSIONAL_REWRITES': HIGHLY_PROFESSIONAL_REWRITES,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or query the fuzzy rewrite memory')
+    parser.add_argument('--transcript', default='output/original/corrected_transcript.json',
+                        help='Transcript the rewrite tables\' segment ids refer to')
+    parser.add_argument('--recording', default=TABLE_RECORDING, help='Recording id of that transcript')
+    parser.add_argument('--memory', default=DEFAULT_MEMORY, help='Rewrite memory file')
+    parser.add_argument('--check', help='Transcript JSON to match against the memory instead of building')
+    parser.add_argument('--table', default='REWRITES', choices=list(TABLES), help='Table used by --check')
+    parser.add_argument('--threshold', type=float, default=SUGGEST_THRESHOLD, help='Minimum similarity shown')
+    args = parser.parse_args()
+
+    if args.check:
+        memory = RewriteMemory.load(args.memory)
+        with open(args.check) as f:
+            segments = json.load(f)
+        applied = suggested = 0
+        for seg in segments:
+            match = memory.match(seg['original'], args.table, args.threshold)
+            if not match:
+                continue
+            status = '✅ apply' if match.apply else '💡 suggest'
+            applied += match.apply
+            suggested += not match.apply
+            print(f"{status} {seg['id']} ← {match.entry.source} (similarity {match.similarity:.2f})")
+            print(f"   {seg['original'][:90]}")
+        print(f"\n{applied} applied, {suggested} suggested, {len(segments) - applied - suggested} unmatched")
+        return 0
+
+    with open(args.transcript) as f:
+        segments = {seg['id']: seg for seg in json.load(f)}
+    memory = RewriteMemory.load(args.memory) if Path(args.memory).exists() else RewriteMemory()
+    before = len(memory)
+    for table, rewrites in TABLES.items():
+        missing = [seg_id for seg_id in rewrites if seg_id not in segments]
+        if missing:
+            print(f"⚠️  {table}: ids not in {args.transcript}: {missing}")
+        for seg_id, rewrite in rewrites.items():
+            if seg_id in segments:
+                memory.add(Entry(table, segments[seg_id]['original'], rewrite, f'{args.recording}:{seg_id:05d}'))
+    memory.save(args.memory)
+    print(f"✅ {len(memory)} pairs ({len(memory) - before} new) → {args.memory}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Build a TTS manifest of speaking turns for re-voicing a whole transcript
+Consecutive same-speaker cues are merged into turns, so generate_tts_audio.py
+makes one request per turn instead of one per cue. After generation,
+--split cuts every turn back into per-cue FLAC clips.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.audio.store import read_span, resolve, write_audio
+from utils.text.chunking import Chunk
+from utils.text.duration_model import SpeakingRateModel
+from utils.text.speakers import speaker_id
+from utils.text.turns import MAX_CHARS, MAX_DURATION_MS, MAX_GAP_MS, Turn, TurnPart, merge_turns
+from utils.text.vtt import Cue, format_timestamp, parse_timestamp
+
+
+def build_manifest(turns, model=None):
+    manifest = []
+    for n, turn in enumerate(turns, 1):
+        ref = speaker_id(turn.speaker)
+        name = f"{n:03d}_{ref}"
+        item = {
+            'segment': n,
+            'section': f"Turn {n} (cues {turn.cue_ids[0]}-{turn.cue_ids[-1]})",
+            'speaker': ref.capitalize(),
+            'time_start': format_timestamp(turn.start_ms),
+            'time_end': format_timestamp(turn.end_ms),
+            'duration': f"{round((turn.end_ms - turn.start_ms) / 1000)}s",
+            'text_file': f"{name}.txt",
+            'audio_file': f"{name}.flac",
+            'script': turn.text,
+            'reference_id': ref,
+            # Turns are already capped in size: one request each
+            'chunks': [Chunk(turn.text, 0).to_dict()],
+            'cues': turn.to_dict()['parts'],
+        }
+        if model:
+            item['predicted_seconds'] = round(model.predict(turn.text, turn.speaker), 1)
+        manifest.append(item)
+    return manifest
+
+
+def split_turns(manifest, output_dir: Path) -> int:
+    """Cut each generated turn into per-cue clips under output_dir/cues/"""
+    cues_dir = output_dir / 'cues'
+    cues_dir.mkdir(parents=True, exist_ok=True)
+    written = 0
+    for item in manifest:
+        path = resolve(output_dir / item['audio_file'])
+        if not path.exists():
+            continue
+        audio, sr = read_span(path)
+        turn = Turn(item['speaker'], [TurnPart(**part) for part in item['cues']], item['script'])
+        for cue_id, start, end in turn.cue_spans(len(audio) / sr):
+            write_audio(cues_dir / f"{cue_id:05d}.flac", audio[int(start * sr):int(end * sr)], sr)
+            written += 1
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Merge transcript cues into speaking turns for TTS')
+    parser.add_argument('--transcript', default='output/original/corrected_transcript.json', help='Transcript JSON')
+    parser.add_argument('--field', default='corrected', help='Segment text field to voice (falls back to original)')
+    parser.add_argument('--output-dir', default='output/tts/full', help='Where the manifest and audio go')
+    parser.add_argument('--max-chars', type=int, default=MAX_CHARS, help='Longest turn in characters')
+    parser.add_argument('--max-seconds', type=float, default=MAX_DURATION_MS / 1000, help='Longest turn in seconds')
+    parser.add_argument('--max-gap', type=float, default=MAX_GAP_MS / 1000,
+                        help='Start a new turn after a silence longer than this (seconds)')
+    parser.add_argument('--split', action='store_true', help='Cut generated turns back into per-cue clips')
+    args = parser.parse_args()
+
+    output_dir = Path(args.output_dir)
+    manifest_file = output_dir / 'manifest.json'
+
+    if args.split:
+        with open(manifest_file) as f:
+            manifest = json.load(f)
+        written = split_turns(manifest, output_dir)
+        print(f"✂️  {written} cue clips → {output_dir / 'cues'}")
+        return 0
+
+    with open(args.transcript) as f:
+        segments = json.load(f)
+    cues = [Cue(seg['id'], parse_timestamp(seg['start']), parse_timestamp(seg['end']), seg['speaker'],
+                seg.get(args.field) or seg['original'])
+            for seg in segments]
+    turns = merge_turns(cues, args.max_chars, int(args.max_seconds * 1000), int(args.max_gap * 1000))
+
+    model = SpeakingRateModel.from_source_dir()
+    manifest = build_manifest(turns, model)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for item in manifest:
+        (output_dir / item['text_file']).write_text(item['script'], encoding='utf-8')
+    with open(manifest_file, 'w') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+    requests = sum(len(item['chunks']) for item in manifest)
+    print("🗣️  Speaking turns\n")
+    print(f"   📄 {args.transcript} ({args.field})")
+    print(f"   {len(cues)} cues → {len(turns)} turns → {requests} TTS requests")
+    print(f"   Longest turn: {max((len(t.text) for t in turns), default=0)} chars, "
+          f"{max((t.end_ms - t.start_ms for t in turns), default=0) / 1000:.1f}s")
+    print(f"\n📁 Manifest: {manifest_file}")
+    print(f"   Generate: python scripts/generate_tts_audio.py --manifest {manifest_file}")
+    print(f"   Then:     python {Path(sys.argv[0]).as_posix()} --output-dir {output_dir} --split")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Convert WAV intermediates into FLAC artifacts
+Speaker clips, voice samples, TTS segments and reference clips written by
+older runs are re-encoded losslessly as FLAC (the WAV is removed once the
+FLAC is in place) and each store directory's header index is refreshed.
+TTS chunk caches keep their WAVs: they are content-hashed API responses.
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import soundfile as sf
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.audio.store import LEGACY_SUFFIXES, AudioStore, write_audio
+
+STORE_ROOTS = ['output/speakers', 'output/tts/10min', 'output/tts/full', 'output/corpus/audio',
+               'fish-speech/references']
+
+
+def compact(path: Path):
+    before = path.stat().st_size
+    # Only 16-bit PCM converts losslessly to the store's FLAC subtype
+    if sf.info(str(path)).subtype != 'PCM_16':
+        return path, before, None
+    audio, sr = sf.read(str(path), dtype='int16', always_2d=True)
+    target = write_audio(path, audio if audio.shape[1] > 1 else audio[:, 0], sr)
+    return path, before, target.stat().st_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Re-encode WAV intermediates as FLAC artifacts')
+    parser.add_argument('roots', nargs='*', default=STORE_ROOTS, help='Store directories')
+    parser.add_argument('--workers', type=int, default=4, help='Files encoded in parallel')
+    parser.add_argument('--dry-run', action='store_true', help='List what would be converted')
+    args = parser.parse_args()
+
+    roots = [Path(root) for root in args.roots if Path(root).is_dir()]
+    paths = sorted(p for root in roots for suffix in LEGACY_SUFFIXES for p in root.rglob(f'*{suffix}')
+                   if 'chunks' not in p.parts)
+    print(f"🗜️  {len(paths)} WAV files under {', '.join(map(str, roots)) or '(no store directories)'}\n")
+    if args.dry_run:
+        for path in paths:
+            print(f"   {path}")
+        return 0
+
+    started = time.perf_counter()
+    total_before = total_after = converted = 0
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        for path, before, after in pool.map(compact, paths):
+            if after is None:
+                print(f"   ⏭️  {path}: not 16-bit PCM, kept as WAV")
+                continue
+            converted += 1
+            total_before += before
+            total_after += after
+    for root in roots:
+        store = AudioStore(root)
+        store.scan()
+        store.save()
+
+    ratio = total_before / total_after if total_after else 0.0
+    print(f"✅ {converted} files: {total_before / 1e6:.1f} MB → {total_after / 1e6:.1f} MB "
+          f"({ratio:.1f}x) in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
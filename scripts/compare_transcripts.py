@@ -3,17 +3,22 @@
 Compare original vs highly professional transcripts
 Shows the improvements made for presentations
 """
-import json
+import sys
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, Optional
 
-def load_speaker_transcript(speaker_name: str) -> List[Dict]:
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.text.cleanup import default_engine
+from utils.text.transcript_index import TranscriptIndex
+from utils.text.vtt import parse_timestamp
+
+def load_speaker_transcript(speaker_name: str) -> Optional[TranscriptIndex]:
     """Load highly professional transcript for a speaker"""
     file_path = Path(f'output/speakers/{speaker_name}/transcripts/{speaker_name}_highly_professional.json')
     if file_path.exists():
-        with open(file_path) as f:
-            return json.load(f)
-    return []
+        return TranscriptIndex.open(file_path)
+    return None
 
 def print_comparison(segment: Dict, show_all: bool = False):
     """Print before/after comparison for a segment"""
@@ -41,8 +46,10 @@ def print_comparison(segment: Dict, show_all: bool = False):
     print(f"   Length change: {original_len} → {new_len} chars ({new_len - original_len:+d})")
     
     # Check for removed fillers
-    fillers = ['obviously', 'essentially', 'basically', 'so...', 'like,', 'boom', 'crazy']
-    removed_fillers = [f for f in fillers if f in segment['original'].lower() and f not in segment['highly_professional'].lower()]
+    engine = default_engine()
+    after_rules = engine.detect(segment['highly_professional'])
+    removed_fillers = [p for p in engine.detect(segment['original'])
+                       if p not in after_rules and engine.rules[p].category == 'fillers']
     if removed_fillers:
         print(f"   Removed fillers: {', '.join(removed_fillers)}")
 
@@ -56,6 +63,8 @@ def main():
     parser.add_argument('--segment-id', type=int, help='Show specific segment ID')
     parser.add_argument('--all-versions', action='store_true', help='Show all versions (original, corrected, professional, highly_professional)')
     parser.add_argument('--limit', type=int, default=5, help='Number of segments to show')
+    parser.add_argument('--between', nargs=2, metavar=('START', 'END'),
+                       help='Show segments overlapping a time range (e.g. 00:01:00 00:02:30)')
     
     args = parser.parse_args()
     
@@ -64,24 +73,29 @@ def main():
     speakers = ['izaac', 'aaron', 'ken', 'jules', 'jared'] if args.speaker == 'all' else [args.speaker]
     
     for speaker in speakers:
-        segments = load_speaker_transcript(speaker)
+        index = load_speaker_transcript(speaker)
         
-        if not segments:
+        if not index:
             print(f"⚠️  No transcript found for {speaker}")
             continue
         
         print(f"\n{'#'*80}")
-        print(f"# {speaker.upper()} - {len(segments)} segments")
+        print(f"# {speaker.upper()} - {len(index)} segments")
         print(f"{'#'*80}")
         
         # Filter to specific segment or show first N
         if args.segment_id is not None:
-            segments_to_show = [s for s in segments if s['id'] == args.segment_id]
+            segment = index.get(args.segment_id)
+            segments_to_show = [segment] if segment else []
+        elif args.between:
+            start, end = (parse_timestamp(ts) for ts in args.between)
+            segments_to_show = index.overlapping(start, end)[:args.limit]
         else:
             # Show segments with custom rewrites first
             from create_professional_script import HIGHLY_PROFESSIONAL_REWRITES
-            custom_segments = [s for s in segments if s['id'] in HIGHLY_PROFESSIONAL_REWRITES]
-            auto_segments = [s for s in segments if s['id'] not in HIGHLY_PROFESSIONAL_REWRITES]
+            is_custom = lambda s: s.get('custom_rewrite', s['id'] in HIGHLY_PROFESSIONAL_REWRITES)
+            custom_segments = [s for s in index if is_custom(s)]
+            auto_segments = [s for s in index if not is_custom(s)]
             segments_to_show = custom_segments[:args.limit] if custom_segments else auto_segments[:args.limit]
         
         for segment in segments_to_show:
@@ -91,6 +105,7 @@ def main():
     print("✅ Comparison complete!")
     print("\n💡 Tips:")
     print("   • Use --segment-id N to see a specific segment")
+    print("   • Use --between START END to see segments in a time range")
     print("   • Use --all-versions to see all transformation stages")
     print("   • Use --speaker all to see all speakers")
     print("   • Use --limit N to control how many segments to show")
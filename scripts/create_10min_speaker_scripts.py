@@ -4,9 +4,15 @@ Create individual speaker scripts from the 10-minute professional script
 Outputs separate TXT files for each speaker for easy recording/TTS
 """
 import json
+import sys
 from pathlib import Path
 from collections import defaultdict
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.text.duration_model import SpeakingRateModel, check_budgets
+from utils.text.speakers import SPEAKER_LABELS
+
 def create_speaker_scripts():
     """Generate individual scripts for each speaker"""
     
@@ -77,6 +83,16 @@ def create_speaker_scripts():
     
     print(f"✅ Timeline → {timeline_file}")
     
+    # Pre-flight duration check against each section's slot
+    model = SpeakingRateModel.from_source_dir()
+    if model:
+        checks = check_budgets(model, segments, SPEAKER_LABELS)
+        print(f"\n⏱️  Predicted vs budgeted seconds:")
+        for check in checks:
+            flag = f"⚠️  {check.ratio - 1:+.0%} over" if check.over else "✅"
+            print(f"   {check.speaker:6} {check.section[:36]:36} {check.predicted:5.1f}s / {check.budget:.0f}s  {flag}")
+        print(f"   Total: {sum(c.predicted for c in checks):.0f}s predicted / {sum(c.budget for c in checks):.0f}s budgeted")
+    
     # Summary
     print(f"\n{'='*80}")
     print(f"📊 Summary:")
@@ -9,8 +9,13 @@ Based on professional speaking principles:
 5. Remove Fillers - no "obviously," "so," "essentially," "like"
 """
 import json
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.text.rewrite_memory import DEFAULT_MEMORY, TABLE_RECORDING, RewriteMemory
+
 # Highly professional rewrites - hand-crafted improvements
 REWRITES = {
     # IZAAC / Zoom user segments
@@ -211,17 +216,32 @@ def create_highly_professional_transcript():
     
     print(f"📖 Loaded {len(segments)} segments from {input_file}")
     
+    # Rewrites are matched by original text, so they survive re-transcription
+    memory = None
+    if Path(DEFAULT_MEMORY).exists():
+        memory = RewriteMemory.load(DEFAULT_MEMORY)
+        missing = memory.overlay('REWRITES', REWRITES, TABLE_RECORDING)
+        if missing:
+            print(f"⚠️  Rewrites not in {DEFAULT_MEMORY}: {missing} (run: python scripts/build_rewrite_memory.py)")
+    
     # Add highly_professional field to each segment
     rewritten_count = 0
+    suggestions = []
     for segment in segments:
         seg_id = segment['id']
         
-        if seg_id in REWRITES:
+        match = memory.match(segment['original'], 'REWRITES') if memory else None
+        if match and match.apply:
+            segment['highly_professional'] = match.entry.rewrite
+            rewritten_count += 1
+        elif memory is None and seg_id in REWRITES:
             segment['highly_professional'] = REWRITES[seg_id]
             rewritten_count += 1
         else:
             # For segments without custom rewrite, use corrected version
             segment['highly_professional'] = segment.get('corrected', segment['original'])
+            if match:
+                suggestions.append((seg_id, match))
     
     # Save to new file
     output_file = Path('output/original/professional_transcript.json')
@@ -232,6 +252,8 @@ def create_highly_professional_transcript():
     print(f"   📊 Total segments: {len(segments)}")
     print(f"   🎨 Custom rewrites: {rewritten_count}")
     print(f"   🤖 Using corrected: {len(segments) - rewritten_count}")
+    for seg_id, match in suggestions:
+        print(f"   💡 ID {seg_id} resembles {match.entry.source} ({match.similarity:.0%}); review its rewrite")
     
     # Show some examples
     print("\n📝 Example Improvements:\n")
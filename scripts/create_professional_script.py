@@ -9,8 +9,17 @@ This implements improvements based on professional speaking best practices:
 5. Remove Conversational Fillers: Eliminate "obviously," "so," "like," "boom"
 """
 import json
+import sys
+from collections import Counter
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.text.cleanup import default_engine
+from utils.text.rewrite_memory import DEFAULT_MEMORY, TABLE_RECORDING, RewriteMemory
+from utils.text.speakers import SPEAKER_LABELS
+from utils.text.transcript_index import TranscriptIndex
+
 # Highly professional segment rewrites based on analysis
 HIGHLY_PROFESSIONAL_REWRITES = {
     # Opening and Introduction (Izaac)
@@ -50,51 +59,7 @@ HIGHLY_PROFESSIONAL_REWRITES = {
 
 def remove_filler_words(text):
     """Remove conversational fillers and hesitant language"""
-    replacements = {
-        # Conversational fillers
-        'obviously': '',
-        'essentially': '',
-        'basically': '',
-        'so...': '',
-        'like,': ',',
-        'boom': '',
-        'crazy': 'interesting',
-        
-        # Hesitant language
-        'kind of': '',
-        'sort of': '',
-        'I think': '',
-        'I guess': '',
-        'maybe': '',
-        
-        # Contractions (make formal)
-        "gonna": "going to",
-        "wanna": "want to",
-        "kinda": "kind of",
-        "don't": "do not",
-        "won't": "will not",
-        "can't": "cannot",
-        "I'll": "I will",
-        "we'll": "we will",
-        "you'll": "you will",
-        "we're": "we are",
-        "you're": "you are",
-        "it's": "it is",
-        
-        # Fix product names
-        "EtherMail": "Aether Mail",
-        "Pope Protocol": "POP3",
-    }
-    
-    result = text
-    for old, new in replacements.items():
-        result = result.replace(old, new)
-    
-    # Clean up extra spaces
-    while '  ' in result:
-        result = result.replace('  ', ' ')
-    
-    return result.strip()
+    return default_engine().clean(text)
 
 def make_professional_sentence(text):
     """Convert choppy/casual text into professional flowing sentences"""
@@ -110,11 +75,21 @@ def make_professional_sentence(text):
     
     return text
 
-def rewrite_professional(segments, speaker_name):
+def load_rewrite_memory():
+    """Rewrite memory with this script's live table, or None to fall back to segment ids"""
+    if not Path(DEFAULT_MEMORY).exists():
+        return None
+    memory = RewriteMemory.load(DEFAULT_MEMORY)
+    missing = memory.overlay('HIGHLY_PROFESSIONAL_REWRITES', HIGHLY_PROFESSIONAL_REWRITES, TABLE_RECORDING)
+    if missing:
+        print(f"⚠️  Rewrites not in {DEFAULT_MEMORY}: {missing} (run: python scripts/build_rewrite_memory.py)")
+    return memory
+
+def rewrite_professional(index, speaker_name, memory=None):
     """Rewrite segments into highly professional, fluid script"""
     
     # Group by speaker and context
-    speaker_segments = [s for s in segments if speaker_name.lower() in s['speaker'].lower()]
+    speaker_segments = index.by_speaker(speaker_name)
     
     professional_segments = []
     
@@ -124,16 +99,21 @@ def rewrite_professional(segments, speaker_name):
         seg_id = seg['id']
         
         # Check if we have a custom highly professional rewrite
-        if seg_id in HIGHLY_PROFESSIONAL_REWRITES:
+        cleanup_rules = {}
+        match = memory.match(original, 'HIGHLY_PROFESSIONAL_REWRITES') if memory else None
+        custom_rewrite = bool(match and match.apply) or (memory is None and seg_id in HIGHLY_PROFESSIONAL_REWRITES)
+        if match and match.apply:
+            highly_professional = match.entry.rewrite
+        elif custom_rewrite:
             highly_professional = HIGHLY_PROFESSIONAL_REWRITES[seg_id]
         else:
             # Generate professional version
             # Start with corrected version if available
-            highly_professional = corrected
+            cleaned = default_engine().apply(corrected)
+            cleanup_rules = cleaned.fired
             
             # Apply transformations
-            highly_professional = remove_filler_words(highly_professional)
-            highly_professional = make_professional_sentence(highly_professional)
+            highly_professional = make_professional_sentence(cleaned.text)
         
         professional_segments.append({
             'id': seg['id'],
@@ -144,6 +124,8 @@ def rewrite_professional(segments, speaker_name):
             'corrected': corrected,
             'professional': seg.get('professional', corrected),  # Keep old professional if exists
             'highly_professional': highly_professional,
+            'cleanup_rules': cleanup_rules,
+            'custom_rewrite': custom_rewrite,
             'duration': seg['end']
         })
     
@@ -161,32 +143,26 @@ def main():
     print("   ✅ No Fillers: Removed 'obviously', 'so', 'essentially', etc.\n")
     
     # Load original transcript
-    with open('output/original/corrected_transcript.json') as f:
-        segments = json.load(f)
-    
-    # Map speakers
-    speaker_map = {
-        'izaac': 'Zoom user',
-        'aaron': 'Devon Villalona',
-        'ken': 'Kenith Philip',
-        'jules': 'Jhuiwensley Belizaire',
-        'jared': 'Jared Zayas'
-    }
+    index = TranscriptIndex.open('output/original/corrected_transcript.json')
+    memory = load_rewrite_memory()
     
     total_custom_rewrites = 0
     total_segments = 0
+    rules_fired = Counter()
     
     # Create professional scripts for each
-    for name, speaker_id in speaker_map.items():
+    for name, speaker_id in SPEAKER_LABELS.items():
         print(f"✍️  Writing highly professional script for {name.upper()}...")
         
-        prof_segments = rewrite_professional(segments, speaker_id)
+        prof_segments = rewrite_professional(index, speaker_id, memory)
         
         if prof_segments:
             # Count custom rewrites
-            custom_rewrites = sum(1 for seg in prof_segments if seg['id'] in HIGHLY_PROFESSIONAL_REWRITES)
+            custom_rewrites = sum(1 for seg in prof_segments if seg['custom_rewrite'])
             total_custom_rewrites += custom_rewrites
             total_segments += len(prof_segments)
+            for seg in prof_segments:
+                rules_fired.update(seg['cleanup_rules'])
             
             # Save to speaker's folder
             output_file = Path(f'output/speakers/{name}/transcripts/{name}_highly_professional.json')
@@ -200,7 +176,7 @@ def main():
             # Show comparison example
             if prof_segments:
                 # Find a segment with custom rewrite
-                custom_seg = next((s for s in prof_segments if s['id'] in HIGHLY_PROFESSIONAL_REWRITES), None)
+                custom_seg = next((s for s in prof_segments if s['custom_rewrite']), None)
                 if custom_seg:
                     print(f"\n   📝 Example Improvement (ID {custom_seg['id']}):")
                     print(f"   ❌ Original: {custom_seg['original'][:80]}...")
@@ -213,6 +189,8 @@ def main():
     print(f"   📊 Total segments processed: {total_segments}")
     print(f"   🎨 Custom rewrites: {total_custom_rewrites}")
     print(f"   🤖 Auto-cleaned: {total_segments - total_custom_rewrites}")
+    if rules_fired:
+        print(f"   🧹 Cleanup rules fired: {', '.join(f'{phrase!r}×{n}' for phrase, n in rules_fired.most_common())}")
     print()
     print("💡 Key improvements made:")
     print("   • Removed conversational fillers (so, obviously, essentially)")
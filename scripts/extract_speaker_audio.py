@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Extract every speaker's cue clips from the source recordings
+Writes output/speakers/<speaker>/audio/<recording>_<cue>.flac for each VTT
+cue, plus the longest clean cues as voice_samples/<speaker>_NNN.flac, in one
+sequential decode per recording; recordings are processed in parallel. Clip
+headers are indexed in output/speakers/audio.index.json
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.audio.decode import DEFAULT_SAMPLE_RATE
+from utils.audio.extractor import ClipSpec, extract_all
+from utils.audio.pcm_cache import DEFAULT_PCM_DIR, PcmCache
+from utils.audio.store import AudioStore
+from utils.text.cue_store import DEFAULT_STORE_DIR, load_or_build
+from utils.text.ingest import bounded_workers, discover_recordings
+from utils.text.speakers import speaker_id
+
+# Voice samples: cues in this length range, longest first
+SAMPLE_MIN_MS = 5000
+SAMPLE_MAX_MS = 15000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cut per-speaker cue clips from every recording in one pass each')
+    parser.add_argument('--source-dir', default='data/source', help='Zoom recordings and their transcripts')
+    parser.add_argument('--output-dir', default='output/speakers', help='Per-speaker output root')
+    parser.add_argument('--speakers', nargs='*', help='Only these speaker ids (default: all)')
+    parser.add_argument('--voice-samples', type=int, default=3, help='Voice samples per speaker (0 to skip)')
+    parser.add_argument('--pad-ms', type=int, default=0, help='Extra audio before and after each cue')
+    parser.add_argument('--trim', action='store_true', help='Trim leading/trailing silence from each clip (VAD)')
+    parser.add_argument('--sample-rate', type=int, default=DEFAULT_SAMPLE_RATE, help='Clip sample rate')
+    parser.add_argument('--pcm-dir', default=DEFAULT_PCM_DIR, help='Decoded-audio cache, used when already fresh')
+    parser.add_argument('--store-dir', default=DEFAULT_STORE_DIR, help='Cue store cache')
+    parser.add_argument('--workers', type=int, default=0, help='Recordings processed in parallel (default: CPUs)')
+    args = parser.parse_args()
+
+    recordings = [r for r in discover_recordings(Path(args.source_dir)) if r.media]
+    if not recordings:
+        print(f"❌ No recordings with media found in {args.source_dir}")
+        return 1
+
+    output_dir = Path(args.output_dir)
+    jobs = {}
+    candidates = {}
+    for recording in recordings:
+        clips = []
+        for cue in load_or_build(recording.transcript, args.store_dir):
+            speaker = speaker_id(cue.speaker) if cue.speaker else 'unknown'
+            if args.speakers and speaker not in args.speakers:
+                continue
+            clips.append(ClipSpec(output_dir / speaker / 'audio' / f'{recording.id}_{cue.id:05d}.flac',
+                                  cue.start_ms, cue.end_ms))
+            if SAMPLE_MIN_MS <= cue.duration_ms <= SAMPLE_MAX_MS:
+                candidates.setdefault(speaker, []).append((cue.duration_ms, recording.media, cue))
+        jobs[recording.media] = clips
+
+    # Voice samples ride along in the same pass as extra clips
+    for speaker, found in candidates.items():
+        found.sort(key=lambda c: c[0], reverse=True)
+        for n, (_, media, cue) in enumerate(found[:args.voice_samples]):
+            jobs[media].append(ClipSpec(output_dir / speaker / 'voice_samples' / f'{speaker}_{n:03d}.flac',
+                                        cue.start_ms, cue.end_ms))
+
+    # Each worker sweeps one recording's decoded PCM; budget the largest (estimated) decode
+    pcm = PcmCache(args.pcm_dir, args.sample_rate)
+    workers = bounded_workers(args.workers, len(jobs), max((pcm.estimated_bytes(media) for media in jobs), default=0))
+    print("✂️  Extracting speaker audio\n")
+    print(f"   📂 {len(jobs)} recordings, {sum(len(c) for c in jobs.values())} clips, {workers} workers\n")
+
+    started = time.perf_counter()
+
+    def report(result):
+        if result.error:
+            print(f"   ❌ {result.source.name}: {result.error}")
+            return
+        speed = result.decoded_seconds / result.elapsed if result.elapsed else 0.0
+        print(f"   ✅ {result.source.name}: {result.clips} clips ({result.clip_seconds / 60:.1f} min) from "
+              f"{result.decoded_seconds / 60:.1f} min decoded in {result.elapsed:.1f}s ({speed:.0f}x realtime)")
+
+    results = extract_all(jobs, workers, on_result=report, sample_rate=args.sample_rate, pad_ms=args.pad_ms,
+                          trim=args.trim, pcm=pcm)
+    failed = [r for r in results if r.error]
+    store = AudioStore(output_dir)
+    entries = store.scan()
+    store.save()
+    stored = sum(entry.size for entry in entries)
+    print(f"\n✅ {sum(r.clips for r in results)} clips in {time.perf_counter() - started:.1f}s → {output_dir}/*/audio/ "
+          f"({stored / 1e6:.0f} MB stored, {sum(e.duration_s for e in entries) / 3600:.1f} h indexed)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
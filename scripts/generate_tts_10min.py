@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 """
 Generate TTS audio for the 10-minute professional script using Fish Speech
-Uses Fish Speech inference engine directly
+Writes per-segment text files and the manifest consumed by generate_tts_audio.py
 """
 import json
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.text.chunking import chunk_script
+from utils.text.duration_model import SpeakingRateModel, check_budgets
+from utils.text.speakers import SPEAKER_LABELS
+
 def generate_all_tts_simple():
     """Generate TTS using a simpler approach - create text files for manual processing"""
     
@@ -54,7 +60,7 @@ def generate_all_tts_simple():
     for i, seg in enumerate(segments, 1):
         section_safe = seg['section'].replace(' ', '_').replace(':', '')
         text_file = f"{i:02d}_{seg['speaker']}_{section_safe}.txt"
-        audio_file = f"{i:02d}_{seg['speaker']}_{section_safe}.wav"
+        audio_file = f"{i:02d}_{seg['speaker']}_{section_safe}.flac"
         reference_id = speaker_ref_map.get(seg['speaker'], 'izaac')
         
         manifest.append({
@@ -67,54 +73,48 @@ def generate_all_tts_simple():
             'text_file': text_file,
             'audio_file': audio_file,
             'script': seg['script'],
-            'reference_id': reference_id
+            'reference_id': reference_id,
+            'chunks': [c.to_dict() for c in chunk_script(seg['script'])]
         })
     
+    # Predict each section's spoken length from the speakers' VTT speaking rates
+    model = SpeakingRateModel.from_source_dir()
+    checks = []
+    if model:
+        checks = check_budgets(model, manifest, SPEAKER_LABELS)
+        for item, check in zip(manifest, checks):
+            item['predicted_seconds'] = round(check.predicted, 1)
+    
     with open(manifest_file, 'w') as f:
         json.dump(manifest, f, indent=2, ensure_ascii=False)
     
+    if checks:
+        print(f"\n⏱️  Predicted vs budgeted seconds:")
+        for item, check in zip(manifest, checks):
+            flag = f"⚠️  {check.ratio - 1:+.0%} over" if check.over else "✅"
+            print(f"   [{item['segment']:02d}] {check.speaker:6} {check.section[:36]:36} "
+                  f"{check.predicted:5.1f}s / {check.budget:.0f}s  {flag}")
+        overruns = [c for c in checks if c.over]
+        if overruns:
+            print(f"   ✂️  {len(overruns)} section(s) will overrun their slot - shorten the text before synthesizing")
+    
     print(f"\n{'='*80}")
     print(f"✅ TTS Preparation Complete!")
     print(f"   📝 Text files: {len(segments)}")
+    print(f"   ✂️  Chunks: {sum(len(item['chunks']) for item in manifest)}")
     print(f"   📄 Manifest: {manifest_file}")
     print(f"\n💡 Next Steps:")
     print(f"   1. Setup references: python scripts/setup_fish_references.py")
     print(f"   2. Use the text files in {output_dir}/")
-    print(f"   3. Generate audio using Fish Speech API or GitHub Actions")
-    
-    # Create a bash script for batch generation using Fish Speech API
-    bash_script = output_dir / 'generate_with_fish_speech.sh'
-    with open(bash_script, 'w') as f:
-        f.write("#!/bin/bash\n")
-        f.write("# Batch TTS generation using Fish Speech API\n")
-        f.write("# Prerequisites:\n")
-        f.write("#   1. Setup references: python scripts/setup_fish_references.py\n")
-        f.write("#   2. Start API server: cd fish-speech && python tools/api_server.py --device cpu\n\n")
-        f.write("set -e\n\n")
-        
-        for item in manifest:
-            reference_id = item['reference_id']
-            text_file = item['text_file']
-            audio_file = item['audio_file']
-            
-            f.write(f"# Segment {item['segment']}: {item['section']}\n")
-            f.write(f"echo 'Generating {audio_file}...'\n")
-            f.write(f"python ../../../fish-speech/tools/api_client.py \\\n")
-            f.write(f"  --text \"$(cat {text_file})\" \\\n")
-            f.write(f"  --reference_id {reference_id} \\\n")
-            f.write(f"  --output {audio_file.replace('.wav', '')} \\\n")
-            f.write(f"  --format wav \\\n")
-            f.write(f"  --no-play\n\n")
+    print(f"   3. Generate audio: python scripts/generate_tts_audio.py")
     
-    bash_script.chmod(0o755)
-    print(f"   📜 Bash script: {bash_script}")
     print(f"\n📌 To generate all audio:")
     print(f"   1. Setup Fish Speech references:")
     print(f"      python scripts/setup_fish_references.py")
     print(f"   2. Start Fish Speech API server:")
     print(f"      cd fish-speech && python tools/api_server.py --device cpu")
-    print(f"   3. Run the generation script:")
-    print(f"      {bash_script}")
+    print(f"   3. Run the generation driver:")
+    print(f"      python scripts/generate_tts_audio.py --manifest {manifest_file} --concurrency 2")
     
     return 0
 
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Generate TTS audio for every entry in a TTS manifest
+Each segment's sentence chunks are synthesized as independent jobs through one
+pooled Fish Speech API session, then stitched back into the segment WAV
+"""
+import argparse
+import json
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.audio.stitch import stitch_wavs
+from utils.hashing import file_digest
+from utils.text.duration_model import SpeakingRateModel
+from utils.text.speakers import SPEAKER_LABELS
+from utils.voice_clone.fish_client import DEFAULT_API_URL, FishSpeechClient, TTSJob, TTSParams
+from utils.voice_clone.job_queue import DONE, RUNNING, JobQueue
+from utils.voice_clone.metrics import MetricsRecorder, audio_seconds, format_seconds
+from utils.voice_clone.scheduler import WorkItem, estimate_cost, schedule, shard_segments
+from utils.voice_clone.tts_cache import (
+    DEFAULT_CACHE_DIR, DEFAULT_REFERENCES_DIR, TTSCache, cache_key, format_bytes, reference_fingerprint,
+)
+
+
+def parse_segments(spec: str, total: int):
+    """Parse a segment spec like 'all', '3', '1-3' or '1-3,7' into segment numbers"""
+    if spec == 'all':
+        return list(range(1, total + 1))
+    selected = []
+    for part in spec.split(','):
+        part = part.strip()
+        if '-' in part:
+            lo, hi = part.split('-', 1)
+            selected.extend(range(int(lo), int(hi) + 1))
+        elif part:
+            selected.append(int(part))
+    return sorted(set(n for n in selected if 1 <= n <= total))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate TTS audio from a manifest via the Fish Speech API')
+    parser.add_argument('--manifest', default='output/tts/10min/manifest.json', help='Manifest written by generate_tts_10min.py')
+    parser.add_argument('--api-url', action='append', help='Fish Speech API server URL (repeat for several workers)')
+    parser.add_argument('--concurrency', type=int, default=2, help='Maximum requests in flight per server')
+    parser.add_argument('--segments', default='all', help="Segments to generate (all, 1-3, 4-6, 1,5)")
+    parser.add_argument('--shard', default='1/1', help='Generate only shard I of N balanced shards (e.g. 2/4)')
+    parser.add_argument('--timeout', type=float, default=3600.0, help='Per-request timeout in seconds')
+    parser.add_argument('--seed', type=int, help='Fixed sampling seed')
+    parser.add_argument('--references-dir', default=DEFAULT_REFERENCES_DIR, help='Fish Speech reference voices')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='Rendered audio cache (survives make clean)')
+    parser.add_argument('--cache-max-gb', type=float, default=2.0, help='Cache size limit before LRU eviction')
+    parser.add_argument('--no-cache', action='store_true', help='Always re-synthesize')
+    parser.add_argument('--retries', type=int, default=2, help='Retries per failed chunk')
+    parser.add_argument('--crossfade-ms', type=int, default=15, help='Fade length at each chunk joint')
+    parser.add_argument('--queue-db', help='Job state database (default: jobs.db next to the manifest)')
+    parser.add_argument('--time-budget', type=float, help='Stop starting new chunks after this many minutes')
+    parser.add_argument('--stale-after', type=float, default=3600.0,
+                        help="Reclaim jobs left 'running' by a crashed run after this many seconds")
+    parser.add_argument('--metrics', help='Metrics file (default: metrics.jsonl next to the manifest)')
+    parser.add_argument('--label', default='', help='Free-form run label stored with metrics (e.g. cpu-8threads)')
+    args = parser.parse_args()
+    # CI cancellation and step timeouts send SIGTERM: unwind like Ctrl-C so held jobs are released
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+
+    manifest_file = Path(args.manifest)
+    if not manifest_file.exists():
+        print(f"❌ Manifest not found: {manifest_file}")
+        print("   Run: python scripts/generate_tts_10min.py")
+        return 1
+
+    with open(manifest_file) as f:
+        manifest = json.load(f)
+
+    output_dir = manifest_file.parent
+    api_urls = args.api_url or [DEFAULT_API_URL]
+    wanted = set(parse_segments(args.segments, len(manifest)))
+    items = [item for item in manifest if item['segment'] in wanted]
+
+    shard, n_shards = (int(n) for n in args.shard.split('/'))
+    if not 1 <= shard <= n_shards:
+        print(f"❌ Invalid shard: {args.shard}")
+        return 1
+    if n_shards > 1:
+        shard_numbers = set(shard_segments(items, n_shards)[shard - 1])
+        items = [item for item in items if item['segment'] in shard_numbers]
+
+    print("🎙️ Fish Speech TTS Generation\n")
+    print(f"   📄 Manifest: {manifest_file}")
+    print(f"   🌐 API: {', '.join(api_urls)}")
+    print(f"   🧵 Concurrency: {args.concurrency} per server")
+    print(f"   🎬 Segments: {len(items)}/{len(manifest)}"
+          + (f" (shard {shard}/{n_shards}: {', '.join(str(i['segment']) for i in items)})" if n_shards > 1 else '') + "\n")
+
+    params = TTSParams(seed=args.seed)
+    chunks_dir = output_dir / 'chunks'
+    cache = None if args.no_cache else TTSCache(args.cache_dir, int(args.cache_max_gb * 1024 ** 3))
+
+    # One job per distinct (text, voice, params): a sentence repeated across
+    # segments is rendered once and shared
+    fingerprints = {}
+    jobs = {}
+    labels = {}
+    segment_keys = {}
+    for item in items:
+        chunks = item.get('chunks') or [{'text': item['script'], 'pause_ms': 0}]
+        ref = item['reference_id']
+        if ref not in fingerprints:
+            fingerprints[ref] = reference_fingerprint(ref, args.references_dir)
+        keys = []
+        for n, chunk in enumerate(chunks, 1):
+            key = cache_key(chunk['text'], ref, fingerprints[ref], params.to_dict())
+            keys.append(key)
+            if key not in jobs:
+                jobs[key] = TTSJob(key, chunk['text'], ref, chunks_dir / f'{key[:16]}.wav', params)
+                labels[key] = f"{item['audio_file']} chunk {n}/{len(chunks)}"
+        segment_keys[item['segment']] = keys
+
+    print(f"   ✂️  Chunks: {sum(len(k) for k in segment_keys.values())} ({len(jobs)} unique)\n")
+
+    queue = JobQueue(Path(args.queue_db) if args.queue_db else output_dir / 'jobs.db')
+    queue.add((key, labels[key]) for key in jobs)
+    reclaimed = queue.reclaim_stale(args.stale_after)
+    if reclaimed:
+        print(f"♻️  Reclaimed {reclaimed} stale running jobs")
+
+    ready = set()
+    pending = []
+    resumed = cached = elsewhere = 0
+    for key, job in jobs.items():
+        record = queue.get(key)
+        if record['state'] == DONE:
+            if job.output_path.exists() and file_digest(job.output_path) == record['output_hash']:
+                ready.add(key)
+                resumed += 1
+                continue
+            queue.reset(key)
+        elif record['state'] == RUNNING:
+            # Claimed by another live run; leave it alone
+            elsewhere += 1
+            continue
+        if cache and cache.get(key, job.output_path):
+            queue.mark_done(key, job.output_path, file_digest(job.output_path), 0.0)
+            ready.add(key)
+            cached += 1
+        else:
+            pending.append(job)
+    if resumed:
+        print(f"⏩ {resumed} chunks already done in a previous run")
+    if cached:
+        print(f"⚡ {cached} chunks served from cache")
+    if elsewhere:
+        print(f"⏳ {elsewhere} chunks running in another process")
+
+    results = []
+    if pending:
+        clients = [FishSpeechClient(url, concurrency=args.concurrency, timeout=args.timeout, retries=args.retries)
+                   for url in api_urls]
+        down = [client.base_url for client in clients if not client.health()]
+        if down:
+            print(f"❌ Fish Speech API not reachable at {', '.join(down)}")
+            print("   Start it with: cd fish-speech && python tools/api_server.py --device cpu")
+            for client in clients:
+                client.close()
+            queue.close()
+            return 1
+
+        # Each server is a worker: longest jobs first, keeping voices where they're warm
+        by_key = {job.key: job for job in pending}
+        model = SpeakingRateModel.from_source_dir()
+        plan = schedule([WorkItem(job.key, job.reference_id,
+                                  estimate_cost(job.text, model=model, speaker=SPEAKER_LABELS.get(job.reference_id)))
+                         for job in pending], len(clients))
+        if len(clients) > 1:
+            for client, worker_queue, load, voices in zip(clients, plan.queues, plan.loads, plan.warm):
+                print(f"🗂️  {client.base_url}: {len(worker_queue)} chunks, ~{load:.0f} cost, voices {', '.join(sorted(voices))}")
+            print()
+
+        metrics = MetricsRecorder(
+            Path(args.metrics) if args.metrics else output_dir / 'metrics.jsonl',
+            total_chars=sum(len(job.text) for job in pending),
+            settings={'label': args.label, 'api_urls': api_urls, 'concurrency': args.concurrency,
+                      'retries': args.retries, 'params': params.to_dict()},
+        )
+        lock = threading.Lock()
+        done = 0
+        worker_id = f'{socket.gethostname()}:{os.getpid()}'
+        deadline = time.monotonic() + args.time_budget * 60 if args.time_budget else None
+
+        # Set when the run is interrupted: no new claims, held ones are handed back
+        stopping = threading.Event()
+
+        def start(job):
+            out_of_time = stopping.is_set() or (deadline and time.monotonic() > deadline)
+            if not out_of_time and queue.claim(job.key, worker_id):
+                return True
+            # Skipped this run: its characters no longer count toward the ETA
+            metrics.drop(len(job.text))
+            return False
+
+        def report(result):
+            nonlocal done
+            job = result.job
+            detail = f"{result.wall_time:.1f}s"
+            if result.ok:
+                queue.mark_done(job.key, job.output_path, file_digest(job.output_path), result.wall_time)
+                record = metrics.record(job.key, labels[job.key], job.reference_id, len(job.text),
+                                        result.wall_time, result.queue_wait,
+                                        audio_seconds(job.output_path), result.server_time)
+                rtf = f", RTF {record['rtf']:.2f}" if record['rtf'] is not None else ''
+                detail += f" → {record['audio_seconds']:.1f}s audio{rtf}"
+            else:
+                queue.mark_failed(job.key, result.error, result.wall_time)
+                metrics.drop(len(job.text))
+            if result.attempts > 1:
+                detail += f", {result.attempts} attempts"
+            with lock:
+                done += 1
+                status = '✅' if result.ok else '❌'
+                print(f"[{done:02d}/{len(pending)}] {status} {labels[job.key]} ({detail}) · ETA {format_seconds(metrics.eta())}")
+                if result.error:
+                    print(f"    {result.error}")
+                    return
+                ready.add(result.job.key)
+            if cache:
+                cache.put(result.job.key, result.job.output_path)
+
+        def run_worker(client, worker_queue):
+            worker_jobs = [by_key[item.key] for item in worker_queue]
+            # Run one job per voice first so the server encodes each reference
+            # exactly once; everything after that hits its prompt memory cache
+            first = {}
+            for job in worker_jobs:
+                first.setdefault(job.reference_id, job)
+            warm = list(first.values())
+            rest = [job for job in worker_jobs if first[job.reference_id] is not job]
+            return (client.run(warm, on_result=report, on_start=start)
+                    + client.run(rest, on_result=report, on_start=start))
+
+        released = 0
+        try:
+            with ThreadPoolExecutor(max_workers=len(clients)) as pool:
+                try:
+                    for worker_results in pool.map(run_worker, clients, plan.queues):
+                        results += worker_results
+                except BaseException:
+                    # Ctrl-C or a CI timeout: release claims now, in case the process is
+                    # killed before in-flight requests finish, so the next run picks them up
+                    stopping.set()
+                    released = queue.release_worker(worker_id)
+                    raise
+        finally:
+            released += queue.release_worker(worker_id)
+            if released:
+                print(f"♻️  Released {released} unfinished chunks for the next run")
+            for client in clients:
+                client.close()
+            # Index what this run stored even when it is interrupted
+            if cache:
+                cache.save()
+
+        summary = metrics.save()
+        print(f"\n📈 Run {summary['run_id']}: {summary['audio_seconds']:.1f}s audio in {format_seconds(summary['elapsed'])}, "
+              f"effective RTF {summary['effective_rtf'] or 0:.2f} (per-request {summary['rtf'] or 0:.2f}), "
+              f"{summary['chars_per_second'] or 0:.1f} chars/s per request")
+        for speaker, stats in summary['speakers'].items():
+            print(f"   {speaker:8} {stats['chunks']:3d} chunks, {stats['audio_seconds']:6.1f}s audio, "
+                  f"RTF {stats['rtf'] or 0:.2f}, {stats['chars_per_second'] or 0:.1f} chars/s")
+        print(f"   📄 Metrics: {metrics.path}")
+
+    if cache:
+        stats = cache.stats()
+        print(f"\n💾 Cache: {stats['hits']} hits, {stats['misses']} misses "
+              f"({stats['hit_rate']:.0%}), {stats['evictions']} evicted, "
+              f"{stats['entries']} entries / {format_bytes(stats['bytes'])}")
+        cache.save()
+
+    # Stitch every segment whose chunks are all available
+    print()
+    incomplete = []
+    for item in items:
+        keys = segment_keys[item['segment']]
+        if not all(key in ready for key in keys):
+            incomplete.append(item['audio_file'])
+            continue
+        chunks = item.get('chunks') or [{'pause_ms': 0}]
+        seconds = stitch_wavs(
+            [jobs[key].output_path for key in keys],
+            [chunk['pause_ms'] for chunk in chunks],
+            output_dir / item['audio_file'],
+            crossfade_ms=args.crossfade_ms,
+        )
+        print(f"🧵 {item['audio_file']} ({len(keys)} chunks, {seconds:.1f}s)")
+
+    counts = queue.counts(jobs)
+    queue.close()
+
+    failed = [r for r in results if not r.ok]
+    print(f"\n{'='*80}")
+    print(f"🗃️  Queue: {counts['done']} done, {counts['pending']} pending, "
+          f"{counts['running']} running, {counts['failed']} failed")
+    print(f"✅ Segments: {len(items) - len(incomplete)}/{len(items)}")
+    print(f"   Chunks synthesized: {len(results) - len(failed)}/{len(results)} (reused: {len(jobs) - len(pending)})")
+    if incomplete:
+        print(f"❌ Incomplete (rerun to resume the remaining chunks): {', '.join(incomplete)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Import Zoom WebVTT transcripts into columnar cue stores
+Streams every data/source/*.transcript.vtt into output/cache/cues/<name>.cues
+(rebuilt only when the VTT changes) and optionally exports the cues as
+transcript JSON in the corrected_transcript.json layout
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.text.cue_store import DEFAULT_STORE_DIR, CueStore, load_or_build, store_path
+from utils.text.vtt import format_timestamp
+
+
+def export_json(store: CueStore, output: Path):
+    """Write cues as transcript records (id, start, end, speaker, original)"""
+    records = [
+        {'id': cue.id, 'start': format_timestamp(cue.start_ms), 'end': format_timestamp(cue.end_ms),
+         'speaker': cue.speaker, 'original': cue.text}
+        for cue in store
+    ]
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(records, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import VTT transcripts into cue stores')
+    parser.add_argument('vtt', nargs='*', help='VTT files (default: data/source/*.transcript.vtt)')
+    parser.add_argument('--store-dir', default=DEFAULT_STORE_DIR, help='Where .cues files are written')
+    parser.add_argument('--json-dir', help='Also export each transcript as JSON into this directory')
+    parser.add_argument('--force', action='store_true', help='Rebuild stores even if the VTT is unchanged')
+    args = parser.parse_args()
+
+    vtt_files = [Path(p) for p in args.vtt] or sorted(Path('data/source').glob('*.transcript.vtt'))
+    if not vtt_files:
+        print("❌ No VTT transcripts found in data/source/")
+        return 1
+
+    print("📥 Importing transcripts\n")
+    for vtt_file in vtt_files:
+        started = time.perf_counter()
+        store = load_or_build(vtt_file, Path(args.store_dir), args.force)
+        elapsed = time.perf_counter() - started
+        hours = int(store.end_ms.max()) / 3_600_000 if len(store) else 0.0
+        print(f"   {vtt_file.name}: {len(store)} cues, {len(store.speakers)} speakers, "
+              f"{hours:.2f}h → {store_path(vtt_file, Path(args.store_dir))} ({elapsed * 1000:.1f} ms)")
+        if args.json_dir:
+            export_json(store, Path(args.json_dir) / f"{store_path(vtt_file, Path(args.store_dir)).stem}.json")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Ingest every recording in a directory into a per-speaker corpus
+One worker process per recording (parse, speaker mapping, cleanup, optional
+per-cue FLAC clips cut from the decode-once PCM cache); the worker count is
+bounded by CPUs and, when cutting clips, by memory
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.audio.decode import DEFAULT_SAMPLE_RATE
+from utils.audio.pcm_cache import DEFAULT_PCM_DIR, PcmCache
+from utils.audio.store import AudioStore
+from utils.text.cue_store import DEFAULT_STORE_DIR
+from utils.text.ingest import bounded_workers, discover_recordings, ingest_all, merge_corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Ingest all recordings in a directory into a per-speaker corpus')
+    parser.add_argument('--source-dir', default='data/source', help='Directory with *.transcript.vtt (+ media)')
+    parser.add_argument('--output-dir', default='output/corpus', help='Where <speaker>.json corpus files go')
+    parser.add_argument('--store-dir', default=DEFAULT_STORE_DIR, help='Cue store cache')
+    parser.add_argument('--workers', type=int, default=0, help='Worker processes (default: CPU count)')
+    parser.add_argument('--audio', action='store_true', help='Also cut each cue from the recording media')
+    parser.add_argument('--pcm-dir', default=DEFAULT_PCM_DIR, help='Decoded-audio cache (decode once, then mmap)')
+    parser.add_argument('--sample-rate', type=int, default=DEFAULT_SAMPLE_RATE, help='Clip sample rate')
+    args = parser.parse_args()
+
+    recordings = discover_recordings(Path(args.source_dir))
+    if not recordings:
+        print(f"❌ No transcripts found in {args.source_dir}")
+        return 1
+
+    output_dir = Path(args.output_dir)
+    audio_dir = str(output_dir / 'audio') if args.audio else None
+    # Each worker maps one recording's decoded PCM and touches all of it, so
+    # budget the largest decode per worker (estimated from the media duration
+    # for recordings not decoded yet)
+    bytes_per_job = 0
+    if audio_dir:
+        pcm = PcmCache(args.pcm_dir, args.sample_rate)
+        bytes_per_job = max((pcm.estimated_bytes(r.media) for r in recordings if r.media), default=0)
+    workers = bounded_workers(args.workers, len(recordings), bytes_per_job)
+
+    print("📥 Ingesting recordings\n")
+    print(f"   📂 Source: {args.source_dir} ({len(recordings)} recordings, "
+          f"{sum(1 for r in recordings if r.media)} with media)")
+    print(f"   🧵 Workers: {workers}\n")
+
+    started = time.perf_counter()
+    done = 0
+
+    def report(result):
+        nonlocal done
+        done += 1
+        rec = result.recording
+        if result.error:
+            print(f"[{done:02d}/{len(recordings)}] ❌ {rec.id}: {result.error}")
+            return
+        clips = f", {result.clips} clips" if args.audio else ''
+        media = '' if rec.media or not args.audio else ' (no media)'
+        print(f"[{done:02d}/{len(recordings)}] ✅ {rec.id}: {len(result.segments)} segments, "
+              f"{len(result.speakers)} speakers, {result.duration_s / 60:.1f} min{clips}{media}")
+
+    results = ingest_all(recordings, workers, args.store_dir, audio_dir, args.sample_rate, args.pcm_dir,
+                         on_result=report)
+    corpus = merge_corpus(r for r in results if not r.error)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for speaker, segments in corpus.items():
+        with open(output_dir / f'{speaker}.json', 'w') as f:
+            json.dump(segments, f, indent=2, ensure_ascii=False)
+    index = {
+        'recordings': {
+            r.recording.id: {'transcript': str(r.recording.transcript),
+                             'media': str(r.recording.media) if r.recording.media else None,
+                             'segments': len(r.segments), 'duration_s': r.duration_s, 'speakers': r.speakers}
+            for r in sorted(results, key=lambda r: r.recording.id) if not r.error
+        },
+        'speakers': {speaker: len(segments) for speaker, segments in corpus.items()},
+    }
+    with open(output_dir / 'index.json', 'w') as f:
+        json.dump(index, f, indent=2, ensure_ascii=False)
+    if audio_dir:
+        # Index clip headers once so later stages get durations without opening them
+        store = AudioStore(audio_dir)
+        store.scan()
+        store.save()
+
+    failed = [r for r in results if r.error]
+    print(f"\n{'='*80}")
+    print(f"✅ {len(results) - len(failed)}/{len(results)} recordings in {time.perf_counter() - started:.1f}s")
+    for speaker, segments in sorted(corpus.items()):
+        print(f"   {speaker:24} {len(segments):5d} segments → {output_dir / (speaker + '.json')}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Run a mock Fish Speech API server
+Drop-in stand-in for fish-speech/tools/api_server.py that returns synthetic
+audio, for trying generate_tts_audio.py without the model download
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.voice_clone.mock_server import LatencyModel, MockFishServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mock Fish Speech API server with synthetic audio')
+    parser.add_argument('--listen', default='127.0.0.1:8080', help='host:port to listen on')
+    parser.add_argument('--overhead', type=float, default=0.05, help='Per-request overhead (s)')
+    parser.add_argument('--per-char', type=float, default=0.002, help='Synthesis cost per character (s)')
+    parser.add_argument('--reference-encode', type=float, default=0.2, help='Cost of a cold reference voice (s)')
+    parser.add_argument('--concurrency', type=int, default=1, help='Requests processed at once')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Relative latency jitter (0.1 = ±10%%)')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='Fraction of requests answered with HTTP 500')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for jitter and injected failures')
+    args = parser.parse_args()
+
+    host, port = args.listen.rsplit(':', 1)
+    latency = LatencyModel(overhead=args.overhead, per_char=args.per_char, reference_encode=args.reference_encode,
+                           concurrency=args.concurrency, jitter=args.jitter, failure_rate=args.failure_rate)
+    server = MockFishServer(host, int(port), latency=latency, seed=args.seed)
+    print(f"🐟 Mock Fish Speech API on {server.url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Render waveform previews of the voice track and the source recordings
+Draws the TIMELINE.md section bars with the real waveform of the assembled
+track (or of each segment WAV when no track exists yet), followed by an
+overview of every source recording. Audio is scanned once into cached peak
+pyramids, so later renders only read those and take milliseconds.
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.audio.pcm_cache import DEFAULT_PCM_DIR, PcmCache
+from utils.audio.peaks import DEFAULT_PEAKS_DIR, PeakCache
+from utils.audio.store import resolve
+from utils.text.ingest import discover_recordings
+from utils.text.vtt import format_timestamp, parse_timestamp
+
+
+def section_lines(manifest, audio_dir: Path, track: Path, peaks: PeakCache, seconds_per_char: float,
+                  force: bool = False):
+    """TIMELINE.md lines, one waveform bar per manifest section"""
+    track_peaks = peaks.open(track, force) if track.exists() else None
+    lines = []
+    for item in manifest:
+        start = parse_timestamp(item['time_start'])
+        end = parse_timestamp(item['time_end'])
+        width = max(1, round((end - start) / 1000 / seconds_per_char))
+        if track_peaks is not None:
+            bar = track_peaks.bar(start, end, width)
+        elif resolve(audio_dir / item['audio_file']).exists():
+            bar = peaks.open(resolve(audio_dir / item['audio_file']), force).bar(0, end - start, width)
+        else:
+            bar = '·' * width
+        lines.append(f"{item['time_start']} {bar} {item['speaker']}: {item['section']}")
+    return lines
+
+
+def recording_lines(source: Path, peaks: PeakCache, row_minutes: float, width: int, force: bool = False):
+    """Overview of one recording, `row_minutes` per line"""
+    pyramid = peaks.open(source, force)
+    row_ms = int(row_minutes * 60000)
+    total_ms = int(pyramid.duration_s * 1000)
+    return [f"{format_timestamp(start)[:8]} {pyramid.bar(start, start + row_ms, width)}"
+            for start in range(0, total_ms, row_ms)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Waveform previews of the voice track and source recordings')
+    parser.add_argument('--manifest', default='output/tts/10min/manifest.json', help='TTS manifest')
+    parser.add_argument('--track', default='output/tts/10min_track.wav', help='Assembled voice track')
+    parser.add_argument('--source-dir', default='data/source', help='Zoom recordings and their transcripts')
+    parser.add_argument('--no-recordings', action='store_true', help='Only draw the track timeline')
+    parser.add_argument('--output', default='output/tts/WAVEFORMS.md', help='Markdown preview file')
+    parser.add_argument('--seconds-per-char', type=float, default=1.0, help='Timeline scale')
+    parser.add_argument('--row-minutes', type=float, default=5.0, help='Recording overview: minutes per line')
+    parser.add_argument('--width', type=int, default=100, help='Recording overview: characters per line')
+    parser.add_argument('--peaks-dir', default=DEFAULT_PEAKS_DIR, help='Peak pyramid cache')
+    parser.add_argument('--pcm-dir', default=DEFAULT_PCM_DIR, help='Decoded-audio cache, used when already fresh')
+    parser.add_argument('--rebuild', action='store_true', help='Rescan audio even when pyramids are fresh')
+    args = parser.parse_args()
+
+    peaks = PeakCache(args.peaks_dir, pcm=PcmCache(args.pcm_dir))
+
+    started = time.perf_counter()
+    out = ["# Waveform Preview\n"]
+    manifest_file = Path(args.manifest)
+    if manifest_file.exists():
+        with open(manifest_file) as f:
+            manifest = json.load(f)
+        track = Path(args.track)
+        source = track if track.exists() else manifest_file.parent
+        out += [f"## Timeline ({source})\n", "```"]
+        out += section_lines(manifest, manifest_file.parent, track, peaks, args.seconds_per_char, args.rebuild)
+        out += ["```\n"]
+        print(f"🌊 Timeline: {len(manifest)} sections from {source}")
+
+    if not args.no_recordings:
+        for recording in discover_recordings(Path(args.source_dir)):
+            if not recording.media:
+                continue
+            out += [f"## {recording.media.name}\n", "```"]
+            out += recording_lines(recording.media, peaks, args.row_minutes, args.width, args.rebuild)
+            out += ["```\n"]
+            print(f"🌊 Recording: {recording.media.name}")
+
+    if len(out) == 1:
+        print(f"❌ Nothing to draw: no manifest at {args.manifest} and no recordings in {args.source_dir}")
+        return 1
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text('\n'.join(out))
+    print(f"\n✅ {output} in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
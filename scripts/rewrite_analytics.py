@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Rewrite quality analytics
+Length, filler/hedge, edit-distance, vocabulary and speaking-time statistics
+for every segment of one or more transcripts, aggregated per speaker.
+Writes per-segment CSV + JSON and can regenerate the Statistics section of
+SUMMARY.md so those numbers never drift from the transcripts.
+"""
+import argparse
+import csv
+import json
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.text.analytics import RewriteAnalytics
+from utils.text.duration_model import SpeakingRateModel
+
+STATS_HEADING = '## Statistics'
+
+
+def load_segments(paths):
+    segments = []
+    for path in paths:
+        with open(path) as f:
+            segments.extend(json.load(f))
+    return segments
+
+
+def print_table(stats, categories):
+    print(f"{'Speaker':10} {'Segs':>5} {'Rewr':>9} {'Chars Δ':>8} {'Words Δ':>8} {'Edits':>6} "
+          + ' '.join(f"{c[:12]:>12}" for c in categories) + f" {'TTR':>11} {'Speech':>14}")
+    for s in stats:
+        rules = ' '.join(f"{f'{s.rules_before[c]}→{s.rules_after[c]}':>12}" for c in categories)
+        print(f"{s.speaker:10} {s.segments:5} {f'{s.rewritten} ({s.rewritten_pct:.0f}%)':>9} "
+              f"{s.chars_after - s.chars_before:+8d} {s.words_after - s.words_before:+8d} {s.edit_distance:6} "
+              f"{rules} {f'{s.ttr_before:.2f}→{s.ttr_after:.2f}':>11} "
+              f"{f'{s.seconds_before:.0f}→{s.seconds_after:.0f}s':>14}")
+
+
+def summary_markdown(stats, total):
+    lines = [f"- **{s.speaker.capitalize()}**: {s.rewritten} rewrites out of {s.segments} segments "
+             f"({s.rewritten_pct:.0f}%), {s.chars_after - s.chars_before:+d} chars, "
+             f"fillers {s.rules_before.get('fillers', 0)} → {s.rules_after.get('fillers', 0)}, "
+             f"hedges {s.rules_before.get('hedges', 0)} → {s.rules_after.get('hedges', 0)}"
+             for s in stats]
+    lines.append('')
+    lines.append(f"Total: {total.rewritten} of {total.segments} segments rewritten, "
+                 f"{total.edit_distance} words edited, predicted speech "
+                 f"{total.seconds_before / 60:.1f} → {total.seconds_after / 60:.1f} min.")
+    lines.append('_Generated by `make rewrite-analytics`._')
+    return '\n'.join(lines)
+
+
+def update_summary(path: Path, body: str) -> bool:
+    """Replace the body of the Statistics section; False if the file has none"""
+    text = path.read_text(encoding='utf-8')
+    start = text.find(STATS_HEADING + '\n')
+    if start < 0:
+        return False
+    start += len(STATS_HEADING) + 1
+    end = text.find('\n## ', start)
+    end = len(text) if end < 0 else end + 1
+    path.write_text(text[:start] + '\n' + body + '\n\n' + text[end:], encoding='utf-8')
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Aggregate before/after statistics of transcript rewrites')
+    parser.add_argument('transcripts', nargs='*', default=['output/original/professional_transcript.json'],
+                        help='Transcript or per-speaker corpus (output/corpus/<speaker>.json) files')
+    parser.add_argument('--before', default='original', help='Segment field before rewriting')
+    parser.add_argument('--after', default='highly_professional', help='Segment field after rewriting')
+    parser.add_argument('--output-dir', default='output/analytics', help='Where the CSV/JSON reports go')
+    parser.add_argument('--summary', help='Markdown file whose Statistics section is regenerated (e.g. SUMMARY.md)')
+    args = parser.parse_args()
+
+    segments = load_segments(args.transcripts)
+    if not segments:
+        print("❌ No segments found")
+        return 1
+    model = SpeakingRateModel.from_source_dir()
+
+    started = time.perf_counter()
+    analytics = RewriteAnalytics(segments, args.before, args.after, model=model)
+    stats = analytics.by_speaker()
+    total = analytics.totals()
+    elapsed = time.perf_counter() - started
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    rows = analytics.rows()
+    with open(output_dir / 'rewrite_segments.csv', 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    with open(output_dir / 'rewrite_analytics.json', 'w') as f:
+        json.dump({'before': args.before, 'after': args.after, 'transcripts': args.transcripts,
+                   'speakers': [asdict(s) for s in stats], 'total': asdict(total), 'segments': rows},
+                  f, indent=2, ensure_ascii=False)
+
+    print(f"📊 Rewrite analytics: {args.before} → {args.after}\n")
+    print_table(stats + [total], analytics.categories)
+    if model is None:
+        print("\n   (no VTT in data/source: speaking time not predicted)")
+    print(f"\n   {len(analytics)} segments in {elapsed * 1000:.0f} ms")
+    print(f"📁 {output_dir / 'rewrite_segments.csv'}, {output_dir / 'rewrite_analytics.json'}")
+
+    if args.summary:
+        if update_summary(Path(args.summary), summary_markdown(stats, total)):
+            print(f"📝 Updated statistics in {args.summary}")
+        else:
+            print(f"⚠️  No '{STATS_HEADING}' section in {args.summary}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
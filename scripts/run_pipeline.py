@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Run the transcript → script → manifest → audio chain incrementally
+Each stage reruns only when its inputs (data files and the code that
+processes them, including the hand-written REWRITES tables) changed since
+its last successful run, or one of its outputs is missing
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.pipeline.runner import DEFAULT_STATE_FILE, FAILED, FRESH, SKIPPED, Pipeline, Stage
+
+ROOT = Path(__file__).parent.parent
+
+CORRECTED = 'output/original/corrected_transcript.json'
+SCRIPT_10MIN = 'output/original/10min_professional_script.json'
+VTT = 'data/source/*.transcript.vtt'
+MANIFEST = 'output/tts/10min/manifest.json'
+REWRITE_MEMORY = 'data/reference/rewrite_memory.json'
+
+
+def python(script: str, *args: str):
+    # The interpreter is left out of stage fingerprints (see Pipeline.command_key)
+    return [sys.executable, f'scripts/{script}', *args]
+
+
+STAGES = [
+    Stage(
+        'professional',
+        python('create_highly_professional_rewrites.py'),
+        inputs=[CORRECTED, REWRITE_MEMORY, 'scripts/create_highly_professional_rewrites.py',
+                'utils/text/rewrite_memory.py'],
+        outputs=['output/original/professional_transcript.json'],
+        description='Full transcript with highly professional rewrites',
+    ),
+    Stage(
+        'speaker-transcripts',
+        python('create_professional_script.py'),
+        inputs=[CORRECTED, REWRITE_MEMORY, 'scripts/create_professional_script.py', 'utils/text/cleanup.py',
+                'utils/text/cleanup_rules.json', 'utils/text/rewrite_memory.py', 'utils/text/speakers.py',
+                'utils/text/transcript_index.py'],
+        outputs=['output/speakers/*/transcripts/*_highly_professional.json'],
+        description='Per-speaker highly professional transcripts',
+    ),
+    Stage(
+        'analytics',
+        python('rewrite_analytics.py'),
+        inputs=['output/original/professional_transcript.json', VTT, 'scripts/rewrite_analytics.py',
+                'utils/text/analytics.py', 'utils/text/cleanup.py', 'utils/text/cleanup_rules.json'],
+        outputs=['output/analytics/rewrite_segments.csv', 'output/analytics/rewrite_analytics.json'],
+        description='Per-segment and per-speaker rewrite statistics',
+    ),
+    Stage(
+        'scripts-10min',
+        python('create_10min_speaker_scripts.py'),
+        inputs=[SCRIPT_10MIN, VTT, 'scripts/create_10min_speaker_scripts.py', 'utils/text/duration_model.py'],
+        outputs=['output/scripts/10min/FULL_SCRIPT.txt', 'output/scripts/10min/TIMELINE.md',
+                 'output/scripts/10min/*_script.txt'],
+        description='10-minute speaker scripts, full script and timeline',
+    ),
+    Stage(
+        'manifest',
+        python('generate_tts_10min.py'),
+        inputs=[SCRIPT_10MIN, VTT, 'scripts/generate_tts_10min.py', 'utils/text/chunking.py',
+                'utils/text/duration_model.py', 'utils/text/speakers.py'],
+        outputs=[MANIFEST, 'output/tts/10min/*.txt'],
+        description='TTS manifest and per-segment text files',
+    ),
+    Stage(
+        'audio',
+        python('generate_tts_audio.py', '--manifest', MANIFEST),
+        inputs=[MANIFEST, 'scripts/generate_tts_audio.py', 'fish-speech/references/**/*'],
+        outputs=['output/tts/10min/*.flac'],
+        description='Segment audio (needs a running Fish Speech API; chunk-level cache and job queue)',
+    ),
+    Stage(
+        'track',
+        python('assemble_track.py', '--manifest', MANIFEST),
+        inputs=[MANIFEST, 'output/tts/10min/*.flac', 'scripts/assemble_track.py', 'utils/audio/assembler.py',
+                'utils/audio/loudness.py'],
+        outputs=['output/tts/10min_track.wav'],
+        description='Final voice track: segments laid out at their manifest times',
+    ),
+]
+
+# Audio needs a TTS server, so it (and the track built from it) only runs when asked for
+DEFAULT_TARGETS = ['professional', 'speaker-transcripts', 'analytics', 'scripts-10min', 'manifest']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Incrementally rebuild pipeline outputs')
+    parser.add_argument('targets', nargs='*', help=f"Stages to bring up to date (default: {' '.join(DEFAULT_TARGETS)})")
+    parser.add_argument('--jobs', type=int, default=4, help='Stages run in parallel')
+    parser.add_argument('--force', action='append', default=[], help='Rerun this stage even if fresh (repeatable)')
+    parser.add_argument('--dry-run', action='store_true', help='Only show which stages are stale')
+    parser.add_argument('--state-file', default=DEFAULT_STATE_FILE, help='Where stage fingerprints are kept')
+    parser.add_argument('--verbose', action='store_true', help='Print stage output')
+    parser.add_argument('--list', action='store_true', help='List stages and their dependencies')
+    args = parser.parse_args()
+
+    pipeline = Pipeline(STAGES, ROOT, ROOT / args.state_file)
+
+    if args.list:
+        for stage in STAGES:
+            deps = ', '.join(sorted(pipeline.deps[stage.name])) or '-'
+            print(f"{stage.name:20} after: {deps:28} {stage.description}")
+        return 0
+
+    targets = args.targets or DEFAULT_TARGETS
+    unknown = [t for t in targets + args.force if t not in pipeline.stages]
+    if unknown:
+        print(f"❌ Unknown stage(s): {', '.join(unknown)}")
+        return 1
+
+    print(f"🔁 Pipeline: {', '.join(targets)}" + (" (dry run)" if args.dry_run else "") + "\n")
+
+    def report(result):
+        if result.status == FRESH:
+            print(f"   ✔️  {result.stage}: up to date")
+        elif result.status == SKIPPED:
+            print(f"   ⏭️  {result.stage}: skipped ({result.reason})")
+        elif result.status == FAILED:
+            print(f"   ❌ {result.stage}: {result.reason} after {result.elapsed:.1f}s")
+            print('      ' + result.output.strip().replace('\n', '\n      '))
+        elif args.dry_run:
+            print(f"   🔸 {result.stage}: stale ({result.reason})")
+        else:
+            print(f"   🔨 {result.stage}: rebuilt in {result.elapsed:.1f}s ({result.reason})")
+            if args.verbose:
+                print('      ' + result.output.strip().replace('\n', '\n      '))
+
+    results = pipeline.run(targets, jobs=args.jobs, force=args.force, dry_run=args.dry_run, on_result=report)
+    rebuilt = sum(1 for r in results if r.status not in (FRESH, FAILED, SKIPPED))
+    failed = [r for r in results if r.status == FAILED]
+    print(f"\n✅ {rebuilt} stage(s) {'stale' if args.dry_run else 'rebuilt'}, "
+          f"{sum(1 for r in results if r.status == FRESH)} up to date"
+          + (f", {len(failed)} failed" if failed else ''))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
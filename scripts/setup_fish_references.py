@@ -1,74 +1,131 @@
 #!/usr/bin/env python3
 """
-Setup Fish Speech reference voices from existing voice samples
-Creates reference directories that can be used with --reference_id
+Setup Fish Speech reference voices from the source recordings
+Picks the best 5-15 s clip of each speaker using the VTT timeline and writes
+it with its real transcript, creating directories usable with --reference_id
 """
-import shutil
+import argparse
+import sys
 from pathlib import Path
 
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.audio.decode import decode_audio
+from utils.audio.pcm_cache import DEFAULT_PCM_DIR, PcmCache
+from utils.audio.store import resolve, write_audio
+from utils.audio.vad import clean
+from utils.text.ingest import discover_recordings
+from utils.text.speakers import SPEAKER_LABELS
+from utils.text.vtt import format_timestamp, parse_vtt
+from utils.voice_clone.codec import FishCodecEncoder
+from utils.voice_clone.reference_selector import ReferenceSelector, candidate_windows
+
+SAMPLE_RATE = 44100
+
+# Fallback voice samples when no source recording is available
+FALLBACK_SAMPLES = {
+    'jules': {
+        'audio': 'output/speakers/jules/voice_samples/jules_000.flac',
+        'text': 'Security and privacy are fundamental to our platform design.'
+    },
+    'aaron': {
+        'audio': 'output/speakers/aaron/voice_samples/aaron_000.flac',
+        'text': 'The password vault provides secure storage for all credentials.'
+    },
+    'jared': {
+        'audio': 'output/speakers/jared/voice_samples/jared_000.flac',
+        'text': 'Our technology enables automated credential management.'
+    },
+}
+
+
+def write_reference(speaker_dir: Path, audio: np.ndarray, text: str, trim: bool = True):
+    """Replace a reference directory's contents with one clip + its .lab"""
+    if trim:
+        # Edge silence and long pauses only add prompt tokens to encode
+        audio = clean(audio, SAMPLE_RATE).audio
+    speaker_dir.mkdir(parents=True, exist_ok=True)
+    # Fish Speech loads every audio file in the directory, so clear old samples
+    for old in speaker_dir.glob('sample.*'):
+        old.unlink()
+    write_audio(speaker_dir / 'sample.flac', audio, SAMPLE_RATE)
+    (speaker_dir / 'sample.lab').write_text(text, encoding='utf-8')
+
+
 def setup_references():
     """Setup reference directories for all speakers"""
-    
-    # Speaker to voice sample mapping
-    speaker_samples = {
-        'izaac': {
-            'audio': 'data/source/GMT20251114-035710_Recording.m4a',
-            'text': 'This is the first screen users see when entering our platform.'
-        },
-        'ken': {
-            'audio': 'data/source/GMT20251114-025308_Recording.m4a',
-            'text': 'As you can see, once logged in, we have a clean interface.'
-        },
-        'jules': {
-            'audio': 'output/speakers/jules/voice_samples/jules_000.wav',
-            'text': 'Security and privacy are fundamental to our platform design.'
-        },
-        'aaron': {
-            'audio': 'output/speakers/aaron/voice_samples/aaron_000.wav',
-            'text': 'The password vault provides secure storage for all credentials.'
-        },
-        'jared': {
-            'audio': 'output/speakers/jared/voice_samples/jared_000.wav',
-            'text': 'Our technology enables automated credential management.'
-        },
-    }
-    
-    refs_dir = Path('fish-speech/references')
+    parser = argparse.ArgumentParser(description='Build Fish Speech reference voices from the source recordings')
+    parser.add_argument('--refs-dir', default='fish-speech/references', help='Fish Speech references directory')
+    parser.add_argument('--source-dir', default='data/source', help='Zoom recordings and their transcripts')
+    parser.add_argument('--pcm-dir', default=DEFAULT_PCM_DIR, help='Decoded-audio cache (decode once, then mmap)')
+    parser.add_argument('--min-seconds', type=float, default=5.0, help='Shortest candidate window')
+    parser.add_argument('--max-seconds', type=float, default=15.0, help='Longest candidate window')
+    parser.add_argument('--use-codec', action='store_true',
+                        help='Re-rank the top windows against models/<speaker>_voice_embedding.npy with the Fish codec')
+    parser.add_argument('--no-trim', action='store_true', help='Keep silence at the edges and long pauses')
+    args = parser.parse_args()
+
+    refs_dir = Path(args.refs_dir)
     refs_dir.mkdir(parents=True, exist_ok=True)
-    
+
     print("🎙️ Setting up Fish Speech reference voices\n")
-    
-    for speaker, config in speaker_samples.items():
+
+    # Each recording is decoded once into the PCM cache and memory-mapped;
+    # reruns skip ffmpeg entirely
+    pcm = PcmCache(args.pcm_dir, SAMPLE_RATE)
+    recordings = {}
+    cues = {}
+    for recording in discover_recordings(Path(args.source_dir)):
+        if not recording.media:
+            print(f"⚠️  {recording.transcript.name}: no recording found, skipping")
+            continue
+        audio_file = str(recording.media)
+        print(f"🔊 {'Mapping' if pcm.is_fresh(recording.media) else 'Decoding'} {recording.media.name}...")
+        recordings[audio_file] = pcm.open(recording.media).samples
+        cues[audio_file] = parse_vtt(recording.transcript)
+
+    encoder = FishCodecEncoder() if args.use_codec else None
+    if encoder and not encoder.available():
+        print("⚠️  Fish Speech codec not available, skipping embedding re-rank")
+        encoder = None
+    print()
+
+    for speaker, label in SPEAKER_LABELS.items():
         speaker_dir = refs_dir / speaker
-        audio_path = Path(config['audio'])
-        
-        # Skip if audio doesn't exist
-        if not audio_path.exists():
-            print(f"⚠️  {speaker}: Audio file not found, skipping")
+
+        windows = []
+        for audio_file in recordings:
+            windows += candidate_windows(cues[audio_file], label, audio_file, args.min_seconds, args.max_seconds)
+
+        if windows:
+            embedding_file = Path(f'models/{speaker}_voice_embedding.npy')
+            embedding = np.load(embedding_file) if encoder and embedding_file.exists() else None
+            selector = ReferenceSelector(SAMPLE_RATE, embedding=embedding, encoder=encoder)
+            best = selector.score(windows, recordings)[0]
+            write_reference(speaker_dir, selector.extract(best, recordings), best.text, not args.no_trim)
+            print(f"✅ {speaker:8} → {Path(best.recording).stem} "
+                  f"[{format_timestamp(best.start_ms)} - {format_timestamp(best.end_ms)}] "
+                  f"{best.duration_s:.1f}s, SNR {best.scores['snr_db']:.0f} dB, "
+                  f"score {best.score:.2f} ({len(windows)} candidates)")
+            print(f"   📝 {best.text[:90]}{'...' if len(best.text) > 90 else ''}")
             continue
-        
-        # Create speaker reference directory
-        speaker_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Copy audio file
-        target_audio = speaker_dir / f"sample{audio_path.suffix}"
-        shutil.copy2(audio_path, target_audio)
-        
-        # Create .lab text file
-        lab_file = speaker_dir / "sample.lab"
-        lab_file.write_text(config['text'], encoding='utf-8')
-        
-        print(f"✅ {speaker:8} → {target_audio.name} + sample.lab")
-    
+
+        fallback = FALLBACK_SAMPLES.get(speaker)
+        if not fallback or not resolve(fallback['audio']).exists():
+            print(f"⚠️  {speaker}: no recording windows or voice sample found, skipping")
+            continue
+        audio = decode_audio(resolve(fallback['audio']), SAMPLE_RATE)
+        write_reference(speaker_dir, audio, fallback['text'], not args.no_trim)
+        print(f"⚠️  {speaker:8} → fallback voice sample (transcript may not match audio)")
+
     print(f"\n📂 References directory: {refs_dir}")
     print("\n💡 Usage:")
-    print("   python fish-speech/tools/api_client.py \\")
-    print("     --text 'Your text here' \\")
-    print("     --reference_id izaac \\")
-    print("     --output output.wav")
-    
+    print("   python scripts/generate_tts_audio.py --segments all")
+
     return 0
 
+
 if __name__ == "__main__":
-    import sys
     sys.exit(setup_references())
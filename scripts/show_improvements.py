@@ -2,30 +2,22 @@
 """
 Show before/after improvements from professional rewrites
 """
-import json
 from pathlib import Path
 import sys
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.text.cleanup import default_engine
+from utils.text.transcript_index import TranscriptIndex
+
 def show_improvements(speaker_filter=None, limit=10):
     """Show improvements for segments"""
     
     # Load professional transcript
-    with open('output/original/professional_transcript.json') as f:
-        segments = json.load(f)
+    index = TranscriptIndex.open('output/original/professional_transcript.json')
     
     # Filter by speaker if specified
-    if speaker_filter:
-        # Map speaker names
-        speaker_map = {
-            'izaac': 'Zoom user',
-            'aaron': 'Devon Villalona',
-            'devon': 'Devon Villalona',
-            'ken': 'Kenith Philip',
-            'jules': 'Jhuiwensley Belizaire',
-            'jared': 'Jared Zayas'
-        }
-        speaker_name = speaker_map.get(speaker_filter.lower(), speaker_filter)
-        segments = [s for s in segments if speaker_name.lower() in s['speaker'].lower()]
+    segments = index.by_speaker(speaker_filter) if speaker_filter else index.segments
     
     # Only show segments that have been rewritten (not just copied from corrected)
     rewritten = [s for s in segments if s['highly_professional'] != s.get('corrected', s['original'])]
@@ -51,14 +43,11 @@ def show_improvements(speaker_filter=None, limit=10):
         
         # Show improvements
         improvements = []
-        original_lower = seg['original'].lower()
-        
-        if 'obviously' in original_lower and 'obviously' not in seg['highly_professional'].lower():
-            improvements.append("removed 'obviously'")
-        if 'essentially' in original_lower and 'essentially' not in seg['highly_professional'].lower():
-            improvements.append("removed 'essentially'")
-        if 'basically' in original_lower and 'basically' not in seg['highly_professional'].lower():
-            improvements.append("removed 'basically'")
+        engine = default_engine()
+        after_rules = engine.detect(seg['highly_professional'])
+        for phrase in engine.detect(seg['original']):
+            if phrase not in after_rules:
+                improvements.append(f"removed '{phrase}' ({engine.rules[phrase].category})")
         if seg['original'].startswith('So,') or seg['original'].startswith('So '):
             improvements.append("removed leading 'So'")
         
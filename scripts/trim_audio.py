@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Trim silence from generated segments and reference clips in batch
+Voice-activity detection removes leading/trailing silence and shortens long
+internal pauses of every matching file. Files are rewritten in place (as
+FLAC artifacts) unless --output-dir is given; trimmed reference clips change
+the reference fingerprint, so their cached TTS chunks are re-rendered.
+"""
+import argparse
+import glob
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import soundfile as sf
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.audio.store import write_audio
+from utils.audio.vad import KEEP_MS, MAX_PAUSE_MS, clean
+
+REFERENCE_CLIPS = ['fish-speech/references/*/sample.flac', 'fish-speech/references/*/sample.wav']
+
+
+def trim_file(path: Path, output: Path, keep_ms: int, max_pause_ms, threshold_db, dry_run: bool):
+    audio, sr = sf.read(str(path), dtype='float32')
+    result = clean(audio, sr, keep_ms, max_pause_ms, threshold_db)
+    if not dry_run and len(result.audio) != len(audio):
+        write_audio(output, result.audio, sr)
+    return path, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Trim silence and cap pauses in audio files (VAD)')
+    parser.add_argument('patterns', nargs='*', default=['output/tts/10min/*.flac', 'output/tts/10min/*.wav'],
+                        help='Audio files or globs')
+    parser.add_argument('--references', action='store_true', help=f'Also trim {REFERENCE_CLIPS[0]}')
+    parser.add_argument('--output-dir', help='Write trimmed copies here instead of in place')
+    parser.add_argument('--keep-ms', type=int, default=KEEP_MS, help='Silence kept around speech')
+    parser.add_argument('--max-pause-ms', type=int, default=MAX_PAUSE_MS, help='Longest internal pause kept')
+    parser.add_argument('--no-pause-cap', action='store_true', help='Only trim the edges')
+    parser.add_argument('--threshold-db', type=float, help='Fixed speech threshold in dBFS (default: adaptive)')
+    parser.add_argument('--workers', type=int, default=4, help='Files processed in parallel')
+    parser.add_argument('--dry-run', action='store_true', help='Report what would be removed without writing')
+    args = parser.parse_args()
+
+    patterns = args.patterns + (REFERENCE_CLIPS if args.references else [])
+    paths = sorted({Path(p) for pattern in patterns for p in glob.glob(pattern)})
+    # Chunk WAVs of the TTS cache are stitched inputs, not outputs
+    paths = [p for p in paths if 'chunks' not in p.parts]
+    if not paths:
+        print(f"❌ No audio files match {' '.join(patterns)}")
+        return 1
+
+    def output_for(path: Path) -> Path:
+        return Path(args.output_dir) / path.name if args.output_dir else path
+
+    max_pause_ms = None if args.no_pause_cap else args.max_pause_ms
+    print(f"✂️  Trimming {len(paths)} files" + (" (dry run)" if args.dry_run else "") + "\n")
+    started = time.perf_counter()
+    total_in = total_removed = 0.0
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(trim_file, p, output_for(p), args.keep_ms, max_pause_ms, args.threshold_db,
+                               args.dry_run) for p in paths]
+        for future in futures:
+            path, result = future.result()
+            seconds = result.input_samples / result.sample_rate
+            total_in += seconds
+            total_removed += result.removed_s
+            pauses = f", {result.pauses_capped} pauses capped" if result.pauses_capped else ''
+            print(f"   {path}: {seconds:.1f}s → {seconds - result.removed_s:.1f}s{pauses}")
+
+    print(f"\n✅ Removed {total_removed:.1f}s of {total_in:.1f}s in {time.perf_counter() - started:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Summarize TTS generation metrics
+Compares runs (RTF, throughput, settings) and breaks one run down per speaker
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.voice_clone.metrics import format_seconds, load_records
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Summarize metrics.jsonl written by generate_tts_audio.py')
+    parser.add_argument('--metrics', default='output/tts/10min/metrics.jsonl', help='Metrics file')
+    parser.add_argument('--run', help='Run id to break down per speaker (default: latest)')
+    args = parser.parse_args()
+
+    runs = [r for r in load_records(Path(args.metrics)) if r['type'] == 'run']
+    if not runs:
+        print(f"⚠️  No runs recorded in {args.metrics}")
+        return 1
+
+    print(f"📈 TTS Generation Runs ({len(runs)})\n")
+    print(f"   {'run':16} {'label':16} {'conc':>4} {'chunks':>6} {'audio':>8} {'elapsed':>8} "
+          f"{'eff RTF':>8} {'req RTF':>8} {'chars/s':>8} {'wait':>8}")
+    for run in runs:
+        settings = run.get('settings', {})
+        print(f"   {run['run_id']:16} {settings.get('label', '')[:16]:16} {settings.get('concurrency', ''):>4} "
+              f"{run['chunks']:6d} {run['audio_seconds']:7.1f}s {format_seconds(run['elapsed']):>8} "
+              f"{run.get('effective_rtf') or 0:8.2f} {run['rtf'] or 0:8.2f} "
+              f"{run['chars_per_second'] or 0:8.1f} {format_seconds(run['queue_wait']):>8}")
+
+    run = next((r for r in runs if r['run_id'] == args.run), None) if args.run else runs[-1]
+    if run is None:
+        print(f"\n❌ Run not found: {args.run}")
+        return 1
+
+    print(f"\n🎙️ Per speaker ({run['run_id']})\n")
+    print(f"   {'speaker':10} {'chunks':>6} {'audio':>8} {'wall':>8} {'server':>8} {'RTF':>6} {'chars/s':>8}")
+    for speaker, stats in run['speakers'].items():
+        server = format_seconds(stats['server_time']) if stats['server_time'] is not None else '--'
+        print(f"   {speaker:10} {stats['chunks']:6d} {stats['audio_seconds']:7.1f}s "
+              f"{format_seconds(stats['wall_time']):>8} {server:>8} "
+              f"{stats['rtf'] or 0:6.2f} {stats['chars_per_second'] or 0:8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""FishSpeechClient against the in-process mock server"""
+import pytest
+import soundfile as sf
+
+from utils.voice_clone import fish_client
+from utils.voice_clone.fish_client import FishSpeechClient, TTSJob
+from utils.voice_clone.mock_server import LatencyModel, MockFishServer
+
+INSTANT = dict(overhead=0.0, per_char=0.0, reference_encode=0.0)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(fish_client.time, 'sleep', lambda seconds: None)
+
+
+def test_run_job_writes_audio(tmp_path):
+    with MockFishServer(latency=LatencyModel(**INSTANT)) as server, FishSpeechClient(server.url) as client:
+        result = client.run_job(TTSJob('k', 'Hello there.', 'voice', tmp_path / 'out.wav'))
+    assert result.ok and result.attempts == 1
+    assert sf.info(str(tmp_path / 'out.wav')).frames > 0
+    assert server.requests == 1
+
+
+def test_run_job_retries_then_gives_up(tmp_path):
+    latency = LatencyModel(failure_rate=1.0, **INSTANT)
+    with MockFishServer(latency=latency) as server, FishSpeechClient(server.url, retries=2) as client:
+        result = client.run_job(TTSJob('k', 'Hello there.', 'voice', tmp_path / 'out.wav'))
+    assert not result.ok
+    assert result.attempts == 3
+    assert server.requests == 3
+    assert '500' in result.error
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_run_job_recovers_from_transient_failures(tmp_path):
+    # Seeded: some requests fail, but every job succeeds within its retries
+    latency = LatencyModel(failure_rate=0.5, **INSTANT)
+    with MockFishServer(latency=latency, seed=1) as server, FishSpeechClient(server.url, retries=10) as client:
+        results = client.run([TTSJob(str(n), f'Sentence {n}.', 'voice', tmp_path / f'{n}.wav') for n in range(8)])
+    assert all(r.ok for r in results)
+    assert server.requests == sum(r.attempts for r in results) > len(results)
@@ -0,0 +1,50 @@
+"""JobQueue state transitions"""
+import pytest
+
+from utils.voice_clone.job_queue import DONE, FAILED, PENDING, RUNNING, JobQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = JobQueue(tmp_path / 'jobs.db')
+    queue.add([('a', 'chunk a'), ('b', 'chunk b')])
+    yield queue
+    queue.close()
+
+
+def test_claim_is_exclusive(queue):
+    assert queue.claim('a', 'w1')
+    assert not queue.claim('a', 'w2')
+    job = queue.get('a')
+    assert job['state'] == RUNNING and job['worker'] == 'w1' and job['attempts'] == 1
+
+
+def test_add_keeps_existing_state(queue, tmp_path):
+    queue.claim('a', 'w1')
+    queue.mark_done('a', tmp_path / 'a.wav', 'hash', 1.0)
+    queue.add([('a', 'chunk a')])
+    assert queue.get('a')['state'] == DONE
+
+
+def test_failed_job_can_be_claimed_again(queue):
+    queue.claim('a', 'w1')
+    queue.mark_failed('a', 'boom', 1.0)
+    assert queue.get('a')['state'] == FAILED
+    assert queue.claim('a', 'w2')
+    assert queue.get('a')['attempts'] == 2
+
+
+def test_release_worker_returns_only_its_jobs(queue):
+    queue.claim('a', 'w1')
+    queue.claim('b', 'w2')
+    assert queue.release_worker('w1') == 1
+    assert queue.get('a')['state'] == PENDING and queue.get('a')['worker'] is None
+    assert queue.get('b')['state'] == RUNNING
+
+
+def test_reclaim_stale(queue):
+    queue.claim('a', 'w1')
+    assert queue.reclaim_stale(timeout=3600) == 0
+    assert queue.reclaim_stale(timeout=-1) == 1
+    assert queue.get('a')['state'] == PENDING
+    assert queue.counts(['a', 'b']) == {PENDING: 2, RUNNING: 0, DONE: 0, FAILED: 0}
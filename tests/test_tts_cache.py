@@ -0,0 +1,50 @@
+"""TTSCache lookups, LRU eviction and index persistence"""
+import time
+
+from utils.voice_clone.tts_cache import TTSCache
+
+
+def rendered(tmp_path, name, size):
+    path = tmp_path / f'{name}.wav'
+    path.write_bytes(b'\0' * size)
+    return path
+
+
+def key(n):
+    return f'{n:02d}' + 'f' * 62
+
+
+def test_get_copies_hit_and_counts_miss(tmp_path):
+    cache = TTSCache(tmp_path / 'cache')
+    cache.put(key(1), rendered(tmp_path, 'a', 10))
+    assert cache.get(key(1), tmp_path / 'out' / 'a.wav')
+    assert (tmp_path / 'out' / 'a.wav').read_bytes() == b'\0' * 10
+    assert not cache.get(key(2), tmp_path / 'out' / 'b.wav')
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = TTSCache(tmp_path / 'cache', max_bytes=25)
+    cache.put(key(1), rendered(tmp_path, 'a', 10))
+    time.sleep(0.01)
+    cache.put(key(2), rendered(tmp_path, 'b', 10))
+    time.sleep(0.01)
+    # Touch the older entry so the other one is evicted
+    assert cache.get(key(1), tmp_path / 'hit.wav')
+    time.sleep(0.01)
+    cache.put(key(3), rendered(tmp_path, 'c', 10))
+    assert set(cache.entries) == {key(1), key(3)}
+    assert cache.evictions == 1
+    assert not cache._path(key(2)).exists()
+    assert cache.total_bytes == 20
+
+
+def test_index_survives_reopen_and_counts_orphans(tmp_path):
+    cache = TTSCache(tmp_path / 'cache', max_bytes=100)
+    cache.put(key(1), rendered(tmp_path, 'a', 10))
+    cache.save()
+    # Stored but never indexed, as after an interrupted run
+    cache.put(key(2), rendered(tmp_path, 'b', 10))
+    reopened = TTSCache(tmp_path / 'cache', max_bytes=100)
+    assert set(reopened.entries) == {key(1), key(2)}
+    assert reopened.total_bytes == 20
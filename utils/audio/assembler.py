@@ -0,0 +1,195 @@
+"""
+Timeline assembly
+Lays segment audio files (the stitched FLAC artifacts, or any other format
+soundfile reads) onto one output track at their scheduled start times and
+renders it block by block: each block mixes only the segments overlapping
+it, read sequentially from their files, and is written straight to the
+output (WAV or FLAC). Memory stays at one block plus open file handles,
+whatever the track length.
+"""
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import numpy as np
+import soundfile as sf
+
+BLOCK_SECONDS = 5.0
+CROSSFADE_MS = 30
+
+# What to do when a segment runs past its slot
+SHIFT = 'shift'          # push the following segments later (nothing is lost)
+TRUNCATE = 'truncate'    # fade out at the slot end
+OVERLAP = 'overlap'      # keep the schedule and mix over the next segment
+OVERRUN_POLICIES = (SHIFT, TRUNCATE, OVERLAP)
+
+
+@dataclass
+class Placement:
+    path: Path
+    start_ms: int
+    # End of the scheduled slot; None means open-ended
+    end_ms: Optional[int] = None
+    label: str = ''
+    gain: float = 1.0
+
+
+@dataclass
+class PlacedSegment:
+    placement: Placement
+    # Output frame where the segment starts, and how many of its frames are used
+    start: int
+    frames: int
+    source_frames: int
+    scheduled: int
+    slot_end: Optional[int]
+    missing: bool = False
+
+    @property
+    def end(self) -> int:
+        return self.start + self.frames
+
+    def overrun(self) -> int:
+        """Frames the segment's own audio is longer than its slot (before any truncation)"""
+        if self.slot_end is None:
+            return 0
+        return max(0, self.scheduled + self.source_frames - self.slot_end)
+
+    def spill(self) -> int:
+        """Further frames it runs past its slot only because an earlier segment shifted it"""
+        if self.slot_end is None:
+            return 0
+        return max(0, self.start + self.source_frames - self.slot_end) - self.overrun()
+
+
+@dataclass
+class AssemblyResult:
+    output: Path
+    sample_rate: int
+    frames: int
+    segments: List[PlacedSegment] = field(default_factory=list)
+    clipped_samples: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def duration_s(self) -> float:
+        return self.frames / self.sample_rate
+
+
+def _fades(index: np.ndarray, frames: int, fade: int) -> np.ndarray:
+    """Equal-power fade-in/out gain for sample positions `index` of a `frames`-long segment"""
+    gain = np.ones(len(index), dtype=np.float32)
+    if fade <= 0:
+        return gain
+    head = index < fade
+    gain[head] = np.sin(np.pi / 2 * index[head] / fade)
+    tail = index >= frames - fade
+    gain[tail] *= np.cos(np.pi / 2 * (index[tail] - (frames - fade)) / fade)
+    return gain
+
+
+class TrackAssembler:
+    """Streams placed segments into one track, one block at a time"""
+
+    def __init__(self, sample_rate: Optional[int] = None, channels: int = 1, crossfade_ms: int = CROSSFADE_MS,
+                 overrun: str = SHIFT, block_seconds: float = BLOCK_SECONDS):
+        if overrun not in OVERRUN_POLICIES:
+            raise ValueError(f'Unknown overrun policy: {overrun}')
+        # None: take the sample rate of the first segment found
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.crossfade_ms = crossfade_ms
+        self.overrun = overrun
+        self.block_seconds = block_seconds
+
+    def _resolve_sample_rate(self, placements: Sequence[Placement]) -> int:
+        if self.sample_rate is None:
+            first = next((p for p in placements if Path(p.path).exists()), None)
+            self.sample_rate = sf.info(str(first.path)).samplerate if first else 44100
+        return self.sample_rate
+
+    def layout(self, placements: Sequence[Placement]) -> List[PlacedSegment]:
+        """Output position and length of every segment, from file headers only"""
+        sr = self._resolve_sample_rate(placements)
+        fade = self._fade_frames()
+        placed = []
+        previous_end = 0
+        for placement in sorted(placements, key=lambda p: p.start_ms):
+            path = Path(placement.path)
+            scheduled = placement.start_ms * sr // 1000
+            slot_end = placement.end_ms * sr // 1000 if placement.end_ms is not None else None
+            if not path.exists():
+                placed.append(PlacedSegment(placement, scheduled, 0, 0, scheduled, slot_end, missing=True))
+                continue
+            info = sf.info(str(path))
+            if info.samplerate != sr:
+                raise ValueError(f'{path} is {info.samplerate} Hz, expected {sr} Hz')
+            start, frames = scheduled, info.frames
+            if self.overrun == SHIFT and start < previous_end - fade:
+                # Overlap the late segment's start with the previous fade-out only
+                start = previous_end - fade
+            if self.overrun == TRUNCATE and slot_end is not None:
+                frames = max(0, min(frames, slot_end - start))
+            segment = PlacedSegment(placement, start, frames, info.frames, scheduled, slot_end)
+            previous_end = max(previous_end, segment.end)
+            placed.append(segment)
+        return placed
+
+    def _fade_frames(self) -> int:
+        return self.sample_rate * self.crossfade_ms // 1000
+
+    def _read(self, handle: sf.SoundFile, n: int) -> np.ndarray:
+        data = handle.read(n, dtype='float32', always_2d=True)
+        if data.shape[1] == self.channels:
+            return data
+        if self.channels == 1:
+            return data.mean(axis=1, keepdims=True)
+        return np.repeat(data[:, :1], self.channels, axis=1)
+
+    def assemble(self, placements: Sequence[Placement], output: Path, subtype: str = 'PCM_16') -> AssemblyResult:
+        """Render the track to `output` (format from the extension: .wav, .flac)"""
+        started = time.perf_counter()
+        segments = self.layout(placements)
+        sr = self.sample_rate
+        fade = self._fade_frames()
+        # The track covers every slot, even one whose audio is shorter or missing
+        total = max([s.end for s in segments] + [s.slot_end or 0 for s in segments] + [0])
+        block = max(1, int(self.block_seconds * sr))
+
+        output = Path(output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        result = AssemblyResult(output, sr, total, segments)
+        pending = deque(s for s in sorted(segments, key=lambda s: s.start) if s.frames)
+        active = []
+        with sf.SoundFile(str(output), 'w', samplerate=sr, channels=self.channels, subtype=subtype) as out:
+            for block_start in range(0, total, block):
+                n = min(block, total - block_start)
+                block_end = block_start + n
+                mix = np.zeros((n, self.channels), dtype=np.float32)
+                while pending and pending[0].start < block_end:
+                    segment = pending.popleft()
+                    active.append((segment, sf.SoundFile(str(segment.placement.path))))
+                still_active = []
+                for segment, handle in active:
+                    a, b = max(segment.start, block_start), min(segment.end, block_end)
+                    if b > a:
+                        data = self._read(handle, b - a)
+                        index = np.arange(a - segment.start, a - segment.start + len(data))
+                        gain = _fades(index, segment.frames, min(fade, segment.frames // 2)) * segment.placement.gain
+                        mix[a - block_start:a - block_start + len(data)] += data * gain[:, None]
+                    if segment.end <= block_end:
+                        handle.close()
+                    else:
+                        still_active.append((segment, handle))
+                active = still_active
+                clipped = np.abs(mix) > 1.0
+                if clipped.any():
+                    result.clipped_samples += int(clipped.sum())
+                    np.clip(mix, -1.0, 1.0, out=mix)
+                out.write(mix if self.channels > 1 else mix[:, 0])
+        for _, handle in active:
+            handle.close()
+        result.elapsed = time.perf_counter() - started
+        return result
@@ -0,0 +1,112 @@
+"""
+Audio decoding
+Decodes any ffmpeg-readable file (m4a, mp4, wav, ...) to a float32 NumPy array
+"""
+import re
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import soundfile as sf
+
+DEFAULT_SAMPLE_RATE = 44100
+
+
+def ffmpeg_binary() -> str:
+    """Locate ffmpeg on PATH, falling back to the imageio-ffmpeg bundled binary"""
+    binary = shutil.which('ffmpeg')
+    if binary:
+        return binary
+    try:
+        import imageio_ffmpeg
+    except ImportError:
+        raise FileNotFoundError('ffmpeg not found (install ffmpeg or imageio-ffmpeg)')
+    return imageio_ffmpeg.get_ffmpeg_exe()
+
+
+def probe_duration(path: Path) -> float:
+    """Duration of a media file in seconds, read from its header without decoding (0.0 if unknown)"""
+    try:
+        return sf.info(str(path)).duration
+    except RuntimeError:
+        pass
+    ffprobe = shutil.which('ffprobe')
+    try:
+        if ffprobe:
+            out = subprocess.run([ffprobe, '-v', 'error', '-show_entries', 'format=duration',
+                                  '-of', 'default=noprint_wrappers=1:nokey=1', str(path)],
+                                 capture_output=True, text=True).stdout
+            return float(out.strip() or 0)
+        # No ffprobe (e.g. imageio-ffmpeg): ffmpeg prints the duration while probing the input
+        err = subprocess.run([ffmpeg_binary(), '-hide_banner', '-i', str(path)],
+                             capture_output=True, text=True).stderr
+    except (FileNotFoundError, ValueError):
+        return 0.0
+    match = re.search(r'Duration: (\d+):(\d+):(\d+(?:\.\d+)?)', err)
+    if not match:
+        return 0.0
+    hours, minutes, seconds = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def decode_audio(path: Path, sample_rate: int = DEFAULT_SAMPLE_RATE, channels: int = 1) -> np.ndarray:
+    """Decode a whole file to float32 samples, shape (n,) or (n, channels)"""
+    cmd = [
+        ffmpeg_binary(), '-v', 'error', '-i', str(path),
+        '-f', 'f32le', '-acodec', 'pcm_f32le',
+        '-ac', str(channels), '-ar', str(sample_rate), '-',
+    ]
+    raw = subprocess.run(cmd, capture_output=True, check=True).stdout
+    audio = np.frombuffer(raw, dtype=np.float32)
+    return audio.reshape(-1, channels) if channels > 1 else audio
+
+
+def decode_to_file(path: Path, output: Path, sample_rate: int = DEFAULT_SAMPLE_RATE, channels: int = 1,
+                   dtype: str = 'float32') -> int:
+    """Stream-decode a file to raw interleaved PCM (float32 or int16) on disk; returns the frame count"""
+    codec = {'float32': ('f32le', 'pcm_f32le'), 'int16': ('s16le', 'pcm_s16le')}[dtype]
+    cmd = [
+        ffmpeg_binary(), '-v', 'error', '-i', str(path),
+        '-f', codec[0], '-acodec', codec[1],
+        '-ac', str(channels), '-ar', str(sample_rate), '-',
+    ]
+    with open(output, 'wb') as f:
+        subprocess.run(cmd, stdout=f, stderr=subprocess.PIPE, check=True)
+    return Path(output).stat().st_size // (np.dtype(dtype).itemsize * channels)
+
+
+def iter_decoded_blocks(path: Path, sample_rate: int = DEFAULT_SAMPLE_RATE, channels: int = 1,
+                        block_frames: int = 1 << 18) -> Iterator[np.ndarray]:
+    """Decode a file sequentially, yielding float32 blocks of up to `block_frames` frames
+
+    Stopping iteration early terminates ffmpeg, so nothing past the last block read is decoded.
+    """
+    cmd = [
+        ffmpeg_binary(), '-v', 'error', '-i', str(path),
+        '-f', 'f32le', '-acodec', 'pcm_f32le',
+        '-ac', str(channels), '-ar', str(sample_rate), '-',
+    ]
+    frame_bytes = 4 * channels
+    # '-v error' keeps stderr small enough not to fill its pipe
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        pending = b''
+        while True:
+            data = proc.stdout.read(block_frames * frame_bytes)
+            if not data:
+                break
+            data = pending + data
+            usable = len(data) - len(data) % frame_bytes
+            pending = data[usable:]
+            block = np.frombuffer(data[:usable], dtype=np.float32)
+            yield block.reshape(-1, channels) if channels > 1 else block
+        if proc.wait() != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=proc.stderr.read())
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+        proc.stderr.close()
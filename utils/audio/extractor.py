@@ -0,0 +1,137 @@
+"""
+Batch clip extraction
+Cuts every clip of a recording (e.g. one per VTT cue) in a single sequential
+decode: blocks stream out of ffmpeg once, each block feeds every clip that
+overlaps it, and decoding stops after the last clip. Recordings run in
+parallel worker processes; cues of one recording never cost extra decodes.
+"""
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.audio.decode import DEFAULT_SAMPLE_RATE, iter_decoded_blocks
+from utils.audio.pcm_cache import PcmCache
+from utils.audio.store import write_audio
+from utils.audio.vad import trim
+
+BLOCK_SECONDS = 10.0
+
+
+@dataclass
+class ClipSpec:
+    path: Path
+    start_ms: int
+    end_ms: int
+
+
+@dataclass
+class ExtractResult:
+    source: Path
+    clips: int = 0
+    # Seconds of audio written to clips, and of the source actually decoded
+    clip_seconds: float = 0.0
+    decoded_seconds: float = 0.0
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+
+class AudioExtractor:
+    """Writes many clips of one recording from a single pass over its audio"""
+
+    def __init__(self, sample_rate: int = DEFAULT_SAMPLE_RATE, pad_ms: int = 0, trim: bool = False,
+                 pcm: Optional[PcmCache] = None, block_seconds: float = BLOCK_SECONDS):
+        self.sample_rate = sample_rate
+        self.pad_ms = pad_ms
+        # Drop leading/trailing silence (VAD) from every clip
+        self.trim = trim
+        # A fresh decoded copy in the PCM cache is read instead of running ffmpeg
+        self.pcm = pcm
+        self.block_frames = int(block_seconds * sample_rate)
+
+    def _blocks(self, source: Path) -> Iterator[np.ndarray]:
+        if self.pcm is not None and self.pcm.sample_rate == self.sample_rate and self.pcm.is_fresh(source):
+            audio = self.pcm.open(source)
+            for start in range(0, len(audio), self.block_frames):
+                yield audio.samples[start:start + self.block_frames]
+            return
+        yield from iter_decoded_blocks(source, self.sample_rate, block_frames=self.block_frames)
+
+    def _write(self, spec: ClipSpec, parts: List[np.ndarray]) -> float:
+        audio = np.concatenate(parts) if parts else np.zeros(0, dtype=np.float32)
+        if self.trim:
+            audio = trim(audio, self.sample_rate)
+        # Stored as a FLAC artifact whatever the suffix of spec.path
+        write_audio(spec.path, audio, self.sample_rate)
+        return len(audio) / self.sample_rate
+
+    def extract(self, source: Path, clips: Sequence[ClipSpec]) -> ExtractResult:
+        """Write every clip of `source`; clips may overlap and come in any order"""
+        started = time.perf_counter()
+        result = ExtractResult(Path(source))
+        sr = self.sample_rate
+        spans: List[Tuple[int, int, ClipSpec]] = sorted(
+            ((max(0, spec.start_ms - self.pad_ms) * sr // 1000, (spec.end_ms + self.pad_ms) * sr // 1000, spec)
+             for spec in clips if spec.end_ms > spec.start_ms),
+            key=lambda span: span[:2])
+        if not spans:
+            return result
+        pending = deque(spans)
+        # Clips being filled: (start frame, end frame, spec, collected parts)
+        active: List[Tuple[int, int, ClipSpec, List[np.ndarray]]] = []
+        offset = 0
+        blocks = self._blocks(Path(source))
+        for block in blocks:
+            block_end = offset + len(block)
+            while pending and pending[0][0] < block_end:
+                start, end, spec = pending.popleft()
+                active.append((start, end, spec, []))
+            still_active = []
+            for start, end, spec, parts in active:
+                piece = block[max(start - offset, 0):max(min(end - offset, len(block)), 0)]
+                if len(piece):
+                    # Copy: a block may be a memory-mapped view or a reused decode buffer
+                    parts.append(np.array(piece, dtype=np.float32))
+                if end <= block_end:
+                    result.clip_seconds += self._write(spec, parts)
+                    result.clips += 1
+                else:
+                    still_active.append((start, end, spec, parts))
+            active = still_active
+            offset = block_end
+            if not pending and not active:
+                break
+        blocks.close()
+        # Clips running past the end of the audio keep what there was; clips
+        # starting after it are not written
+        for start, end, spec, parts in active:
+            result.clip_seconds += self._write(spec, parts)
+            result.clips += 1
+        result.decoded_seconds = offset / sr
+        result.elapsed = time.perf_counter() - started
+        return result
+
+
+def _extract_job(source: Path, clips: Sequence[ClipSpec], options: Dict) -> ExtractResult:
+    return AudioExtractor(**options).extract(source, clips)
+
+
+def extract_all(jobs: Dict[Path, Sequence[ClipSpec]], workers: int,
+                on_result: Optional[Callable[[ExtractResult], None]] = None, **options) -> List[ExtractResult]:
+    """Extract several recordings' clips in a process pool, one recording per task"""
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_extract_job, source, clips, options): source for source, clips in jobs.items()}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = ExtractResult(futures[future], error=f'{type(e).__name__}: {e}')
+            results.append(result)
+            if on_result:
+                on_result(result)
+    return results
@@ -0,0 +1,172 @@
+"""
+Loudness measurement
+Integrated loudness in the style of ITU-R BS.1770 / EBU R128: K-weighted
+mean square over 400 ms blocks (75 % overlap) with the -70 LUFS absolute and
+-10 LU relative gates. Files stream through in chunks of 100 ms sub-blocks;
+the K-weighting is applied to each sub-block's spectrum (one batched rFFT
+per chunk) and overlapping blocks are averages of four sub-blocks, so there
+is no per-sample filtering loop. Results are cached by audio content hash.
+"""
+import json
+import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+import numpy as np
+import soundfile as sf
+
+from utils.hashing import file_digest
+
+DEFAULT_LOUDNESS_CACHE = 'output/cache/loudness.json'
+# Spoken-word streaming target; EBU R128 broadcast is -23
+DEFAULT_TARGET_LUFS = -16.0
+PEAK_CEILING_DB = -1.0
+MAX_GAIN_DB = 20.0
+
+SUBBLOCK_S = 0.1
+ABSOLUTE_GATE_LUFS = -70.0
+RELATIVE_GATE_LU = -10.0
+# Bumped when the measurement changes, invalidating cached values
+LOUDNESS_VERSION = 1
+
+
+@dataclass
+class Loudness:
+    lufs: float
+    # Sample peak in dBFS
+    peak_db: float
+    duration_s: float
+
+    def gain(self, target_lufs: float = DEFAULT_TARGET_LUFS, peak_ceiling_db: float = PEAK_CEILING_DB,
+             max_gain_db: float = MAX_GAIN_DB) -> float:
+        """Linear gain bringing this audio to `target_lufs` without its peak passing the ceiling"""
+        if not math.isfinite(self.lufs):
+            return 1.0
+        gain_db = min(target_lufs - self.lufs, peak_ceiling_db - self.peak_db, max_gain_db)
+        return 10 ** (max(gain_db, -max_gain_db) / 20)
+
+
+def _biquad_response(b, a, w: np.ndarray) -> np.ndarray:
+    z = np.exp(-1j * w)
+    return (b[0] + b[1] * z + b[2] * z * z) / (a[0] + a[1] * z + a[2] * z * z)
+
+
+def k_weighting_power(sample_rate: int, n_fft: int) -> np.ndarray:
+    """|H(f)|² of the BS.1770 K-weighting (high shelf + high pass) at rFFT bins"""
+    w = 2 * np.pi * np.arange(n_fft // 2 + 1) / n_fft
+    # Stage 1: +4 dB high shelf at ~1.5 kHz
+    A = 10 ** (4.0 / 40)
+    w0 = 2 * np.pi * 1500.0 / sample_rate
+    alpha = np.sin(w0) / (2 * (1 / np.sqrt(2)))
+    cos = np.cos(w0)
+    shelf_b = (A * ((A + 1) + (A - 1) * cos + 2 * np.sqrt(A) * alpha),
+               -2 * A * ((A - 1) + (A + 1) * cos),
+               A * ((A + 1) + (A - 1) * cos - 2 * np.sqrt(A) * alpha))
+    shelf_a = ((A + 1) - (A - 1) * cos + 2 * np.sqrt(A) * alpha,
+               2 * ((A - 1) - (A + 1) * cos),
+               (A + 1) - (A - 1) * cos - 2 * np.sqrt(A) * alpha)
+    # Stage 2: RLB high pass at 38 Hz
+    w0 = 2 * np.pi * 38.0 / sample_rate
+    alpha = np.sin(w0) / (2 * 0.5)
+    cos = np.cos(w0)
+    high_b = ((1 + cos) / 2, -(1 + cos), (1 + cos) / 2)
+    high_a = (1 + alpha, -2 * cos, 1 - alpha)
+    response = _biquad_response(shelf_b, shelf_a, w) * _biquad_response(high_b, high_a, w)
+    return np.abs(response) ** 2
+
+
+def _subblock_powers(frames: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """K-weighted mean square of each row (one sub-block per row) via Parseval"""
+    n = frames.shape[-1]
+    spectrum = np.abs(np.fft.rfft(frames, axis=-1)) ** 2 * weights
+    # Every bin except DC (and Nyquist for even n) stands for two conjugate bins
+    spectrum[..., 1:(n + 1) // 2] *= 2
+    return spectrum.sum(axis=-1) / (n * n)
+
+
+def gated_loudness(powers: np.ndarray) -> float:
+    """Integrated loudness from per-sub-block K-weighted power (channels already summed)"""
+    if len(powers) == 0:
+        return float('-inf')
+    if len(powers) >= 4:
+        # 400 ms blocks, 100 ms hop: mean of four consecutive sub-blocks
+        blocks = np.convolve(powers, np.full(4, 0.25), mode='valid')
+    else:
+        blocks = np.array([powers.mean()])
+    with np.errstate(divide='ignore'):
+        levels = -0.691 + 10 * np.log10(blocks)
+    gated = blocks[levels > ABSOLUTE_GATE_LUFS]
+    if not len(gated):
+        return float('-inf')
+    relative = -0.691 + 10 * np.log10(gated.mean()) + RELATIVE_GATE_LU
+    gated = blocks[(levels > ABSOLUTE_GATE_LUFS) & (levels > relative)]
+    return float(-0.691 + 10 * np.log10(gated.mean()))
+
+
+def measure(path: Path, chunk_subblocks: int = 100) -> Loudness:
+    """Stream a file once and measure its integrated loudness and sample peak"""
+    info = sf.info(str(path))
+    sub = max(1, int(round(info.samplerate * SUBBLOCK_S)))
+    weights = k_weighting_power(info.samplerate, sub)
+    powers: List[np.ndarray] = []
+    peak = 0.0
+    tail = None
+    for chunk in sf.blocks(str(path), blocksize=sub * chunk_subblocks, dtype='float32', always_2d=True):
+        if tail is not None:
+            chunk = np.concatenate([tail, chunk])
+        usable = len(chunk) - len(chunk) % sub
+        tail = chunk[usable:]
+        if len(chunk):
+            peak = max(peak, float(np.abs(chunk).max()))
+        if usable:
+            # (channels, sub-blocks, samples); front channels all weigh 1.0, summed
+            frames = chunk[:usable].T.reshape(chunk.shape[1], -1, sub)
+            powers.append(_subblock_powers(frames, weights).sum(axis=0))
+    lufs = gated_loudness(np.concatenate(powers) if powers else np.zeros(0))
+    return Loudness(lufs, 20 * math.log10(peak) if peak > 0 else float('-inf'), info.frames / info.samplerate)
+
+
+class LoudnessCache:
+    """Measurements keyed by audio content hash, kept in one JSON file"""
+
+    def __init__(self, path: Path = DEFAULT_LOUDNESS_CACHE):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = {}
+        self.hits = self.misses = 0
+        if self.path.exists():
+            with open(self.path) as f:
+                data = json.load(f)
+            if data.get('version') == LOUDNESS_VERSION:
+                self._entries = data.get('entries', {})
+
+    def measure(self, path: Path) -> Loudness:
+        digest = file_digest(path)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None:
+                self.hits += 1
+                return Loudness(**entry)
+        result = measure(path)
+        with self._lock:
+            self.misses += 1
+            self._entries[digest] = asdict(result)
+        return result
+
+    def measure_all(self, paths: Iterable[Path], workers: int = 4) -> Dict[Path, Loudness]:
+        """Measure many files in parallel threads (decoding and FFTs release the GIL)"""
+        paths = list(paths)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return dict(zip(paths, pool.map(self.measure, paths)))
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp, 'w') as f:
+            # -inf (silence) is written as JSON -Infinity, which json.load reads back
+            json.dump({'version': LOUDNESS_VERSION, 'entries': self._entries}, f, indent=2)
+        os.replace(tmp, self.path)
@@ -0,0 +1,172 @@
+"""
+Decoded PCM cache
+Each source recording is decoded once to a raw PCM file (float32 or int16)
+with a JSON header sidecar (sample rate, channels, dtype, source hash).
+Consumers memory-map it and slice by milliseconds: a slice is a view into the
+page cache, so repeated extraction jobs never run ffmpeg again.
+"""
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from utils.audio.decode import DEFAULT_SAMPLE_RATE, decode_to_file, probe_duration
+from utils.hashing import file_digest
+
+DEFAULT_PCM_DIR = 'output/cache/pcm'
+PCM_VERSION = 1
+
+
+@dataclass
+class PcmHeader:
+    source: str
+    source_hash: str
+    # Size and mtime let an unchanged source skip rehashing
+    source_size: int
+    source_mtime_ns: int
+    sample_rate: int
+    channels: int
+    dtype: str
+    frames: int
+    version: int = PCM_VERSION
+
+
+def source_tag(source: Path) -> str:
+    """Short hash of a source's resolved path, so same-named recordings in
+    different directories get separate cache files"""
+    return hashlib.sha256(str(Path(source).resolve()).encode('utf-8')).hexdigest()[:12]
+
+
+class PcmAudio:
+    """Memory-mapped decoded recording"""
+
+    def __init__(self, path: Path, header: PcmHeader):
+        self.path = Path(path)
+        self.header = header
+        self.sample_rate = header.sample_rate
+        self.channels = header.channels
+        shape = (header.frames, header.channels) if header.channels > 1 else (header.frames,)
+        self.samples = np.memmap(self.path, dtype=header.dtype, mode='r', shape=shape) if header.frames \
+            else np.zeros(shape, dtype=header.dtype)
+
+    def __len__(self) -> int:
+        return self.header.frames
+
+    @property
+    def duration_s(self) -> float:
+        return self.header.frames / self.sample_rate
+
+    def frame(self, ms: int) -> int:
+        return min(max(ms, 0) * self.sample_rate // 1000, self.header.frames)
+
+    def slice_ms(self, start_ms: int, end_ms: int) -> np.ndarray:
+        """Samples between two timestamps, as a view (no copy)"""
+        return self.samples[self.frame(start_ms):self.frame(end_ms)]
+
+    def float_ms(self, start_ms: int, end_ms: int) -> np.ndarray:
+        """Samples between two timestamps as float32 (a view when the cache is float32)"""
+        clip = self.slice_ms(start_ms, end_ms)
+        if clip.dtype == np.int16:
+            return clip.astype(np.float32) / 32768.0
+        return clip
+
+
+class PcmCache:
+    """Decode-once store of recordings at one sample rate / channel count / dtype"""
+
+    def __init__(self, cache_dir: Path = DEFAULT_PCM_DIR, sample_rate: int = DEFAULT_SAMPLE_RATE,
+                 channels: int = 1, dtype: str = 'float32'):
+        if dtype not in ('float32', 'int16'):
+            raise ValueError(f'Unsupported PCM dtype: {dtype}')
+        self.cache_dir = Path(cache_dir)
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.dtype = dtype
+
+    def path_for(self, source: Path) -> Path:
+        """'<dir>/GMT..._Recording.m4a' → '<cache_dir>/GMT..._Recording.m4a.<tag>.44100hz-1ch-f32.pcm'"""
+        suffix = 'f32' if self.dtype == 'float32' else 's16'
+        return self.cache_dir / (f'{Path(source).name}.{source_tag(source)}.'
+                                 f'{self.sample_rate}hz-{self.channels}ch-{suffix}.pcm')
+
+    def _header(self, path: Path) -> Optional[PcmHeader]:
+        sidecar = path.with_name(path.name + '.json')
+        if not path.exists() or not sidecar.exists():
+            return None
+        with open(sidecar) as f:
+            data = json.load(f)
+        if data.get('version') != PCM_VERSION:
+            return None
+        return PcmHeader(**data)
+
+    def is_fresh(self, source: Path) -> bool:
+        return self._fresh_header(Path(source)) is not None
+
+    def decoded_bytes(self, source: Path) -> int:
+        """Size of the decoded PCM of `source` if it is cached and fresh, else 0"""
+        header = self._fresh_header(Path(source))
+        if header is None:
+            return 0
+        return header.frames * header.channels * np.dtype(header.dtype).itemsize
+
+    def estimated_bytes(self, source: Path) -> int:
+        """Decoded size of `source`: exact when cached, else from the media duration"""
+        cached = self.decoded_bytes(source)
+        if cached:
+            return cached
+        frames = int(probe_duration(source) * self.sample_rate)
+        return frames * self.channels * np.dtype(self.dtype).itemsize
+
+    def _fresh_header(self, source: Path) -> Optional[PcmHeader]:
+        header = self._header(self.path_for(source))
+        if header is None:
+            return None
+        stat = source.stat()
+        if (header.source_size, header.source_mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+            return header
+        # Touched but maybe not changed: the content hash decides
+        if header.source_hash != file_digest(source):
+            return None
+        header.source_size, header.source_mtime_ns = stat.st_size, stat.st_mtime_ns
+        self._write_header(self.path_for(source), header)
+        return header
+
+    def _write_header(self, path: Path, header: PcmHeader):
+        tmp = path.with_name(f'{path.name}.json.{os.getpid()}.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(asdict(header), f, indent=2)
+        os.replace(tmp, path.with_name(path.name + '.json'))
+
+    def decode(self, source: Path) -> PcmHeader:
+        """Decode `source` into the cache (always), replacing any previous copy atomically"""
+        source = Path(source)
+        path = self.path_for(source)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        stat = source.stat()
+        digest = file_digest(source)
+        # Unique temp name: two processes may decode the same recording at once
+        tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        try:
+            frames = decode_to_file(source, tmp, self.sample_rate, self.channels, self.dtype)
+            # Drop the old header first so nobody maps the new PCM with stale metadata
+            path.with_name(path.name + '.json').unlink(missing_ok=True)
+            os.replace(tmp, path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        header = PcmHeader(str(source), digest, stat.st_size, stat.st_mtime_ns,
+                           self.sample_rate, self.channels, self.dtype, frames)
+        self._write_header(path, header)
+        return header
+
+    def open(self, source: Path, force: bool = False) -> PcmAudio:
+        """Memory-mapped PCM of `source`, decoding it first if missing or stale"""
+        source = Path(source)
+        header = None if force else self._fresh_header(source)
+        if header is None:
+            header = self.decode(source)
+        return PcmAudio(self.path_for(source), header)
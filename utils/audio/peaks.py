@@ -0,0 +1,236 @@
+"""
+Waveform peak pyramid
+Min/max/RMS summaries of a recording at several zoom levels (each level
+LEVEL_FACTOR times coarser than the last), built in one streaming pass over
+the audio and stored as a compact binary sidecar: a JSON header followed by
+int16 (min, max, rms) triples per level. Drawing any time range at any width
+reads only the few bins of the coarsest level that still resolves it.
+"""
+import json
+import os
+import struct
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+import soundfile as sf
+
+from utils.audio.decode import DEFAULT_SAMPLE_RATE, iter_decoded_blocks
+from utils.audio.pcm_cache import PcmCache, source_tag
+from utils.hashing import file_digest
+
+DEFAULT_PEAKS_DIR = 'output/cache/peaks'
+PEAKS_MAGIC = b'WPK1'
+PEAKS_VERSION = 1
+# Frames per bin of the finest level, and the step between levels
+BASE_BIN = 256
+LEVEL_FACTOR = 4
+MAX_LEVELS = 8
+BLOCK_FRAMES = 1 << 18
+
+# Sparkline characters from silence to full scale
+BAR_CHARS = ' ▁▂▃▄▅▆▇█'
+
+
+@dataclass
+class PeakHeader:
+    source: str
+    source_hash: str
+    # Size and mtime let an unchanged source skip rehashing
+    source_size: int
+    source_mtime_ns: int
+    sample_rate: int
+    frames: int
+    base_bin: int
+    factor: int
+    bins: List[int] = field(default_factory=list)
+    version: int = PEAKS_VERSION
+
+
+def _quantize(values: np.ndarray) -> np.ndarray:
+    return np.round(np.clip(values, -1.0, 1.0) * 32767).astype(np.int16)
+
+
+def build_levels(blocks: Iterator[np.ndarray], base_bin: int = BASE_BIN, factor: int = LEVEL_FACTOR,
+                 max_levels: int = MAX_LEVELS) -> Tuple[int, List[np.ndarray]]:
+    """Consume audio blocks once; returns (frames, [(bins, 3) int16 per level])"""
+    mins, maxs, squares = [], [], []
+    frames = 0
+    carry = np.zeros(0, dtype=np.float32)
+    for block in blocks:
+        block = np.asarray(block, dtype=np.float32)
+        if block.ndim > 1:
+            block = block.mean(axis=1)
+        frames += len(block)
+        data = np.concatenate([carry, block]) if len(carry) else block
+        usable = len(data) - len(data) % base_bin
+        carry = data[usable:].copy()
+        if usable:
+            binned = data[:usable].reshape(-1, base_bin)
+            mins.append(binned.min(axis=1))
+            maxs.append(binned.max(axis=1))
+            squares.append(np.einsum('ij,ij->i', binned, binned) / base_bin)
+    if len(carry):
+        mins.append(np.array([carry.min()], dtype=np.float32))
+        maxs.append(np.array([carry.max()], dtype=np.float32))
+        squares.append(np.array([np.dot(carry, carry) / len(carry)], dtype=np.float32))
+    if not mins:
+        return frames, []
+
+    low, high, power = np.concatenate(mins), np.concatenate(maxs), np.concatenate(squares)
+    counts = np.full(len(low), base_bin, dtype=np.float64)
+    if len(carry):
+        counts[-1] = len(carry)
+    levels = []
+    while True:
+        levels.append(np.stack([_quantize(low), _quantize(high), _quantize(np.sqrt(power))], axis=1))
+        if len(low) <= 1 or len(levels) == max_levels:
+            return frames, levels
+        # Next level up: reduce groups of `factor` bins (the last group may be short)
+        starts = np.arange(0, len(low), factor)
+        weighted = np.add.reduceat(power * counts, starts)
+        counts = np.add.reduceat(counts, starts)
+        low, high, power = np.minimum.reduceat(low, starts), np.maximum.reduceat(high, starts), weighted / counts
+
+
+class PeakPyramid:
+    """Loaded (memory-mapped) peak levels of one source"""
+
+    def __init__(self, path: Path, header: PeakHeader, offset: int):
+        self.path = Path(path)
+        self.header = header
+        self.sample_rate = header.sample_rate
+        self.levels: List[np.ndarray] = []
+        for n in header.bins:
+            self.levels.append(np.memmap(self.path, dtype=np.int16, mode='r', offset=offset, shape=(n, 3)))
+            offset += n * 3 * 2
+
+    @property
+    def duration_s(self) -> float:
+        return self.header.frames / self.sample_rate
+
+    def bin_frames(self, level: int) -> int:
+        return self.header.base_bin * self.header.factor ** level
+
+    def columns(self, start_ms: int, end_ms: int, width: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(min, max, rms) in [-1, 1] for `width` columns spanning the time range"""
+        empty = np.zeros(width, dtype=np.float32)
+        first = max(0, start_ms) * self.sample_rate // 1000
+        end = end_ms * self.sample_rate // 1000
+        if width <= 0 or min(end, self.header.frames) <= first or not self.levels:
+            return empty, empty.copy(), empty.copy()
+        # Coarsest level that still gives at least one bin per column
+        per_column = (end - first) / width
+        level = 0
+        while level + 1 < len(self.levels) and self.bin_frames(level + 1) <= per_column:
+            level += 1
+        bins = self.levels[level]
+        positions = first + np.arange(width + 1) * per_column
+        edges = np.minimum(positions // self.bin_frames(level), len(bins)).astype(np.int64)
+        b0, b1 = edges[0], max(edges[-1], edges[0] + 1)
+        data = bins[b0:b1].astype(np.float32) / 32767
+        starts = np.minimum(edges[:-1], b1 - 1) - b0
+        counts = np.maximum(np.diff(edges), 1)
+        # Columns past the end of the audio stay silent
+        covered = positions[:-1] < self.header.frames
+        low = np.where(covered, np.minimum.reduceat(data[:, 0], starts), 0)
+        high = np.where(covered, np.maximum.reduceat(data[:, 1], starts), 0)
+        rms = np.sqrt(np.add.reduceat(data[:, 2] ** 2, starts) / counts)
+        return low, high, np.where(covered, rms, 0)
+
+    def bar(self, start_ms: int, end_ms: int, width: int) -> str:
+        """One-line waveform of a time range (peak amplitude per character)"""
+        low, high, _ = self.columns(start_ms, end_ms, width)
+        peak = np.maximum(-low, high)
+        index = np.ceil(np.clip(peak, 0, 1) * (len(BAR_CHARS) - 1)).astype(int)
+        return ''.join(BAR_CHARS[i] for i in index)
+
+
+def _write(path: Path, header: PeakHeader, levels: List[np.ndarray]):
+    tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    meta = json.dumps(asdict(header)).encode()
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(PEAKS_MAGIC + struct.pack('<I', len(meta)) + meta)
+            for level in levels:
+                f.write(np.ascontiguousarray(level, dtype='<i2').tobytes())
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def _read_header(path: Path) -> Optional[Tuple[PeakHeader, int]]:
+    if not path.exists():
+        return None
+    with open(path, 'rb') as f:
+        prefix = f.read(8)
+        if len(prefix) < 8 or prefix[:4] != PEAKS_MAGIC:
+            return None
+        size = struct.unpack('<I', prefix[4:])[0]
+        data = json.loads(f.read(size))
+    if data.get('version') != PEAKS_VERSION:
+        return None
+    return PeakHeader(**data), 8 + size
+
+
+class PeakCache:
+    """Peak pyramids of source files, rebuilt when the source content changes"""
+
+    def __init__(self, cache_dir: Path = DEFAULT_PEAKS_DIR, pcm: Optional[PcmCache] = None,
+                 sample_rate: int = DEFAULT_SAMPLE_RATE, base_bin: int = BASE_BIN, factor: int = LEVEL_FACTOR):
+        self.cache_dir = Path(cache_dir)
+        # A fresh decoded copy in the PCM cache is read instead of running ffmpeg
+        self.pcm = pcm
+        # Decode rate for files soundfile cannot read (m4a, mp4); WAV/FLAC keep their own
+        self.sample_rate = sample_rate
+        self.base_bin = base_bin
+        self.factor = factor
+
+    def path_for(self, source: Path) -> Path:
+        """'<dir>/GMT..._Recording.m4a' → '<cache_dir>/GMT..._Recording.m4a.<tag>.peaks'"""
+        return self.cache_dir / f'{Path(source).name}.{source_tag(source)}.peaks'
+
+    def _blocks(self, source: Path) -> Tuple[int, Iterator[np.ndarray]]:
+        if self.pcm is not None and self.pcm.is_fresh(source):
+            audio = self.pcm.open(source)
+            return audio.sample_rate, (audio.samples[i:i + BLOCK_FRAMES] for i in range(0, len(audio), BLOCK_FRAMES))
+        try:
+            sample_rate = sf.info(str(source)).samplerate
+        except RuntimeError:
+            return self.sample_rate, iter_decoded_blocks(source, self.sample_rate, block_frames=BLOCK_FRAMES)
+        return sample_rate, sf.blocks(str(source), blocksize=BLOCK_FRAMES, dtype='float32')
+
+    def build(self, source: Path) -> PeakPyramid:
+        """Scan `source` once and (re)write its pyramid"""
+        source = Path(source)
+        stat = source.stat()
+        digest = file_digest(source)
+        sample_rate, blocks = self._blocks(source)
+        frames, levels = build_levels(blocks, self.base_bin, self.factor)
+        header = PeakHeader(str(source), digest, stat.st_size, stat.st_mtime_ns, sample_rate, frames,
+                            self.base_bin, self.factor, [len(level) for level in levels])
+        path = self.path_for(source)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write(path, header, levels)
+        return PeakPyramid(path, header, _read_header(path)[1])
+
+    def open(self, source: Path, force: bool = False) -> PeakPyramid:
+        """Pyramid of `source`, building it first if missing or stale"""
+        source = Path(source)
+        path = self.path_for(source)
+        found = None if force else _read_header(path)
+        if found is not None:
+            header, offset = found
+            stat = source.stat()
+            layout = (header.base_bin, header.factor) == (self.base_bin, self.factor)
+            if layout and (header.source_size, header.source_mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+                return PeakPyramid(path, header, offset)
+            # Touched but maybe not changed: the content hash decides
+            if layout and header.source_hash == file_digest(source):
+                header.source_size, header.source_mtime_ns = stat.st_size, stat.st_mtime_ns
+                levels = [np.array(level) for level in PeakPyramid(path, header, offset).levels]
+                _write(path, header, levels)
+                return PeakPyramid(path, header, _read_header(path)[1])
+        return self.build(source)
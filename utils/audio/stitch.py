@@ -0,0 +1,67 @@
+"""
+Chunk stitching
+Reassembles per-sentence TTS chunks into one segment (stored as a FLAC
+artifact) with short fades at each joint and controlled inter-sentence silence
+"""
+from pathlib import Path
+from typing import List, Sequence
+
+import numpy as np
+import soundfile as sf
+
+from utils.audio.store import write_audio
+
+
+def _equal_power(n: int):
+    t = np.linspace(0.0, np.pi / 2, n, dtype=np.float32)
+    return np.sin(t), np.cos(t)
+
+
+def stitch_arrays(chunks: Sequence[np.ndarray], pauses_ms: Sequence[int], sample_rate: int,
+                  crossfade_ms: int = 15) -> np.ndarray:
+    """Join mono/multichannel float arrays
+
+    A chunk followed by a pause is faded out, padded with silence and the next
+    chunk faded in; a zero pause overlaps the two with an equal-power crossfade.
+    """
+    if not chunks:
+        return np.zeros(0, dtype=np.float32)
+    fade = int(sample_rate * crossfade_ms / 1000)
+    out = np.asarray(chunks[0], dtype=np.float32)
+    for prev_pause, chunk in zip(pauses_ms, chunks[1:]):
+        chunk = np.asarray(chunk, dtype=np.float32)
+        n = min(fade, len(out), len(chunk))
+        if n == 0:
+            out = np.concatenate([out, chunk])
+            continue
+        fade_in, fade_out = _equal_power(n)
+        if out.ndim > 1:
+            fade_in, fade_out = fade_in[:, None], fade_out[:, None]
+        if prev_pause > 0:
+            out = out.copy()
+            chunk = chunk.copy()
+            out[-n:] *= fade_out
+            chunk[:n] *= fade_in
+            silence = np.zeros((int(sample_rate * prev_pause / 1000),) + out.shape[1:], dtype=np.float32)
+            out = np.concatenate([out, silence, chunk])
+        else:
+            joint = out[-n:] * fade_out + chunk[:n] * fade_in
+            out = np.concatenate([out[:-n], joint, chunk[n:]])
+    return out
+
+
+def stitch_wavs(paths: List[Path], pauses_ms: Sequence[int], output_path: Path,
+                crossfade_ms: int = 15) -> float:
+    """Stitch chunk WAV files into the artifact of `output_path`; returns the duration in seconds"""
+    arrays = []
+    sample_rate = None
+    for path in paths:
+        data, sr = sf.read(str(path), dtype='float32')
+        if sample_rate is None:
+            sample_rate = sr
+        elif sr != sample_rate:
+            raise ValueError(f'{path} is {sr} Hz, expected {sample_rate} Hz')
+        arrays.append(data)
+    audio = stitch_arrays(arrays, pauses_ms, sample_rate, crossfade_ms)
+    write_audio(output_path, audio, sample_rate)
+    return len(audio) / sample_rate
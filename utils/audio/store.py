@@ -0,0 +1,183 @@
+"""
+Compressed audio artifact store
+Intermediate audio (speaker clips, voice samples, TTS segments, references)
+is written as lossless FLAC instead of WAV, and each store directory keeps
+an index of every artifact's sample rate, frame count and size, so layout
+and duration queries never open the audio. FLAC seeks by frame block:
+reading a time range decodes only the blocks that cover it.
+"""
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import soundfile as sf
+
+ARTIFACT_SUFFIX = '.flac'
+ARTIFACT_FORMAT = 'FLAC'
+ARTIFACT_SUBTYPE = 'PCM_16'
+# Older trees hold the same artifacts as WAV; they are still read
+LEGACY_SUFFIXES = ('.wav',)
+INDEX_NAME = 'audio.index.json'
+STORE_VERSION = 1
+
+
+@dataclass
+class AudioEntry:
+    # Path relative to the store root
+    file: str
+    sample_rate: int
+    channels: int
+    frames: int
+    size: int
+    mtime_ns: int
+
+    @property
+    def duration_s(self) -> float:
+        return self.frames / self.sample_rate
+
+
+def artifact_path(path: Path) -> Path:
+    """Where the artifact for a logical path lives: 'clip.wav' → 'clip.flac'"""
+    return Path(path).with_suffix(ARTIFACT_SUFFIX)
+
+
+def resolve(path: Path) -> Path:
+    """The existing file for a logical path: its FLAC artifact, else a legacy WAV (FLAC path if neither exists)"""
+    path = Path(path)
+    flac = artifact_path(path)
+    for candidate in (flac, path) + tuple(path.with_suffix(suffix) for suffix in LEGACY_SUFFIXES):
+        if candidate.exists():
+            return candidate
+    return flac
+
+
+def write_audio(path: Path, audio: np.ndarray, sample_rate: int) -> Path:
+    """Write `audio` as the FLAC artifact of `path`, atomically; a legacy WAV of it is removed"""
+    target = artifact_path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f'{target.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    try:
+        sf.write(str(tmp), audio, sample_rate, subtype=ARTIFACT_SUBTYPE, format=ARTIFACT_FORMAT)
+        os.replace(tmp, target)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    for suffix in LEGACY_SUFFIXES:
+        legacy = target.with_suffix(suffix)
+        if legacy.exists():
+            legacy.unlink()
+    return target
+
+
+def read_span(path: Path, start_ms: int = 0, end_ms: Optional[int] = None,
+              dtype: str = 'float32') -> Tuple[np.ndarray, int]:
+    """Samples between two timestamps; only the FLAC blocks covering them are decoded"""
+    with sf.SoundFile(str(resolve(path))) as handle:
+        sr = handle.samplerate
+        first = min(max(start_ms, 0) * sr // 1000, handle.frames)
+        last = handle.frames if end_ms is None else min(end_ms * sr // 1000, handle.frames)
+        handle.seek(first)
+        return handle.read(max(0, last - first), dtype=dtype), sr
+
+
+def iter_span(path: Path, start_ms: int = 0, end_ms: Optional[int] = None, block_frames: int = 1 << 16,
+              dtype: str = 'float32') -> Iterator[np.ndarray]:
+    """Stream-decode a time range block by block"""
+    with sf.SoundFile(str(resolve(path))) as handle:
+        sr = handle.samplerate
+        first = min(max(start_ms, 0) * sr // 1000, handle.frames)
+        remaining = (handle.frames if end_ms is None else min(end_ms * sr // 1000, handle.frames)) - first
+        handle.seek(first)
+        while remaining > 0:
+            block = handle.read(min(block_frames, remaining), dtype=dtype)
+            if not len(block):
+                break
+            remaining -= len(block)
+            yield block
+
+
+class AudioStore:
+    """Artifacts under one directory, with their headers indexed in INDEX_NAME"""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.index_file = self.root / INDEX_NAME
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.entries: Dict[str, AudioEntry] = {}
+        if self.index_file.exists():
+            with open(self.index_file) as f:
+                data = json.load(f)
+            if data.get('version') == STORE_VERSION:
+                self.entries = {key: AudioEntry(**entry) for key, entry in data.get('entries', {}).items()}
+
+    def key(self, path: Path) -> str:
+        """Index key of a logical path: relative to the root, without suffix"""
+        path = Path(path)
+        try:
+            relative = path.relative_to(self.root)
+        except ValueError:
+            if path.is_absolute():
+                raise
+            # Already relative to the root
+            relative = path
+        return str(relative.with_suffix(''))
+
+    def path(self, key: str) -> Path:
+        return resolve(self.root / f'{key}{ARTIFACT_SUFFIX}')
+
+    def entry(self, path: Path) -> Optional[AudioEntry]:
+        """Header of an artifact, from the index while the file is unchanged"""
+        key = self.key(path)
+        actual = self.path(key)
+        try:
+            stat = actual.stat()
+        except FileNotFoundError:
+            with self._lock:
+                if self.entries.pop(key, None) is not None:
+                    self._dirty = True
+            return None
+        with self._lock:
+            entry = self.entries.get(key)
+        if entry is not None and (entry.file, entry.size, entry.mtime_ns) == \
+                (str(actual.relative_to(self.root)), stat.st_size, stat.st_mtime_ns):
+            return entry
+        info = sf.info(str(actual))
+        entry = AudioEntry(str(actual.relative_to(self.root)), info.samplerate, info.channels, info.frames,
+                           stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            self.entries[key] = entry
+            self._dirty = True
+        return entry
+
+    def write(self, path: Path, audio: np.ndarray, sample_rate: int) -> AudioEntry:
+        return self.entry(write_audio(self.root / self.key(path), audio, sample_rate))
+
+    def read(self, path: Path, start_ms: int = 0, end_ms: Optional[int] = None) -> Tuple[np.ndarray, int]:
+        return read_span(self.path(self.key(path)), start_ms, end_ms)
+
+    def scan(self) -> List[AudioEntry]:
+        """Index every artifact (and legacy WAV) under the root; drops entries of deleted files"""
+        suffixes = (ARTIFACT_SUFFIX,) + LEGACY_SUFFIXES
+        keys = sorted({self.key(p) for p in self.root.rglob('*') if p.suffix in suffixes and p.is_file()})
+        with self._lock:
+            for stale in set(self.entries) - set(keys):
+                del self.entries[stale]
+                self._dirty = True
+        return [entry for entry in (self.entry(self.root / key) for key in keys) if entry is not None]
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = {key: asdict(entry) for key, entry in sorted(self.entries.items())}
+            self._dirty = False
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_file.with_name(f'{INDEX_NAME}.{os.getpid()}.tmp')
+        with open(tmp, 'w') as f:
+            json.dump({'version': STORE_VERSION, 'entries': entries}, f, indent=2)
+        os.replace(tmp, self.index_file)
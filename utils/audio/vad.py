@@ -0,0 +1,145 @@
+"""
+Voice activity detection and silence trimming
+Frame energy + zero-crossing VAD computed on whole arrays: audio is cut into
+fixed frames by reshaping, speech/silence runs are smoothed by run length,
+and trimming / pause capping become index ranges; nothing loops per sample.
+"""
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+FRAME_MS = 10
+# Speech bursts shorter than this are clicks; silences shorter than this are within-word gaps
+MIN_SPEECH_MS = 60
+MIN_SILENCE_MS = 200
+# Silence kept around speech when trimming, and the longest internal pause kept
+KEEP_MS = 80
+MAX_PAUSE_MS = 700
+# Adaptive threshold: this far above the noise floor, never below the absolute floor
+# and never closer than SPEECH_MARGIN_DB to the loud frames (clips with almost no silence)
+FLOOR_MARGIN_DB = 12.0
+ABSOLUTE_FLOOR_DB = -60.0
+SPEECH_MARGIN_DB = 20.0
+# Quiet frames this noisy (crossings per sample) are fricatives, not silence
+FRICATIVE_ZCR = 0.25
+FRICATIVE_DB = 10.0
+
+
+@dataclass
+class VadResult:
+    audio: np.ndarray
+    # (start, end) sample ranges of speech in the input
+    regions: np.ndarray
+    sample_rate: int
+    input_samples: int
+    pauses_capped: int
+
+    @property
+    def removed_s(self) -> float:
+        return (self.input_samples - len(self.audio)) / self.sample_rate
+
+
+def _mono(audio: np.ndarray) -> np.ndarray:
+    return audio.mean(axis=1) if audio.ndim > 1 else audio
+
+
+def _runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Run-length encoding: (starts, lengths, values)"""
+    if not len(mask):
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool)
+    edges = np.flatnonzero(mask[1:] != mask[:-1]) + 1
+    starts = np.concatenate([[0], edges])
+    lengths = np.diff(np.concatenate([starts, [len(mask)]]))
+    return starts, lengths, mask[starts]
+
+
+def frame_features(audio: np.ndarray, sample_rate: int, frame_ms: int = FRAME_MS) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-frame RMS level (dBFS) and zero-crossing rate"""
+    frame = max(1, sample_rate * frame_ms // 1000)
+    mono = _mono(np.asarray(audio, dtype=np.float32))
+    n = len(mono) // frame
+    if len(mono) % frame:
+        n += 1
+        mono = np.concatenate([mono, np.zeros(n * frame - len(mono), dtype=np.float32)])
+    frames = mono.reshape(n, frame)
+    level_db = 10 * np.log10(np.mean(frames * frames, axis=1) + 1e-12)
+    zcr = np.count_nonzero(np.signbit(frames[:, 1:]) != np.signbit(frames[:, :-1]), axis=1) / frame
+    return level_db, zcr
+
+
+def speech_mask(audio: np.ndarray, sample_rate: int, threshold_db: Optional[float] = None,
+                frame_ms: int = FRAME_MS, min_speech_ms: int = MIN_SPEECH_MS,
+                min_silence_ms: int = MIN_SILENCE_MS) -> np.ndarray:
+    """Boolean speech decision per frame
+
+    Without `threshold_db` the threshold adapts to the clip: FLOOR_MARGIN_DB over
+    its 10th-percentile frame level, capped SPEECH_MARGIN_DB below the 95th.
+    """
+    level_db, zcr = frame_features(audio, sample_rate, frame_ms)
+    if not len(level_db):
+        return np.zeros(0, dtype=bool)
+    if threshold_db is None:
+        floor, loud = np.percentile(level_db, [10, 95])
+        threshold_db = max(min(floor + FLOOR_MARGIN_DB, loud - SPEECH_MARGIN_DB), ABSOLUTE_FLOOR_DB)
+    mask = (level_db > threshold_db) | ((level_db > threshold_db - FRICATIVE_DB) & (zcr > FRICATIVE_ZCR))
+
+    # Fill short silences, then drop short bursts (each as one pass over the runs)
+    for value, min_ms in ((False, min_silence_ms), (True, min_speech_ms)):
+        starts, lengths, values = _runs(mask)
+        short = (values == value) & (lengths < max(1, min_ms // frame_ms))
+        if value is False:
+            # Leading/trailing silence is trimmed separately, never filled
+            short[[0, -1]] = False
+        values = np.where(short, not value, values)
+        mask = np.repeat(values, lengths)
+    return mask
+
+
+def speech_regions(audio: np.ndarray, sample_rate: int, frame_ms: int = FRAME_MS, **kwargs) -> np.ndarray:
+    """(start, end) sample ranges of speech, shape (k, 2)"""
+    return _regions(speech_mask(audio, sample_rate, frame_ms=frame_ms, **kwargs), sample_rate, frame_ms, len(audio))
+
+
+def _regions(mask: np.ndarray, sample_rate: int, frame_ms: int, n_samples: int) -> np.ndarray:
+    frame = max(1, sample_rate * frame_ms // 1000)
+    starts, lengths, values = _runs(mask)
+    regions = np.stack([starts[values], (starts + lengths)[values]], axis=1) * frame
+    return np.minimum(regions, n_samples)
+
+
+def clean(audio: np.ndarray, sample_rate: int, keep_ms: int = KEEP_MS, max_pause_ms: Optional[int] = MAX_PAUSE_MS,
+          threshold_db: Optional[float] = None, frame_ms: int = FRAME_MS) -> VadResult:
+    """Trim leading/trailing silence and shorten internal pauses longer than `max_pause_ms`
+
+    Audio with no detected speech is returned unchanged.
+    """
+    regions = _regions(speech_mask(audio, sample_rate, threshold_db, frame_ms), sample_rate, frame_ms, len(audio))
+    if not len(regions):
+        return VadResult(audio, regions, sample_rate, len(audio), 0)
+    keep = sample_rate * keep_ms // 1000
+    first = max(0, regions[0, 0] - keep)
+    last = min(len(audio), regions[-1, 1] + keep)
+
+    capped = 0
+    if max_pause_ms is not None and len(regions) > 1:
+        # Gaps between speech regions; keep half the allowed pause on each side
+        gap_start, gap_end = regions[:-1, 1], regions[1:, 0]
+        half = sample_rate * max_pause_ms // 2000
+        long = (gap_end - gap_start) > 2 * half
+        capped = int(long.sum())
+        if capped:
+            marks = np.zeros(len(audio) + 1, dtype=np.int32)
+            np.add.at(marks, gap_start[long] + half, 1)
+            np.add.at(marks, gap_end[long] - half, -1)
+            drop = np.cumsum(marks[:-1]) > 0
+            drop[:first] = True
+            drop[last:] = True
+            return VadResult(audio[~drop], regions, sample_rate, len(audio), capped)
+    return VadResult(audio[first:last], regions, sample_rate, len(audio), capped)
+
+
+def trim(audio: np.ndarray, sample_rate: int, keep_ms: int = KEEP_MS,
+         threshold_db: Optional[float] = None) -> np.ndarray:
+    """Leading/trailing silence removed (a view of `audio`)"""
+    return clean(audio, sample_rate, keep_ms, None, threshold_db).audio
@@ -0,0 +1,16 @@
+"""
+Content hashing
+Streaming file digests shared by the caches, indexes and the pipeline
+runner to detect when a source actually changed
+"""
+import hashlib
+from pathlib import Path
+
+
+def file_digest(path: Path, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's contents"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b''):
+            h.update(block)
+    return h.hexdigest()
@@ -0,0 +1,233 @@
+"""
+Incremental pipeline runner
+Stages declare their input and output files (globs allowed); a stage reruns
+only when the content fingerprint of its inputs changed or an output is
+missing. Stages whose inputs are another stage's outputs run after it;
+independent stages run in parallel.
+"""
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from utils.hashing import file_digest
+
+DEFAULT_STATE_FILE = 'output/cache/pipeline_state.json'
+
+# Stage outcomes
+FRESH = 'fresh'
+RAN = 'ran'
+FAILED = 'failed'
+SKIPPED = 'skipped'
+
+
+@dataclass
+class Stage:
+    name: str
+    command: List[str]
+    inputs: List[str]
+    outputs: List[str]
+    description: str = ''
+    # Stages that must run first even without a file link between them
+    after: List[str] = field(default_factory=list)
+
+
+@dataclass
+class StageResult:
+    stage: str
+    status: str
+    reason: str = ''
+    elapsed: float = 0.0
+    output: str = ''
+
+
+def expand(patterns: Iterable[str], root: Path) -> List[Path]:
+    """Existing files matching the patterns, in a stable order"""
+    paths = set()
+    for pattern in patterns:
+        for match in glob.glob(str(root / pattern), recursive=True):
+            if os.path.isfile(match):
+                paths.add(Path(match))
+    return sorted(paths)
+
+
+class FileHasher:
+    """Content digests, reusing the previous run's digest while size and mtime match
+
+    Entries are keyed by path relative to `root`, so the state survives moving
+    or re-cloning the checkout.
+    """
+
+    def __init__(self, previous: Optional[Dict[str, List]] = None, root: Path = Path('.')):
+        self.previous = previous or {}
+        self.current: Dict[str, List] = {}
+        self.root = Path(root)
+        self._lock = threading.Lock()
+
+    def digest(self, path: Path) -> str:
+        key = Path(path).relative_to(self.root).as_posix()
+        st = path.stat()
+        with self._lock:
+            cached = self.current.get(key) or self.previous.get(key)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            digest = cached[2]
+        else:
+            digest = file_digest(path)
+        with self._lock:
+            self.current[key] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+
+class Pipeline:
+    """A DAG of stages with per-stage input fingerprints persisted between runs"""
+
+    def __init__(self, stages: Iterable[Stage], root: Path = Path('.'), state_file: Path = None):
+        self.stages = {stage.name: stage for stage in stages}
+        self.root = Path(root)
+        self.state_file = Path(state_file) if state_file else self.root / DEFAULT_STATE_FILE
+        self.deps = {name: self._dependencies(stage) for name, stage in self.stages.items()}
+
+    def _dependencies(self, stage: Stage) -> Set[str]:
+        deps = set(stage.after)
+        for other in self.stages.values():
+            if other.name == stage.name:
+                continue
+            if any(out == pattern or fnmatch.fnmatch(out, pattern)
+                   for out in other.outputs for pattern in stage.inputs):
+                deps.add(other.name)
+        return deps
+
+    def closure(self, targets: Iterable[str]) -> Set[str]:
+        """The targets plus everything they depend on"""
+        selected: Set[str] = set()
+        todo = list(targets)
+        while todo:
+            name = todo.pop()
+            if name not in self.stages:
+                raise KeyError(f'Unknown stage: {name}')
+            if name not in selected:
+                selected.add(name)
+                todo.extend(self.deps[name])
+        return selected
+
+    def command_key(self, stage: Stage) -> List[str]:
+        """The command as fingerprinted: without the Python interpreter and with
+        paths under the root made relative, so another interpreter or checkout
+        location does not mark every stage stale"""
+        args = list(stage.command)
+        if args and (args[0] == sys.executable or Path(args[0]).name.startswith('python')):
+            args = args[1:]
+        root = self.root.resolve()
+        key = []
+        for arg in args:
+            if os.path.isabs(arg) and Path(arg).resolve().is_relative_to(root):
+                arg = Path(arg).resolve().relative_to(root).as_posix()
+            key.append(arg)
+        return key
+
+    def fingerprint(self, stage: Stage, hasher: FileHasher) -> str:
+        h = hashlib.sha256(json.dumps(self.command_key(stage)).encode('utf-8'))
+        for path in expand(stage.inputs, self.root):
+            h.update(path.relative_to(self.root).as_posix().encode('utf-8'))
+            h.update(hasher.digest(path).encode('ascii'))
+        return h.hexdigest()
+
+    def stale_reason(self, stage: Stage, fingerprint: str, state: Dict) -> Optional[str]:
+        previous = state.get(stage.name)
+        if previous is None:
+            return 'never built'
+        if previous['fingerprint'] != fingerprint:
+            return 'inputs changed'
+        for pattern in stage.outputs:
+            if not expand([pattern], self.root):
+                return f'missing {pattern}'
+        return None
+
+    def _load_state(self) -> Dict:
+        if self.state_file.exists():
+            with open(self.state_file) as f:
+                return json.load(f)
+        return {'stages': {}, 'files': {}}
+
+    def _save_state(self, state: Dict):
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_file.with_suffix('.part')
+        with open(tmp, 'w') as f:
+            json.dump(state, f, indent=2)
+        tmp.replace(self.state_file)
+
+    def _execute(self, stage: Stage) -> subprocess.CompletedProcess:
+        return subprocess.run(stage.command, cwd=self.root, capture_output=True, text=True)
+
+    def run(self, targets: Optional[Iterable[str]] = None, jobs: int = 4, force: Iterable[str] = (),
+            dry_run: bool = False, on_result: Optional[Callable[[StageResult], None]] = None) -> List[StageResult]:
+        """Bring the targets (default: every stage) up to date"""
+        selected = self.closure(targets or self.stages)
+        force = set(force)
+        state = self._load_state()
+        hasher = FileHasher(state.get('files'), self.root)
+        done: Dict[str, StageResult] = {}
+        lock = threading.Lock()
+
+        def process(name: str) -> StageResult:
+            stage = self.stages[name]
+            if any(done[dep].status in (FAILED, SKIPPED) for dep in self.deps[name] if dep in selected):
+                return StageResult(name, SKIPPED, 'upstream failed')
+            # Inputs are fingerprinted only now, after upstream stages rewrote them
+            fingerprint = self.fingerprint(stage, hasher)
+            reason = 'forced' if name in force else self.stale_reason(stage, fingerprint, state['stages'])
+            if reason is None:
+                return StageResult(name, FRESH)
+            if dry_run:
+                return StageResult(name, RAN, reason)
+            started = time.perf_counter()
+            proc = self._execute(stage)
+            elapsed = time.perf_counter() - started
+            output = proc.stdout + proc.stderr
+            if proc.returncode != 0:
+                return StageResult(name, FAILED, f'exit code {proc.returncode}', elapsed, output)
+            with lock:
+                state['stages'][name] = {'fingerprint': fingerprint, 'finished_at': time.time()}
+            return StageResult(name, RAN, reason, elapsed, output)
+
+        results = []
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            running = {}
+            while len(done) < len(selected):
+                progressed = False
+                for name in sorted(selected - set(done) - set(running.values())):
+                    # In a dry run a stale stage marks its dependents stale too
+                    if all(dep in done for dep in self.deps[name] if dep in selected):
+                        if dry_run and any(done[dep].status == RAN for dep in self.deps[name] if dep in done):
+                            done[name] = StageResult(name, RAN, 'upstream stale')
+                            results.append(done[name])
+                            if on_result:
+                                on_result(done[name])
+                            progressed = True
+                            continue
+                        running[pool.submit(process, name)] = name
+                if not running:
+                    if not progressed:
+                        raise ValueError(f'Dependency cycle among: {", ".join(sorted(selected - set(done)))}')
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    done[name] = future.result()
+                    results.append(done[name])
+                    if on_result:
+                        on_result(done[name])
+
+        if not dry_run:
+            state['files'] = {**state.get('files', {}), **hasher.current}
+            self._save_state(state)
+        return results
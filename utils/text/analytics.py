@@ -0,0 +1,193 @@
+"""
+Rewrite analytics
+Before/after statistics for every segment of one or more transcripts,
+computed as whole-corpus arrays: cleanup-rule counts come from a single regex
+scan, type-token ratios from one np.unique over all tokens, speaking time
+from per-speaker linear rates and word edit distance from a Levenshtein DP batched
+across segments. Aggregates per speaker and overall.
+"""
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.text.cleanup import CleanupEngine, default_engine
+from utils.text.duration_model import SpeakingRateModel
+from utils.text.speakers import speaker_id
+
+_WORD = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+
+def tokenize(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+def word_edit_distances(pairs: Sequence[Tuple[np.ndarray, np.ndarray]], batch: int = 256) -> np.ndarray:
+    """Levenshtein distance (insert/delete/substitute one word) of each pair of token-id arrays
+
+    Pairs are sorted by length and run in batches: each DP row is computed for
+    the whole batch at once, so the Python loop is per word position, not per pair.
+    """
+    distances = np.zeros(len(pairs), dtype=np.int64)
+    order = sorted(range(len(pairs)), key=lambda k: (len(pairs[k][0]), len(pairs[k][1])))
+    for first in range(0, len(order), batch):
+        chunk = order[first:first + batch]
+        len_a = np.array([len(pairs[k][0]) for k in chunk])
+        len_b = np.array([len(pairs[k][1]) for k in chunk])
+        # Padding never equals a real token id (ids are >= 0)
+        a = np.full((len(chunk), max(len_a.max(), 1)), -1, dtype=np.int64)
+        b = np.full((len(chunk), len_b.max()), -2, dtype=np.int64)
+        for row, k in enumerate(chunk):
+            a[row, :len_a[row]] = pairs[k][0]
+            b[row, :len_b[row]] = pairs[k][1]
+        steps = np.arange(b.shape[1] + 1)
+        dist = np.tile(steps, (len(chunk), 1))
+        for i in range(1, len_a.max() + 1):
+            current = np.empty_like(dist)
+            current[:, 0] = i
+            current[:, 1:] = np.minimum(dist[:, :-1] + (b != a[:, i - 1:i]), dist[:, 1:] + 1)
+            # Insertions chain left to right: current[j] = min(current[j], current[j-1] + 1)
+            current = np.minimum.accumulate(current - steps, axis=1) + steps
+            # Pairs whose first sequence already ended keep their last row
+            dist = np.where((i <= len_a)[:, None], current, dist)
+        distances[chunk] = dist[np.arange(len(chunk)), len_b]
+    return distances
+
+
+def _token_ids(token_lists: Sequence[List[str]], vocab: Dict[str, int]) -> List[np.ndarray]:
+    return [np.array([vocab.setdefault(t, len(vocab)) for t in tokens], dtype=np.int64) for tokens in token_lists]
+
+
+def _type_token_ratio(ids: List[np.ndarray], vocab_size: int) -> np.ndarray:
+    """Distinct words / words per text, from one unique() over (text, word) keys"""
+    lengths = np.array([len(x) for x in ids], dtype=np.int64)
+    if not lengths.sum():
+        return np.zeros(len(ids))
+    rows = np.repeat(np.arange(len(ids)), lengths)
+    keys = np.unique(rows * vocab_size + np.concatenate(ids))
+    types = np.bincount(keys // vocab_size, minlength=len(ids))
+    return np.divide(types, lengths, out=np.zeros(len(ids)), where=lengths > 0)
+
+
+@dataclass
+class SpeakerStats:
+    speaker: str
+    segments: int
+    rewritten: int
+    chars_before: int
+    chars_after: int
+    words_before: int
+    words_after: int
+    edit_distance: int
+    ttr_before: float
+    ttr_after: float
+    seconds_before: float
+    seconds_after: float
+    # Category → matches before / after
+    rules_before: Dict[str, int]
+    rules_after: Dict[str, int]
+
+    @property
+    def rewritten_pct(self) -> float:
+        return 100 * self.rewritten / self.segments if self.segments else 0.0
+
+
+class RewriteAnalytics:
+    """Column arrays of per-segment before/after statistics"""
+
+    def __init__(self, segments: Sequence[Dict], before: str = 'original', after: str = 'highly_professional',
+                 engine: Optional[CleanupEngine] = None, model: Optional[SpeakingRateModel] = None):
+        engine = engine or default_engine()
+        self.categories = engine.categories
+        self.ids = [seg['id'] for seg in segments]
+        # Corpus segments carry the transcript label separately from the speaker id
+        self.labels = [seg.get('label', seg['speaker']) for seg in segments]
+        self.speakers = np.array([speaker_id(label) for label in self.labels])
+        before_texts = [seg[before] for seg in segments]
+        after_texts = [seg.get(after) or seg[before] for seg in segments]
+        # A rewrite goes beyond the grammar pass when the result differs from 'corrected'
+        self.rewritten = np.array([a != seg.get('corrected', seg[before]) for seg, a in zip(segments, after_texts)],
+                                  dtype=bool)
+
+        self.chars_before = np.array([len(t) for t in before_texts], dtype=np.int64)
+        self.chars_after = np.array([len(t) for t in after_texts], dtype=np.int64)
+        vocab: Dict[str, int] = {}
+        ids_before = _token_ids([tokenize(t) for t in before_texts], vocab)
+        ids_after = _token_ids([tokenize(t) for t in after_texts], vocab)
+        self.words_before = np.array([len(x) for x in ids_before], dtype=np.int64)
+        self.words_after = np.array([len(x) for x in ids_after], dtype=np.int64)
+        vocab_size = max(len(vocab), 1)
+        self.ttr_before = _type_token_ratio(ids_before, vocab_size)
+        self.ttr_after = _type_token_ratio(ids_after, vocab_size)
+        self.edit_distance = word_edit_distances(list(zip(ids_before, ids_after)))
+        self.rules_before = engine.count_all(before_texts)
+        self.rules_after = engine.count_all(after_texts)
+
+        if model:
+            rates = [model.rate_for(label) for label in self.labels]
+            slope = np.array([r.seconds_per_char for r in rates]) * model.scale
+            intercept = np.array([r.intercept for r in rates]) * model.scale
+            self.seconds_before = intercept + slope * self.chars_before
+            self.seconds_after = intercept + slope * self.chars_after
+        else:
+            self.seconds_before = np.full(len(self.ids), np.nan)
+            self.seconds_after = np.full(len(self.ids), np.nan)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def rows(self) -> List[Dict]:
+        """One flat record per segment (JSON / CSV)"""
+        rows = []
+        for i, seg_id in enumerate(self.ids):
+            row = {
+                'id': seg_id,
+                'speaker': str(self.speakers[i]),
+                'rewritten': bool(self.rewritten[i]),
+                'chars_before': int(self.chars_before[i]),
+                'chars_after': int(self.chars_after[i]),
+                'chars_delta': int(self.chars_after[i] - self.chars_before[i]),
+                'words_before': int(self.words_before[i]),
+                'words_after': int(self.words_after[i]),
+                'edit_distance': int(self.edit_distance[i]),
+                'ttr_before': round(float(self.ttr_before[i]), 3),
+                'ttr_after': round(float(self.ttr_after[i]), 3),
+                'seconds_before': round(float(self.seconds_before[i]), 2),
+                'seconds_after': round(float(self.seconds_after[i]), 2),
+            }
+            for c, category in enumerate(self.categories):
+                row[f'{category}_before'] = int(self.rules_before[i, c])
+                row[f'{category}_after'] = int(self.rules_after[i, c])
+            rows.append(row)
+        return rows
+
+    def _aggregate(self, speaker: str, mask: np.ndarray) -> SpeakerStats:
+        def mean(values):
+            return round(float(values[mask].mean()), 3) if mask.any() else 0.0
+
+        return SpeakerStats(
+            speaker=speaker,
+            segments=int(mask.sum()),
+            rewritten=int(self.rewritten[mask].sum()),
+            chars_before=int(self.chars_before[mask].sum()),
+            chars_after=int(self.chars_after[mask].sum()),
+            words_before=int(self.words_before[mask].sum()),
+            words_after=int(self.words_after[mask].sum()),
+            edit_distance=int(self.edit_distance[mask].sum()),
+            ttr_before=mean(self.ttr_before),
+            ttr_after=mean(self.ttr_after),
+            seconds_before=round(float(self.seconds_before[mask].sum()), 1),
+            seconds_after=round(float(self.seconds_after[mask].sum()), 1),
+            rules_before=dict(zip(self.categories, self.rules_before[mask].sum(axis=0).tolist())),
+            rules_after=dict(zip(self.categories, self.rules_after[mask].sum(axis=0).tolist())),
+        )
+
+    def by_speaker(self) -> List[SpeakerStats]:
+        """Per-speaker totals, most segments first"""
+        names, counts = np.unique(self.speakers, return_counts=True)
+        order = sorted(zip(names.tolist(), counts.tolist()), key=lambda x: (-x[1], x[0]))
+        return [self._aggregate(name, self.speakers == name) for name, _ in order]
+
+    def totals(self) -> SpeakerStats:
+        return self._aggregate('all', np.ones(len(self.ids), dtype=bool))
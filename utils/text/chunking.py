@@ -0,0 +1,79 @@
+"""
+Sentence / clause chunking for TTS
+Splits a segment script into independently synthesizable chunks
+"""
+import re
+from dataclasses import dataclass
+from typing import Dict, List
+
+SENTENCE_PAUSE_MS = 300
+CLAUSE_PAUSE_MS = 120
+
+# Sentence end: terminal punctuation (optionally closed by a quote/bracket) then whitespace
+_SENTENCE_RE = re.compile(r'(?<=[.!?…])["\')\]]?\s+')
+# Clause boundaries inside an over-long sentence
+_CLAUSE_RE = re.compile(r'(?<=[,;:])\s+|\s+(?=[-–—]\s)')
+
+
+@dataclass
+class Chunk:
+    """One synthesis unit and the silence to leave after it"""
+    text: str
+    pause_ms: int
+
+    def to_dict(self) -> Dict:
+        return {'text': self.text, 'pause_ms': self.pause_ms}
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text at sentence boundaries"""
+    return [s.strip() for s in _SENTENCE_RE.split(text.strip()) if s.strip()]
+
+
+def _split_clauses(sentence: str, max_chars: int) -> List[str]:
+    """Greedily pack clauses of a long sentence into pieces of at most max_chars"""
+    pieces = []
+    current = ''
+    for clause in _CLAUSE_RE.split(sentence):
+        clause = clause.strip()
+        if not clause:
+            continue
+        if current and len(current) + 1 + len(clause) > max_chars:
+            pieces.append(current)
+            # A dash that opened the clause is now the chunk boundary itself
+            current = clause.lstrip('-–— ')
+        else:
+            current = f'{current} {clause}' if current else clause
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def chunk_script(text: str, max_chars: int = 220, min_chars: int = 40) -> List[Chunk]:
+    """Split a script into sentence chunks, breaking long sentences at clauses
+
+    Sentences shorter than `min_chars` are merged into the following sentence so
+    tiny fragments don't pay a full request's overhead.
+    """
+    chunks: List[Chunk] = []
+    carry = ''
+    for sentence in split_sentences(text):
+        if carry:
+            sentence = f'{carry} {sentence}'
+            carry = ''
+        if len(sentence) < min_chars:
+            carry = sentence
+            continue
+        pieces = _split_clauses(sentence, max_chars) if len(sentence) > max_chars else [sentence]
+        for i, piece in enumerate(pieces):
+            last = i == len(pieces) - 1
+            chunks.append(Chunk(piece, SENTENCE_PAUSE_MS if last else CLAUSE_PAUSE_MS))
+    if carry:
+        if chunks and chunks[-1].pause_ms == SENTENCE_PAUSE_MS and len(chunks[-1].text) + len(carry) < max_chars:
+            chunks[-1] = Chunk(f'{chunks[-1].text} {carry}', SENTENCE_PAUSE_MS)
+        else:
+            chunks.append(Chunk(carry, SENTENCE_PAUSE_MS))
+    if chunks:
+        # No trailing silence after the last chunk of a segment
+        chunks[-1] = Chunk(chunks[-1].text, 0)
+    return chunks
@@ -0,0 +1,139 @@
+"""
+Transcript text cleanup
+Filler, hedge, contraction and product-name rules compiled into one regex and
+applied in a single left-to-right scan. Rules only match whole words, so
+'maybe' leaves 'Maybelline' alone and "it's" is not found inside "wit's".
+"""
+import json
+import re
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_RULES = Path(__file__).parent / 'cleanup_rules.json'
+
+_SPACES = re.compile(r' {2,}')
+
+
+@dataclass(frozen=True)
+class Rule:
+    phrase: str
+    replacement: str
+    category: str
+
+
+@dataclass
+class CleanupResult:
+    text: str
+    # Rule phrase → number of times it fired
+    fired: Dict[str, int]
+
+
+def load_rules(path: Path = DEFAULT_RULES) -> List[Rule]:
+    """Rules from a JSON file of {category: {phrase: replacement}}"""
+    with open(path) as f:
+        table = json.load(f)
+    return [Rule(phrase, replacement, category)
+            for category, phrases in table.items()
+            for phrase, replacement in phrases.items()]
+
+
+def _word_bounded(phrase: str) -> str:
+    pattern = re.escape(phrase)
+    # Only anchor ends that are word characters: 'like,' must still match 'like,'
+    if re.match(r'\w', phrase):
+        pattern = r'(?<!\w)' + pattern
+    if re.search(r'\w$', phrase):
+        pattern += r'(?!\w)'
+    return pattern
+
+
+class CleanupEngine:
+    """All rules as one compiled alternation; build once, reuse for every segment"""
+
+    def __init__(self, rules: Iterable[Rule]):
+        self.rules = {rule.phrase: rule for rule in rules}
+        self.categories = list(dict.fromkeys(rule.category for rule in self.rules.values()))
+        # Longest phrase first so 'kind of' wins over any shorter overlapping rule
+        phrases = sorted(self.rules, key=len, reverse=True)
+        self._pattern = None
+        self._pattern_any_case = None
+        # Case-folded phrase → rule phrase, for matches found ignoring case
+        self._folded = {phrase.lower(): phrase for phrase in phrases}
+        if phrases:
+            # Cheap guards in front of the alternation let the scanner skip most positions
+            # without trying every rule: a word start, and one of the rules' first characters
+            guard = '(?=[' + ''.join(re.escape(c) for c in sorted({p[0] for p in phrases})) + '])'
+            if all(re.match(r'\w', p) for p in phrases):
+                guard = r'(?<!\w)' + guard
+            source = guard + '(?:' + '|'.join(_word_bounded(p) for p in phrases) + ')'
+            self._pattern = re.compile(source)
+            self._pattern_any_case = re.compile(source, re.IGNORECASE)
+
+    @classmethod
+    def from_file(cls, path: Path = DEFAULT_RULES) -> 'CleanupEngine':
+        return cls(load_rules(path))
+
+    def apply(self, text: str) -> CleanupResult:
+        """Clean one text, counting the rules that fired"""
+        fired: Counter = Counter()
+        if self._pattern is not None:
+            def substitute(match):
+                fired[match.group(0)] += 1
+                return self.rules[match.group(0)].replacement
+            text = self._pattern.sub(substitute, text)
+        return CleanupResult(_SPACES.sub(' ', text).strip(), dict(fired))
+
+    def detect(self, text: str) -> Dict[str, int]:
+        """Rule phrase → occurrences in `text` ignoring case ('Obviously' counts as 'obviously')"""
+        found: Counter = Counter()
+        if self._pattern_any_case is not None:
+            for match in self._pattern_any_case.finditer(text):
+                found[self._folded[match.group(0).lower()]] += 1
+        return dict(found)
+
+    def clean(self, text: str) -> str:
+        return self.apply(text).text
+
+    def apply_all(self, segments: Iterable[Tuple[int, str]]) -> Dict[int, CleanupResult]:
+        """Clean a whole transcript of (segment id, text) pairs"""
+        return {seg_id: self.apply(text) for seg_id, text in segments}
+
+    def count_all(self, texts: Sequence[str]) -> np.ndarray:
+        """(texts × categories) matrix of rule matches, from one scan over all texts joined together"""
+        counts = np.zeros((len(texts), len(self.categories)), dtype=np.int32)
+        if self._pattern is None or not texts:
+            return counts
+        # Newline separators are non-word characters, so no match spans two texts
+        starts = np.cumsum([0] + [len(text) + 1 for text in texts[:-1]])
+        column = {category: i for i, category in enumerate(self.categories)}
+        positions, categories = [], []
+        for match in self._pattern.finditer('\n'.join(texts)):
+            positions.append(match.start())
+            categories.append(column[self.rules[match.group(0)].category])
+        if positions:
+            rows = np.searchsorted(starts, positions, side='right') - 1
+            np.add.at(counts, (rows, categories), 1)
+        return counts
+
+    def category_counts(self, results: Iterable[CleanupResult]) -> Dict[str, int]:
+        """Total firings per rule category over many results"""
+        counts: Counter = Counter()
+        for result in results:
+            for phrase, n in result.fired.items():
+                counts[self.rules[phrase].category] += n
+        return dict(counts)
+
+
+_default_engine: Optional[CleanupEngine] = None
+
+
+def default_engine() -> CleanupEngine:
+    """Engine for the bundled rule table, compiled on first use"""
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = CleanupEngine.from_file()
+    return _default_engine
@@ -0,0 +1,157 @@
+"""
+Columnar cue store
+Transcript cues held as parallel arrays (int32 millisecond start/end, interned
+speaker ids, one UTF-8 text blob with offsets) and saved as a single binary
+file that reloads by memory-mapping instead of parsing
+"""
+import json
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from utils.hashing import file_digest
+from utils.text.vtt import Cue, iter_vtt
+
+DEFAULT_STORE_DIR = 'output/cache/cues'
+
+MAGIC = b'CUES\x01'
+# Array sections are aligned so memory-mapped views are aligned too
+ALIGN = 16
+_COLUMNS = (('start_ms', np.int32), ('end_ms', np.int32), ('speaker_ids', np.uint16), ('offsets', np.int64))
+
+
+def _pad(n: int) -> int:
+    return -n % ALIGN
+
+
+class CueStore:
+    """Read-only columnar view of a transcript's cues"""
+
+    def __init__(self, start_ms: np.ndarray, end_ms: np.ndarray, speaker_ids: np.ndarray,
+                 speakers: List[str], offsets: np.ndarray, text: bytes, meta: Optional[Dict] = None):
+        self.start_ms = start_ms
+        self.end_ms = end_ms
+        self.speaker_ids = speaker_ids
+        self.speakers = speakers
+        # Cue i's text is text[offsets[i]:offsets[i + 1]]
+        self.offsets = offsets
+        self.text = text
+        self.meta = meta or {}
+
+    @classmethod
+    def from_cues(cls, cues: Iterable[Cue], meta: Optional[Dict] = None) -> 'CueStore':
+        """Build from any cue iterable (e.g. iter_vtt) in one pass"""
+        starts: List[int] = []
+        ends: List[int] = []
+        speaker_ids: List[int] = []
+        speakers: Dict[str, int] = {}
+        offsets = [0]
+        blob = bytearray()
+        for cue in cues:
+            starts.append(cue.start_ms)
+            ends.append(cue.end_ms)
+            speaker_ids.append(speakers.setdefault(cue.speaker, len(speakers)))
+            blob += cue.text.encode('utf-8')
+            offsets.append(len(blob))
+        return cls(
+            np.array(starts, dtype=np.int32), np.array(ends, dtype=np.int32),
+            np.array(speaker_ids, dtype=np.uint16), list(speakers),
+            np.array(offsets, dtype=np.int64), bytes(blob), meta,
+        )
+
+    @classmethod
+    def from_vtt(cls, path: Path) -> 'CueStore':
+        return cls.from_cues(iter_vtt(path), {'source': str(path)})
+
+    def __len__(self) -> int:
+        return len(self.start_ms)
+
+    def text_at(self, i: int) -> str:
+        return bytes(self.text[self.offsets[i]:self.offsets[i + 1]]).decode('utf-8')
+
+    def speaker_at(self, i: int) -> str:
+        return self.speakers[self.speaker_ids[i]]
+
+    def __getitem__(self, i: int) -> Cue:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return Cue(i, int(self.start_ms[i]), int(self.end_ms[i]), self.speaker_at(i), self.text_at(i))
+
+    def __iter__(self) -> Iterator[Cue]:
+        for i in range(len(self)):
+            yield self[i]
+
+    @property
+    def duration_ms(self) -> np.ndarray:
+        return self.end_ms - self.start_ms
+
+    def speaker_mask(self, speaker: str) -> np.ndarray:
+        """Boolean mask of cues spoken by `speaker`"""
+        if speaker not in self.speakers:
+            return np.zeros(len(self), dtype=bool)
+        return self.speaker_ids == self.speakers.index(speaker)
+
+    def save(self, path: Path):
+        """Write header + aligned column sections; see load()"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        header = json.dumps({'count': len(self), 'speakers': self.speakers, 'text_bytes': len(self.text),
+                             'meta': self.meta}).encode('utf-8')
+        tmp = path.with_suffix(path.suffix + '.part')
+        with open(tmp, 'wb') as f:
+            f.write(MAGIC + struct.pack('<I', len(header)) + header)
+            f.write(b'\0' * _pad(f.tell()))
+            for name, dtype in _COLUMNS:
+                f.write(np.ascontiguousarray(getattr(self, name), dtype=dtype).tobytes())
+                f.write(b'\0' * _pad(f.tell()))
+            f.write(self.text)
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path, mmap: bool = True) -> 'CueStore':
+        """Open a saved store; with mmap the columns are views into the file"""
+        with open(path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f'Not a cue store: {path}')
+            (header_len,) = struct.unpack('<I', f.read(4))
+            header = json.loads(f.read(header_len))
+        count = header['count']
+        offset = len(MAGIC) + 4 + header_len
+        offset += _pad(offset)
+        if mmap:
+            data = np.memmap(path, dtype=np.uint8, mode='r')
+        else:
+            data = np.frombuffer(Path(path).read_bytes(), dtype=np.uint8)
+        columns = {}
+        for name, dtype in _COLUMNS:
+            n = count + 1 if name == 'offsets' else count
+            size = n * np.dtype(dtype).itemsize
+            columns[name] = data[offset:offset + size].view(dtype)
+            offset += size + _pad(size)
+        text = data[offset:offset + header['text_bytes']]
+        return cls(columns['start_ms'], columns['end_ms'], columns['speaker_ids'], header['speakers'],
+                   columns['offsets'], text, header.get('meta'))
+
+
+def store_path(vtt_file: Path, store_dir: Path = DEFAULT_STORE_DIR) -> Path:
+    """'<dir>/GMT..._Recording.transcript.vtt' → '<store_dir>/GMT..._Recording.cues'"""
+    vtt_file = Path(vtt_file)
+    return Path(store_dir) / (vtt_file.name.replace('.transcript.vtt', '').replace('.vtt', '') + '.cues')
+
+
+def load_or_build(vtt_file: Path, store_dir: Path = DEFAULT_STORE_DIR, force: bool = False) -> CueStore:
+    """Cue store for a VTT file, rebuilt only if the VTT's hash changed"""
+    path = store_path(vtt_file, store_dir)
+    digest = file_digest(vtt_file)
+    if path.exists() and not force:
+        store = CueStore.load(path)
+        if store.meta.get('source_hash') == digest:
+            return store
+    store = CueStore.from_vtt(vtt_file)
+    store.meta['source_hash'] = digest
+    store.save(path)
+    return store
@@ -0,0 +1,135 @@
+"""
+Speech duration prediction
+Per-speaker speaking-rate model fitted from VTT cues (known text + known
+duration), used to check script sections against their time budget before
+any audio is synthesized and to estimate synthesis cost when scheduling
+"""
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from utils.text.chunking import chunk_script
+from utils.text.vtt import Cue, iter_vtt
+
+DEFAULT_SOURCE_DIR = 'data/source'
+
+# Cues shorter than this are mostly timing noise
+MIN_CUE_MS = 1000
+# Cues slower than this are pauses/interruptions, not continuous speech
+MAX_SECONDS_PER_CHAR = 0.2
+
+
+def parse_duration(duration_str: str) -> float:
+    """Parse duration string like '45s' or '60s' to seconds"""
+    return float(str(duration_str).replace('s', ''))
+
+
+@dataclass
+class Rate:
+    """duration ≈ intercept + seconds_per_char × characters"""
+    seconds_per_char: float
+    intercept: float
+    n_cues: int
+
+    def predict(self, text: str) -> float:
+        return self.intercept + self.seconds_per_char * len(text)
+
+
+def fit_rate(cues: Sequence[Cue]) -> Optional[Rate]:
+    """Least-squares fit of cue duration against character count"""
+    points = [
+        (len(c.text), c.duration_ms / 1000)
+        for c in cues
+        if c.duration_ms >= MIN_CUE_MS and c.text
+        and c.duration_ms / 1000 / len(c.text) <= MAX_SECONDS_PER_CHAR
+    ]
+    if len(points) < 3:
+        return None
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if var_x == 0:
+        return Rate(mean_y / mean_x, 0.0, n)
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+    intercept = max(0.0, mean_y - slope * mean_x)
+    if intercept == 0.0:
+        slope = mean_y / mean_x
+    return Rate(slope, intercept, n)
+
+
+class SpeakingRateModel:
+    """Per-speaker rates with a pooled fallback for unseen speakers"""
+
+    def __init__(self, rates: Dict[str, Rate], default: Rate, scale: float = 1.0):
+        self.rates = rates
+        self.default = default
+        # TTS output can run faster/slower than the live speaker; calibrate here
+        self.scale = scale
+
+    @classmethod
+    def from_cues(cls, cues: Iterable[Cue], scale: float = 1.0) -> 'SpeakingRateModel':
+        by_speaker: Dict[str, List[Cue]] = {}
+        for cue in cues:
+            by_speaker.setdefault(cue.speaker, []).append(cue)
+        pooled = fit_rate([c for group in by_speaker.values() for c in group]) or Rate(1 / 15, 0.0, 0)
+        rates = {}
+        for speaker, group in by_speaker.items():
+            rate = fit_rate(group)
+            if rate:
+                rates[speaker] = rate
+        return cls(rates, pooled, scale)
+
+    @classmethod
+    def from_vtt_files(cls, paths: Iterable[Path], scale: float = 1.0) -> 'SpeakingRateModel':
+        cues: List[Cue] = []
+        for path in paths:
+            cues.extend(iter_vtt(path))
+        return cls.from_cues(cues, scale)
+
+    @classmethod
+    def from_source_dir(cls, source_dir: Path = DEFAULT_SOURCE_DIR,
+                        scale: float = 1.0) -> Optional['SpeakingRateModel']:
+        """Model fitted from every *.transcript.vtt in `source_dir`; None if there are none"""
+        vtt_files = sorted(Path(source_dir).glob('*.transcript.vtt'))
+        return cls.from_vtt_files(vtt_files, scale) if vtt_files else None
+
+    def rate_for(self, speaker: Optional[str]) -> Rate:
+        return self.rates.get(speaker, self.default)
+
+    def predict(self, text: str, speaker: Optional[str] = None, pause_ms: int = 0) -> float:
+        """Predicted seconds of speech for `text`, plus any inserted pauses"""
+        return self.rate_for(speaker).predict(text) * self.scale + pause_ms / 1000
+
+
+@dataclass
+class BudgetCheck:
+    """Predicted speech length of one script section against its slot"""
+    section: str
+    speaker: str
+    predicted: float
+    budget: float
+
+    @property
+    def over(self) -> bool:
+        return self.predicted > self.budget
+
+    @property
+    def ratio(self) -> float:
+        return self.predicted / self.budget if self.budget else float('inf')
+
+
+def check_budgets(model: SpeakingRateModel, sections: Iterable[Dict], labels: Dict[str, str]) -> List[BudgetCheck]:
+    """Predict every section's length (script + chunk pauses) against its duration budget
+
+    `labels` maps the section's speaker name to its transcript label. Sections
+    without precomputed chunks are chunked here, so a script and its manifest
+    entry always predict the same length.
+    """
+    checks = []
+    for seg in sections:
+        chunks = seg.get('chunks') or [chunk.to_dict() for chunk in chunk_script(seg['script'])]
+        pause_ms = sum(chunk.get('pause_ms', 0) for chunk in chunks)
+        predicted = model.predict(seg['script'], labels.get(seg['speaker'].lower()), pause_ms)
+        checks.append(BudgetCheck(seg['section'], seg['speaker'], predicted, parse_duration(seg['duration'])))
+    return checks
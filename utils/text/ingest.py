@@ -0,0 +1,145 @@
+"""
+Multi-recording ingestion
+Discovers every Zoom recording (transcript + optional media) in a directory
+and processes each one in its own worker process: parse the VTT, map speaker
+labels to speaker ids, clean the text and optionally cut each cue's audio.
+Results merge into a per-speaker corpus keyed by stable global segment ids
+('<recording>:<cue>').
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from utils.audio.decode import DEFAULT_SAMPLE_RATE
+from utils.audio.pcm_cache import DEFAULT_PCM_DIR, PcmCache
+from utils.audio.store import write_audio
+from utils.text.cleanup import default_engine
+from utils.text.cue_store import DEFAULT_STORE_DIR, load_or_build
+from utils.text.speakers import speaker_id
+from utils.text.vtt import format_timestamp
+
+# Preferred first: audio-only exports decode faster than the video
+MEDIA_EXTENSIONS = ('.m4a', '.wav', '.flac', '.mp3', '.mp4', '.mkv', '.webm')
+
+
+@dataclass
+class Recording:
+    id: str
+    transcript: Path
+    media: Optional[Path] = None
+
+
+@dataclass
+class RecordingResult:
+    recording: Recording
+    segments: List[Dict]
+    duration_s: float
+    clips: int = 0
+    error: Optional[str] = None
+    speakers: Dict[str, int] = field(default_factory=dict)
+
+
+def recording_id(transcript: Path) -> str:
+    """'GMT20251114-035710_Recording.transcript.vtt' → 'GMT20251114-035710'"""
+    name = Path(transcript).name
+    for suffix in ('.transcript.vtt', '.vtt'):
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+            break
+    return name[:-len('_Recording')] if name.endswith('_Recording') else name
+
+
+def discover_recordings(source_dir: Path) -> List[Recording]:
+    """Every transcript in `source_dir`, paired with its media file when one exists"""
+    recordings = []
+    for transcript in sorted(Path(source_dir).glob('*.vtt')):
+        stem = transcript.name.replace('.transcript.vtt', '').replace('.vtt', '')
+        media = next((transcript.with_name(stem + ext) for ext in MEDIA_EXTENSIONS
+                      if transcript.with_name(stem + ext).exists()), None)
+        recordings.append(Recording(recording_id(transcript), transcript, media))
+    return recordings
+
+
+def bounded_workers(requested: int, n_jobs: int, bytes_per_job: int = 0) -> int:
+    """Worker count capped by CPUs, jobs and (when known) available memory"""
+    workers = max(1, min(requested or os.cpu_count() or 1, n_jobs or 1))
+    if bytes_per_job:
+        try:
+            available = os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+        except (ValueError, OSError, AttributeError):
+            return workers
+        workers = max(1, min(workers, available // bytes_per_job))
+    return workers
+
+
+def ingest_recording(recording: Recording, store_dir: str = DEFAULT_STORE_DIR, audio_dir: Optional[str] = None,
+                     sample_rate: int = DEFAULT_SAMPLE_RATE, pcm_dir: str = DEFAULT_PCM_DIR) -> RecordingResult:
+    """Process one recording; runs inside a worker process"""
+    store = load_or_build(recording.transcript, store_dir)
+    engine = default_engine()
+    audio = None
+    if audio_dir and recording.media:
+        # Decoded once into the PCM cache; later runs only map it
+        audio = PcmCache(pcm_dir, sample_rate).open(recording.media)
+
+    segments = []
+    speakers: Dict[str, int] = {}
+    clips = 0
+    for cue in store:
+        speaker = speaker_id(cue.speaker) if cue.speaker else 'unknown'
+        cleaned = engine.apply(cue.text)
+        segment = {
+            'id': f'{recording.id}:{cue.id:05d}',
+            'recording': recording.id,
+            'cue': cue.id,
+            'speaker': speaker,
+            'label': cue.speaker,
+            'start': format_timestamp(cue.start_ms),
+            'end': format_timestamp(cue.end_ms),
+            'start_ms': cue.start_ms,
+            'end_ms': cue.end_ms,
+            'original': cue.text,
+            'cleaned': cleaned.text,
+            'cleanup_rules': cleaned.fired,
+        }
+        if audio is not None:
+            clip = audio.slice_ms(cue.start_ms, cue.end_ms)
+            if len(clip):
+                clip_path = write_audio(Path(audio_dir) / speaker / f'{recording.id}_{cue.id:05d}.flac',
+                                        clip, sample_rate)
+                segment['audio'] = str(clip_path)
+                clips += 1
+        speakers[speaker] = speakers.get(speaker, 0) + 1
+        segments.append(segment)
+    duration_s = int(store.end_ms.max()) / 1000 if len(store) else 0.0
+    return RecordingResult(recording, segments, duration_s, clips, speakers=speakers)
+
+
+def ingest_all(recordings: Iterable[Recording], workers: int, store_dir: str = DEFAULT_STORE_DIR,
+               audio_dir: Optional[str] = None, sample_rate: int = DEFAULT_SAMPLE_RATE, pcm_dir: str = DEFAULT_PCM_DIR,
+               on_result: Optional[Callable[[RecordingResult], None]] = None) -> List[RecordingResult]:
+    """Ingest recordings in a process pool, one recording per task, in completion order"""
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(ingest_recording, rec, store_dir, audio_dir, sample_rate, pcm_dir): rec
+                   for rec in recordings}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = RecordingResult(futures[future], [], 0.0, error=f'{type(e).__name__}: {e}')
+            results.append(result)
+            if on_result:
+                on_result(result)
+    return results
+
+
+def merge_corpus(results: Iterable[RecordingResult]) -> Dict[str, List[Dict]]:
+    """Per-speaker segment lists ordered by recording, then time"""
+    corpus: Dict[str, List[Dict]] = {}
+    for result in sorted(results, key=lambda r: r.recording.id):
+        for segment in result.segments:
+            corpus.setdefault(segment['speaker'], []).append(segment)
+    return corpus
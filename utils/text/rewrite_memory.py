@@ -0,0 +1,148 @@
+"""
+Rewrite memory
+Translation-memory store of (original → rewrite) pairs. Originals are
+indexed by MinHash signatures of character n-grams with LSH banding, so a
+re-transcribed or shifted segment finds its hand-written rewrite by text
+similarity instead of by segment id, without scanning every stored pair.
+"""
+import json
+import re
+import zlib
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+DEFAULT_MEMORY = 'data/reference/rewrite_memory.json'
+# Recording whose cue ids the hand-written rewrite tables use
+TABLE_RECORDING = 'GMT20251114-035710'
+
+NGRAM = 5
+NUM_PERM = 128
+BANDS = 32
+# Similarity (n-gram Jaccard) needed to apply a stored rewrite, and to suggest one
+APPLY_THRESHOLD = 0.8
+SUGGEST_THRESHOLD = 0.5
+
+_PRIME = np.uint64(4294967311)
+_rng = np.random.default_rng(1)
+_A = _rng.integers(1, 2 ** 32, NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, 2 ** 32, NUM_PERM, dtype=np.uint64)
+_NON_WORD = re.compile(r'[^a-z0-9]+')
+
+
+@dataclass
+class Entry:
+    table: str
+    original: str
+    rewrite: str
+    # Where the pair came from, e.g. 'GMT20251114-035710:00036'
+    source: str = ''
+
+
+@dataclass
+class Match:
+    entry: Entry
+    similarity: float
+
+    @property
+    def apply(self) -> bool:
+        return self.similarity >= APPLY_THRESHOLD
+
+
+def normalize(text: str) -> str:
+    return _NON_WORD.sub(' ', text.lower()).strip()
+
+
+def shingles(text: str) -> Set[int]:
+    """Hashed character n-grams of the normalized text"""
+    text = normalize(text)
+    if len(text) <= NGRAM:
+        return {zlib.crc32(text.encode('utf-8'))}
+    return {zlib.crc32(text[i:i + NGRAM].encode('utf-8')) for i in range(len(text) - NGRAM + 1)}
+
+
+def minhash(grams: Set[int]) -> np.ndarray:
+    values = np.fromiter(grams, dtype=np.uint64, count=len(grams))
+    return ((np.outer(_A, values) + _B[:, None]) % _PRIME).min(axis=1)
+
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+class RewriteMemory:
+    """Pairs from one or more rewrite tables with an LSH index over their originals"""
+
+    def __init__(self, entries: List[Entry] = ()):
+        self.entries: List[Entry] = []
+        self._grams: List[Set[int]] = []
+        self._exact: Dict[Tuple[str, str], int] = {}
+        self._buckets: Dict[bytes, List[int]] = {}
+        for entry in entries:
+            self.add(entry)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _bands(self, signature: np.ndarray) -> List[bytes]:
+        rows = NUM_PERM // BANDS
+        return [bytes([band]) + signature[band * rows:(band + 1) * rows].tobytes() for band in range(BANDS)]
+
+    def add(self, entry: Entry):
+        """Store a pair; an identical original in the same table replaces the previous rewrite"""
+        key = (entry.table, normalize(entry.original))
+        if key in self._exact:
+            self.entries[self._exact[key]] = entry
+            return
+        i = len(self.entries)
+        grams = shingles(entry.original)
+        self.entries.append(entry)
+        self._grams.append(grams)
+        self._exact[key] = i
+        for band in self._bands(minhash(grams)):
+            self._buckets.setdefault(band, []).append(i)
+
+    def match(self, text: str, table: str, threshold: float = SUGGEST_THRESHOLD) -> Optional[Match]:
+        """Closest stored original of `table` at or above `threshold`"""
+        exact = self._exact.get((table, normalize(text)))
+        if exact is not None:
+            return Match(self.entries[exact], 1.0)
+        grams = shingles(text)
+        candidates = {i for band in self._bands(minhash(grams)) for i in self._buckets.get(band, ())}
+        best = None
+        for i in candidates:
+            if self.entries[i].table != table:
+                continue
+            similarity = jaccard(grams, self._grams[i])
+            if similarity >= threshold and (best is None or similarity > best.similarity):
+                best = Match(self.entries[i], similarity)
+        return best
+
+    def overlay(self, table: str, rewrites: Dict[int, str], recording: str) -> List[int]:
+        """Take rewrite texts from a live id-keyed table whose ids are cues of `recording`
+
+        Returns the table ids with no stored original (memory needs rebuilding).
+        """
+        by_source = {e.source: i for i, e in enumerate(self.entries) if e.table == table}
+        missing = []
+        for seg_id, rewrite in rewrites.items():
+            i = by_source.get(f'{recording}:{seg_id:05d}')
+            if i is None:
+                missing.append(seg_id)
+            else:
+                self.entries[i].rewrite = rewrite
+        return missing
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_MEMORY) -> 'RewriteMemory':
+        with open(path) as f:
+            data = json.load(f)
+        return cls([Entry(**e) for e in data['entries']])
+
+    def save(self, path: Path = DEFAULT_MEMORY):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({'entries': [asdict(e) for e in self.entries]}, f, indent=2, ensure_ascii=False)
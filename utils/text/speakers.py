@@ -0,0 +1,35 @@
+"""
+Speaker names
+Maps the short speaker ids used for scripts, references and output folders
+to the labels Zoom writes into the VTT transcripts
+"""
+import re
+from typing import Optional
+
+# Speaker id → VTT/transcript speaker label
+SPEAKER_LABELS = {
+    'izaac': 'Zoom user',
+    'aaron': 'Devon Villalona',
+    'ken': 'Kenith Philip',
+    'jules': 'Jhuiwensley Belizaire',
+    'jared': 'Jared Zayas',
+}
+
+# Other names speakers go by → speaker id
+SPEAKER_ALIASES = {
+    'devon': 'aaron',
+}
+
+
+def speaker_label(name: str) -> Optional[str]:
+    """Transcript label for a speaker id or display name ('Izaac' → 'Zoom user')"""
+    name = name.lower()
+    return SPEAKER_LABELS.get(SPEAKER_ALIASES.get(name, name))
+
+
+def speaker_id(label: str) -> str:
+    """Speaker id for a transcript label ('Zoom user' → 'izaac'); unknown labels are slugified"""
+    for name, known in SPEAKER_LABELS.items():
+        if known == label:
+            return name
+    return re.sub(r'[^a-z0-9]+', '_', label.lower()).strip('_') or 'unknown'
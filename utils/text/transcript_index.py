@@ -0,0 +1,114 @@
+"""
+Transcript index
+Id, speaker and time-range lookups over a transcript JSON file (a list of
+segments with id/start/end/speaker). The index is saved as a sidecar
+`<transcript>.index.json` and rebuilt only when the transcript's hash changes.
+"""
+import json
+from bisect import bisect_left
+from itertools import accumulate
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from utils.hashing import file_digest
+from utils.text.speakers import speaker_label
+from utils.text.vtt import parse_timestamp
+
+INDEX_VERSION = 1
+
+
+def sidecar_path(transcript: Path) -> Path:
+    transcript = Path(transcript)
+    return transcript.with_name(transcript.name.replace('.json', '') + '.index.json')
+
+
+def build_index(segments: List[Dict]) -> Dict:
+    """Index data for a segment list; segment positions are list offsets"""
+    starts = [parse_timestamp(seg['start']) for seg in segments]
+    ends = [parse_timestamp(seg['end']) for seg in segments]
+    # Positions in start-time order for the interval index
+    order = sorted(range(len(segments)), key=lambda i: (starts[i], ends[i]))
+    postings: Dict[str, List[int]] = {}
+    for i in order:
+        postings.setdefault(segments[i]['speaker'], []).append(i)
+    return {
+        'version': INDEX_VERSION,
+        'ids': {str(seg['id']): i for i, seg in enumerate(segments)},
+        'order': order,
+        'starts': [starts[i] for i in order],
+        'ends': [ends[i] for i in order],
+        'speakers': postings,
+    }
+
+
+class TranscriptIndex:
+    """Segments of one transcript plus O(1) id, per-speaker and interval lookups"""
+
+    def __init__(self, segments: List[Dict], index: Dict):
+        self.segments = segments
+        self._ids = index['ids']
+        self._order = index['order']
+        self._starts = index['starts']
+        self._ends = index['ends']
+        # Running max of end times: everything before the first value > t0 ends by t0
+        self._max_ends = list(accumulate(self._ends, max))
+        self._postings = index['speakers']
+        self._rank = {i: k for k, i in enumerate(self._order)}
+
+    @classmethod
+    def open(cls, path: Path) -> 'TranscriptIndex':
+        """Load a transcript, reusing its sidecar index while the transcript is unchanged"""
+        path = Path(path)
+        with open(path) as f:
+            segments = json.load(f)
+        digest = file_digest(path)
+        sidecar = sidecar_path(path)
+        if sidecar.exists():
+            with open(sidecar) as f:
+                saved = json.load(f)
+            if saved.get('source_hash') == digest and saved.get('version') == INDEX_VERSION:
+                return cls(segments, saved)
+        index = build_index(segments)
+        with open(sidecar, 'w') as f:
+            json.dump({'source_hash': digest, **index}, f)
+        return cls(segments, index)
+
+    @classmethod
+    def from_segments(cls, segments: List[Dict]) -> 'TranscriptIndex':
+        """In-memory index without a sidecar"""
+        return cls(segments, build_index(segments))
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self.segments)
+
+    def get(self, seg_id: int) -> Optional[Dict]:
+        i = self._ids.get(str(seg_id))
+        return self.segments[i] if i is not None else None
+
+    @property
+    def speakers(self) -> List[str]:
+        return list(self._postings)
+
+    def resolve_speaker(self, name: str) -> List[str]:
+        """Transcript labels for a speaker id, alias, label or label fragment"""
+        label = speaker_label(name) or name
+        if label in self._postings:
+            return [label]
+        return [s for s in self._postings if label.lower() in s.lower()]
+
+    def by_speaker(self, name: str) -> List[Dict]:
+        """A speaker's segments in time order"""
+        labels = self.resolve_speaker(name)
+        positions = [i for label in labels for i in self._postings[label]]
+        if len(labels) > 1:
+            positions.sort(key=self._rank.__getitem__)
+        return [self.segments[i] for i in positions]
+
+    def overlapping(self, start_ms: int, end_ms: int) -> List[Dict]:
+        """Segments overlapping [start_ms, end_ms], in time order"""
+        hi = bisect_left(self._starts, end_ms + 1)
+        lo = bisect_left(self._max_ends, start_ms)
+        return [self.segments[self._order[k]] for k in range(lo, hi) if self._ends[k] >= start_ms]
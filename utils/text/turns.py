@@ -0,0 +1,92 @@
+"""
+Speaking turns
+Merges consecutive same-speaker cues into turns (capped by characters and
+duration, broken at long gaps) so full-transcript re-voicing makes fewer,
+larger TTS requests. Every turn keeps which cues it covers, their original
+time ranges and where their text sits in the turn, so per-cue audio can be
+cut back out of the synthesized turn.
+"""
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, List, Tuple
+
+from utils.text.vtt import Cue
+
+MAX_CHARS = 600
+MAX_DURATION_MS = 45_000
+MAX_GAP_MS = 1500
+
+
+@dataclass
+class TurnPart:
+    cue_id: int
+    start_ms: int
+    end_ms: int
+    # Span of the cue's text within Turn.text
+    char_start: int
+    char_end: int
+
+
+@dataclass
+class Turn:
+    speaker: str
+    parts: List[TurnPart] = field(default_factory=list)
+    text: str = ''
+
+    @property
+    def start_ms(self) -> int:
+        return self.parts[0].start_ms
+
+    @property
+    def end_ms(self) -> int:
+        return self.parts[-1].end_ms
+
+    @property
+    def cue_ids(self) -> List[int]:
+        return [part.cue_id for part in self.parts]
+
+    def append(self, cue_id: int, start_ms: int, end_ms: int, text: str):
+        if self.text:
+            self.text += ' '
+        self.parts.append(TurnPart(cue_id, start_ms, end_ms, len(self.text), len(self.text) + len(text)))
+        self.text += text
+
+    def cue_spans(self, audio_seconds: float) -> List[Tuple[int, float, float]]:
+        """(cue id, start s, end s) of each cue in the synthesized turn, by character position"""
+        total = max(len(self.text), 1)
+        spans = []
+        for i, part in enumerate(self.parts):
+            start = part.char_start / total * audio_seconds
+            # Each cue runs until the next begins, so no audio falls between cuts
+            end = self.parts[i + 1].char_start / total * audio_seconds if i + 1 < len(self.parts) else audio_seconds
+            spans.append((part.cue_id, start, end))
+        return spans
+
+    def to_dict(self) -> Dict:
+        return {'speaker': self.speaker, 'start_ms': self.start_ms, 'end_ms': self.end_ms,
+                'text': self.text, 'parts': [asdict(part) for part in self.parts]}
+
+
+def merge_turns(cues: Iterable[Cue], max_chars: int = MAX_CHARS, max_duration_ms: int = MAX_DURATION_MS,
+                max_gap_ms: int = MAX_GAP_MS) -> List[Turn]:
+    """Group adjacent cues of the same speaker into turns within the caps
+
+    A single cue over the caps still becomes a turn of its own; cues are never split.
+    """
+    turns: List[Turn] = []
+    current = None
+    for cue in cues:
+        text = cue.text.strip()
+        if not text:
+            continue
+        fits = (
+            current is not None
+            and cue.speaker == current.speaker
+            and cue.start_ms - current.end_ms <= max_gap_ms
+            and len(current.text) + 1 + len(text) <= max_chars
+            and cue.end_ms - current.start_ms <= max_duration_ms
+        )
+        if not fits:
+            current = Turn(cue.speaker)
+            turns.append(current)
+        current.append(cue.id, cue.start_ms, cue.end_ms, text)
+    return turns
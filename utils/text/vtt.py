@@ -0,0 +1,81 @@
+"""
+WebVTT transcript parsing
+Reads Zoom `*.transcript.vtt` files into timed, speaker-labelled cues
+"""
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, TextIO
+
+
+@dataclass
+class Cue:
+    """One transcript cue; times are integer milliseconds"""
+    id: int
+    start_ms: int
+    end_ms: int
+    speaker: str
+    text: str
+
+    @property
+    def duration_ms(self) -> int:
+        return self.end_ms - self.start_ms
+
+
+def parse_timestamp(ts: str) -> int:
+    """'00:01:05.899' (or '01:05.899') → milliseconds"""
+    parts = ts.strip().split(':')
+    seconds = float(parts[-1])
+    minutes = int(parts[-2]) if len(parts) > 1 else 0
+    hours = int(parts[-3]) if len(parts) > 2 else 0
+    return (hours * 3600 + minutes * 60) * 1000 + round(seconds * 1000)
+
+
+def format_timestamp(ms: int) -> str:
+    """Milliseconds → '00:01:05.899'"""
+    hours, rem = divmod(ms, 3_600_000)
+    minutes, rem = divmod(rem, 60_000)
+    seconds, millis = divmod(rem, 1000)
+    return f'{hours:02d}:{minutes:02d}:{seconds:02d}.{millis:03d}'
+
+
+def _cue(cue_id: int, timing: str, text_lines: List[str]) -> Cue:
+    start, end = timing.split('-->')
+    text = ' '.join(text_lines).strip()
+    speaker = ''
+    if ': ' in text:
+        speaker, text = text.split(': ', 1)
+    return Cue(cue_id, parse_timestamp(start), parse_timestamp(end.split()[0]), speaker, text)
+
+
+def iter_cues(lines: TextIO) -> Iterator[Cue]:
+    """Yield cues from WebVTT lines as they are read; ids are 0-based in order"""
+    n = 0
+    timing = None
+    text_lines: List[str] = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            if timing is not None:
+                yield _cue(n, timing, text_lines)
+                n += 1
+            timing = None
+            text_lines = []
+        elif timing is None:
+            # Header, NOTE and cue-number lines before the timing line are skipped
+            if '-->' in line:
+                timing = line
+        else:
+            text_lines.append(line)
+    if timing is not None:
+        yield _cue(n, timing, text_lines)
+
+
+def iter_vtt(path: Path) -> Iterator[Cue]:
+    """Stream the cues of a Zoom WebVTT transcript without reading it whole"""
+    with open(path, encoding='utf-8-sig') as f:
+        yield from iter_cues(f)
+
+
+def parse_vtt(path: Path) -> List[Cue]:
+    """Parse a Zoom WebVTT transcript; cue ids are 0-based in file order"""
+    return list(iter_vtt(path))
@@ -0,0 +1,41 @@
+"""
+Fish Speech codec wrapper
+Encodes audio to DAC codec tokens by running fish-speech's own inference
+script inside its virtualenv (same call as extract_all_voice_embeddings.sh)
+"""
+import subprocess
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+DEFAULT_FISH_DIR = 'fish-speech'
+DEFAULT_CHECKPOINT = 'checkpoints/openaudio-s1-mini/codec.pth'
+
+
+class FishCodecEncoder:
+    """Audio file → (n_codebooks, frames) int token array"""
+
+    def __init__(self, fish_dir: str = DEFAULT_FISH_DIR, checkpoint: str = DEFAULT_CHECKPOINT,
+                 device: str = 'cpu'):
+        self.fish_dir = Path(fish_dir)
+        self.python = self.fish_dir / '.venv' / 'bin' / 'python3'
+        self.script = self.fish_dir / 'fish_speech' / 'models' / 'dac' / 'inference.py'
+        self.checkpoint = self.fish_dir / checkpoint
+        self.device = device
+
+    def available(self) -> bool:
+        return self.python.exists() and self.script.exists() and self.checkpoint.exists()
+
+    def encode(self, audio_path: Path) -> np.ndarray:
+        """Encode one audio file; raises CalledProcessError if the codec fails"""
+        with tempfile.TemporaryDirectory() as tmp:
+            output_wav = Path(tmp) / 'codes.wav'
+            subprocess.run([
+                str(self.python), str(self.script),
+                '-i', str(audio_path),
+                '--checkpoint-path', str(self.checkpoint),
+                '-o', str(output_wav),
+                '--device', self.device,
+            ], check=True, capture_output=True)
+            return np.load(output_wav.with_suffix('.npy'))
@@ -0,0 +1,172 @@
+"""
+Fish Speech HTTP client
+Talks to fish-speech/tools/api_server.py over one pooled keep-alive session
+and fans requests out across a bounded thread pool
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_API_URL = 'http://127.0.0.1:8080'
+
+
+@dataclass
+class TTSParams:
+    """Synthesis parameters sent with every /v1/tts request"""
+    chunk_length: int = 200
+    max_new_tokens: int = 1024
+    top_p: float = 0.7
+    repetition_penalty: float = 1.2
+    temperature: float = 0.7
+    seed: Optional[int] = None
+    format: str = 'wav'
+    normalize: bool = True
+
+    def to_dict(self) -> Dict:
+        return {
+            'chunk_length': self.chunk_length,
+            'max_new_tokens': self.max_new_tokens,
+            'top_p': self.top_p,
+            'repetition_penalty': self.repetition_penalty,
+            'temperature': self.temperature,
+            'seed': self.seed,
+            'format': self.format,
+            'normalize': self.normalize,
+        }
+
+
+@dataclass
+class TTSJob:
+    """One text → audio request"""
+    key: str
+    text: str
+    reference_id: str
+    output_path: Path
+    params: TTSParams = field(default_factory=TTSParams)
+
+
+@dataclass
+class TTSResult:
+    """Outcome of a single TTSJob"""
+    job: TTSJob
+    ok: bool
+    wall_time: float
+    error: Optional[str] = None
+    attempts: int = 1
+    # Time spent waiting for a free worker slot before the first request
+    queue_wait: float = 0.0
+    # Time until the server's response headers arrived (last attempt)
+    server_time: Optional[float] = None
+
+
+class FishSpeechClient:
+    """Pooled, concurrent client for the Fish Speech API server"""
+
+    def __init__(self, base_url: str = DEFAULT_API_URL, concurrency: int = 2,
+                 timeout: float = 3600.0, api_key: Optional[str] = None, retries: int = 2,
+                 memory_cache: bool = True):
+        self.base_url = base_url.rstrip('/')
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.retries = max(0, retries)
+        # Ask the server to keep each reference_id's encoded prompt in memory,
+        # so a voice is encoded once per server process instead of per request
+        self.memory_cache = memory_cache
+
+        # One session shared by every worker thread; the adapter keeps up to
+        # `concurrency` connections alive so no request pays a TCP handshake
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if api_key:
+            self.session.headers['Authorization'] = f'Bearer {api_key}'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def health(self) -> bool:
+        """Return True if the API server answers its health check"""
+        try:
+            resp = self.session.get(f'{self.base_url}/v1/health', timeout=10)
+            return resp.ok
+        except requests.RequestException:
+            return False
+
+    def synthesize(self, text: str, reference_id: str,
+                   params: Optional[TTSParams] = None) -> bytes:
+        """Synthesize `text` with a stored reference voice, returning audio bytes"""
+        return self._post_tts(text, reference_id, params).content
+
+    def _post_tts(self, text: str, reference_id: str, params: Optional[TTSParams]) -> requests.Response:
+        params = params or TTSParams()
+        payload = {
+            'text': text,
+            'references': [],
+            'reference_id': reference_id,
+            'streaming': False,
+            'use_memory_cache': 'on' if self.memory_cache else 'off',
+            **params.to_dict(),
+        }
+        resp = self.session.post(f'{self.base_url}/v1/tts', json=payload, timeout=self.timeout)
+        resp.raise_for_status()
+        return resp
+
+    def run_job(self, job: TTSJob) -> TTSResult:
+        """Run one job, retrying on its own, and write its audio atomically to job.output_path"""
+        start = time.perf_counter()
+        error = None
+        for attempt in range(1, self.retries + 2):
+            try:
+                resp = self._post_tts(job.text, job.reference_id, job.params)
+                job.output_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = job.output_path.with_name(job.output_path.name + '.part')
+                tmp_path.write_bytes(resp.content)
+                os.replace(tmp_path, job.output_path)
+                return TTSResult(job, True, time.perf_counter() - start, attempts=attempt,
+                                 server_time=resp.elapsed.total_seconds())
+            except (requests.RequestException, OSError) as e:
+                error = str(e)
+                if attempt <= self.retries:
+                    time.sleep(min(2 ** attempt, 30))
+        return TTSResult(job, False, time.perf_counter() - start, error, attempts=self.retries + 1)
+
+    def run(self, jobs: Iterable[TTSJob],
+            on_result: Optional[Callable[[TTSResult], None]] = None,
+            on_start: Optional[Callable[[TTSJob], bool]] = None) -> List[TTSResult]:
+        """Run jobs with at most `concurrency` requests in flight
+
+        `on_start(job)` is called when a worker picks a job up; returning False
+        skips the job (it gets no result).
+        """
+        def task(job, submitted):
+            if on_start and not on_start(job):
+                return None
+            queue_wait = time.perf_counter() - submitted
+            result = self.run_job(job)
+            result.queue_wait = queue_wait
+            return result
+
+        results = []
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            futures = [pool.submit(task, job, time.perf_counter()) for job in jobs]
+            for future in as_completed(futures):
+                result = future.result()
+                if result is None:
+                    continue
+                results.append(result)
+                if on_result:
+                    on_result(result)
+        return results
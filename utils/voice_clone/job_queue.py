@@ -0,0 +1,112 @@
+"""
+Persistent TTS job queue
+SQLite-backed per-job state (pending/running/done/failed) so an interrupted
+or time-boxed generation run resumes exactly where it stopped
+"""
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    key TEXT PRIMARY KEY,
+    label TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    started_at REAL,
+    finished_at REAL,
+    wall_time REAL,
+    output_path TEXT,
+    output_hash TEXT,
+    error TEXT
+)
+"""
+
+
+class JobQueue:
+    """Job state table shared by every thread of a generation run"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(_SCHEMA)
+
+    def close(self):
+        self._conn.close()
+
+    def _execute(self, sql: str, args: Tuple = ()):
+        with self._lock:
+            return self._conn.execute(sql, args)
+
+    def add(self, jobs: Iterable[Tuple[str, str]]):
+        """Register (key, label) pairs; existing jobs keep their state"""
+        with self._lock:
+            self._conn.executemany('INSERT OR IGNORE INTO jobs (key, label) VALUES (?, ?)', list(jobs))
+
+    def reclaim_stale(self, timeout: float) -> int:
+        """Return jobs stuck in 'running' for longer than `timeout` seconds to pending"""
+        cursor = self._execute(
+            'UPDATE jobs SET state = ?, worker = NULL WHERE state = ? AND started_at < ?',
+            (PENDING, RUNNING, time.time() - timeout),
+        )
+        return cursor.rowcount
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            cursor = self._conn.execute('SELECT * FROM jobs WHERE key = ?', (key,))
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        return dict(zip([col[0] for col in cursor.description], row))
+
+    def claim(self, key: str, worker: str) -> bool:
+        """Atomically move a pending/failed job to running; False if someone else has it"""
+        cursor = self._execute(
+            'UPDATE jobs SET state = ?, worker = ?, started_at = ?, attempts = attempts + 1, error = NULL '
+            'WHERE key = ? AND state IN (?, ?)',
+            (RUNNING, worker, time.time(), key, PENDING, FAILED),
+        )
+        return cursor.rowcount == 1
+
+    def release_worker(self, worker: str) -> int:
+        """Return every job `worker` still holds to pending (its run is stopping or was interrupted)"""
+        cursor = self._execute('UPDATE jobs SET state = ?, worker = NULL WHERE worker = ? AND state = ?',
+                               (PENDING, worker, RUNNING))
+        return cursor.rowcount
+
+    def mark_done(self, key: str, output_path: Path, output_hash: str, wall_time: float):
+        self._execute(
+            'UPDATE jobs SET state = ?, finished_at = ?, wall_time = ?, output_path = ?, output_hash = ?, error = NULL '
+            'WHERE key = ?',
+            (DONE, time.time(), wall_time, str(output_path), output_hash, key),
+        )
+
+    def mark_failed(self, key: str, error: str, wall_time: float):
+        self._execute(
+            'UPDATE jobs SET state = ?, finished_at = ?, wall_time = ?, error = ? WHERE key = ?',
+            (FAILED, time.time(), wall_time, error, key),
+        )
+
+    def reset(self, key: str):
+        """Force a job back to pending (e.g. its output went missing)"""
+        self._execute('UPDATE jobs SET state = ?, output_hash = NULL WHERE key = ?', (PENDING, key))
+
+    def counts(self, keys: Iterable[str]) -> Dict[str, int]:
+        """Number of the given jobs in each state"""
+        counts = {PENDING: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+        for key in keys:
+            job = self.get(key)
+            if job:
+                counts[job['state']] += 1
+        return counts
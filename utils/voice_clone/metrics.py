@@ -0,0 +1,129 @@
+"""
+TTS generation metrics
+Per-chunk timing, real-time factor and throughput, appended as JSON lines
+next to the manifest, plus a live ETA and per-run / per-speaker summaries
+"""
+import json
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import soundfile as sf
+
+
+def audio_seconds(path: Path) -> float:
+    """Duration of an audio file from its header"""
+    return sf.info(str(path)).duration
+
+
+def summarize(records: Iterable[Dict]) -> Dict:
+    """Aggregate chunk records: totals, RTF and throughput"""
+    records = list(records)
+    wall = sum(r['wall_time'] for r in records)
+    audio = sum(r['audio_seconds'] for r in records)
+    chars = sum(r['chars'] for r in records)
+    server = [r['server_time'] for r in records if r.get('server_time') is not None]
+    return {
+        'chunks': len(records),
+        'chars': chars,
+        'audio_seconds': round(audio, 3),
+        'wall_time': round(wall, 3),
+        'queue_wait': round(sum(r['queue_wait'] for r in records), 3),
+        'server_time': round(sum(server), 3) if server else None,
+        'rtf': round(wall / audio, 3) if audio else None,
+        'chars_per_second': round(chars / wall, 3) if wall else None,
+    }
+
+
+def summarize_by_speaker(records: Iterable[Dict]) -> Dict[str, Dict]:
+    by_speaker = defaultdict(list)
+    for r in records:
+        by_speaker[r['speaker']].append(r)
+    return {speaker: summarize(rs) for speaker, rs in sorted(by_speaker.items())}
+
+
+def load_records(path: Path) -> List[Dict]:
+    """All records in a metrics file"""
+    if not Path(path).exists():
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class MetricsRecorder:
+    """Collects chunk metrics for one generation run"""
+
+    def __init__(self, path: Path, total_chars: int, settings: Optional[Dict] = None):
+        self.path = Path(path)
+        self.run_id = time.strftime('%Y%m%d-%H%M%S')
+        self.settings = settings or {}
+        self.total_chars = total_chars
+        # Characters of failed or skipped chunks, which won't be synthesized this run
+        self.dropped_chars = 0
+        self.started = time.perf_counter()
+        self.records: List[Dict] = []
+        self._lock = threading.Lock()
+
+    def record(self, key: str, label: str, speaker: str, chars: int, wall_time: float,
+               queue_wait: float, audio_seconds: float, server_time: Optional[float]) -> Dict:
+        record = {
+            'type': 'chunk',
+            'run_id': self.run_id,
+            'key': key,
+            'label': label,
+            'speaker': speaker,
+            'chars': chars,
+            'wall_time': round(wall_time, 3),
+            'queue_wait': round(queue_wait, 3),
+            'server_time': round(server_time, 3) if server_time is not None else None,
+            'audio_seconds': round(audio_seconds, 3),
+            'rtf': round(wall_time / audio_seconds, 3) if audio_seconds else None,
+            'chars_per_second': round(chars / wall_time, 3) if wall_time else None,
+        }
+        with self._lock:
+            self.records.append(record)
+        return record
+
+    def drop(self, chars: int):
+        """Take a failed or skipped chunk's characters out of the remaining work"""
+        with self._lock:
+            self.dropped_chars += chars
+
+    def eta(self) -> Optional[float]:
+        """Seconds left for the remaining characters at the observed run throughput"""
+        with self._lock:
+            done = sum(r['chars'] for r in self.records)
+            remaining = self.total_chars - done - self.dropped_chars
+        if not done:
+            return None
+        elapsed = time.perf_counter() - self.started
+        return max(remaining, 0) * elapsed / done
+
+    def save(self) -> Dict:
+        """Append this run's chunk records and summary to the metrics file"""
+        elapsed = time.perf_counter() - self.started
+        totals = summarize(self.records)
+        summary = {
+            'type': 'run',
+            'run_id': self.run_id,
+            'settings': self.settings,
+            'elapsed': round(elapsed, 3),
+            **totals,
+            # Wall clock per audio second with all workers running in parallel
+            'effective_rtf': round(elapsed / totals['audio_seconds'], 3) if totals['audio_seconds'] else None,
+            'speakers': summarize_by_speaker(self.records),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a') as f:
+            for record in self.records + [summary]:
+                f.write(json.dumps(record) + '\n')
+        return summary
+
+
+def format_seconds(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return '--'
+    minutes, secs = divmod(int(round(seconds)), 60)
+    return f'{minutes}m{secs:02d}s' if minutes else f'{secs}s'
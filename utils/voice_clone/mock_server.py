@@ -0,0 +1,149 @@
+"""
+Mock Fish Speech API server
+Speaks the same HTTP API as fish-speech/tools/api_server.py (/v1/health,
+/v1/tts with a JSON body) and returns deterministic synthetic audio after a
+configurable latency, so the generation pipeline can be benchmarked offline
+"""
+import hashlib
+import io
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Set
+
+import numpy as np
+import soundfile as sf
+
+
+@dataclass
+class LatencyModel:
+    """Synthesis cost: overhead + per-character time, with a fixed number of inference slots"""
+    overhead: float = 0.05
+    per_char: float = 0.002
+    # First use of a reference_id (or every use with use_memory_cache off)
+    reference_encode: float = 0.2
+    concurrency: int = 1
+    jitter: float = 0.0
+    failure_rate: float = 0.0
+
+
+def synthetic_audio(text: str, sample_rate: int = 44100, chars_per_second: float = 15.0) -> np.ndarray:
+    """Deterministic tone sequence whose length tracks the text length"""
+    seed = int.from_bytes(hashlib.sha256(text.encode('utf-8')).digest()[:4], 'little')
+    rng = np.random.default_rng(seed)
+    n = int(sample_rate * max(len(text), 1) / chars_per_second)
+    # One "syllable" tone every ~150 ms
+    step = int(sample_rate * 0.15)
+    freqs = np.repeat(rng.uniform(110, 260, n // step + 1), step)[:n]
+    phase = np.cumsum(2 * np.pi * freqs / sample_rate)
+    envelope = np.abs(np.sin(np.pi * np.arange(n) / step))
+    return (0.3 * envelope * np.sin(phase)).astype(np.float32)
+
+
+class MockFishServer:
+    """Threaded mock server; use as a context manager or call start()/stop()"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: Optional[LatencyModel] = None,
+                 sample_rate: int = 44100, seed: int = 0):
+        self.latency = latency or LatencyModel()
+        self.sample_rate = sample_rate
+        self._slots = threading.BoundedSemaphore(max(1, self.latency.concurrency))
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._warm: Set[str] = set()
+        self.requests = 0
+        self.encodes = 0
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'MockFishServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def _random(self) -> float:
+        with self._rng_lock:
+            return self._rng.random()
+
+    def synthesize(self, request: dict) -> Optional[bytes]:
+        """Simulate one /v1/tts request; returns WAV bytes or None for an injected failure"""
+        text = request.get('text', '')
+        reference_id = request.get('reference_id')
+        cost = self.latency.overhead + self.latency.per_char * len(text)
+        with self._slots:
+            with self._rng_lock:
+                self.requests += 1
+                if reference_id and (reference_id not in self._warm or request.get('use_memory_cache') != 'on'):
+                    self._warm.add(reference_id)
+                    self.encodes += 1
+                    cost += self.latency.reference_encode
+            if self.latency.jitter:
+                cost *= 1 + self.latency.jitter * (2 * self._random() - 1)
+            time.sleep(max(0.0, cost))
+            if self.latency.failure_rate and self._random() < self.latency.failure_rate:
+                return None
+        buf = io.BytesIO()
+        sf.write(buf, synthetic_audio(text, self.sample_rate), self.sample_rate, format='WAV', subtype='PCM_16')
+        return buf.getvalue()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _send(self, status: int, body: bytes, content_type: str):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path == '/v1/health':
+                    self._send(200, b'{"status":"ok"}', 'application/json')
+                else:
+                    self._send(404, b'{"detail":"Not Found"}', 'application/json')
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                if self.path != '/v1/tts':
+                    self._send(404, b'{"detail":"Not Found"}', 'application/json')
+                    return
+                try:
+                    request = json.loads(body)
+                except ValueError:
+                    self._send(422, b'{"detail":"Invalid JSON body"}', 'application/json')
+                    return
+                audio = server.synthesize(request)
+                if audio is None:
+                    self._send(500, b'{"detail":"Injected failure"}', 'application/json')
+                else:
+                    self._send(200, audio, 'audio/wav')
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
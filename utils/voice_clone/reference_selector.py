@@ -0,0 +1,169 @@
+"""
+Reference clip selection for voice cloning
+Picks a short, clean 5-15 s window of a speaker from the source recordings,
+aligned to VTT cue boundaries so its transcript matches the audio exactly
+"""
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import soundfile as sf
+
+from utils.text.vtt import Cue
+
+FRAME_MS = 20
+N_BANDS = 32
+
+
+@dataclass
+class Window:
+    """A candidate reference clip made of consecutive same-speaker cues"""
+    recording: str
+    start_ms: int
+    end_ms: int
+    text: str
+    cue_ids: List[int]
+    scores: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def duration_s(self) -> float:
+        return (self.end_ms - self.start_ms) / 1000
+
+    @property
+    def score(self) -> float:
+        return self.scores.get('total', 0.0)
+
+
+def candidate_windows(cues: Sequence[Cue], speaker: str, recording: str,
+                      min_s: float = 5.0, max_s: float = 15.0, max_gap_ms: int = 600) -> List[Window]:
+    """All runs of consecutive `speaker` cues spanning min_s..max_s seconds
+
+    Runs never cross another speaker's cue or a gap longer than max_gap_ms,
+    so the joined cue texts are exactly what is said in the window.
+    """
+    windows = []
+    for i, first in enumerate(cues):
+        if first.speaker != speaker:
+            continue
+        texts = []
+        ids = []
+        prev_end = first.start_ms
+        for cue in cues[i:]:
+            if cue.speaker != speaker or cue.start_ms - prev_end > max_gap_ms:
+                break
+            span = (cue.end_ms - first.start_ms) / 1000
+            if span > max_s:
+                break
+            texts.append(cue.text)
+            ids.append(cue.id)
+            prev_end = cue.end_ms
+            if span >= min_s:
+                windows.append(Window(recording, first.start_ms, cue.end_ms, ' '.join(texts), list(ids)))
+    return windows
+
+
+def _frames(audio: np.ndarray, sample_rate: int) -> np.ndarray:
+    n = int(sample_rate * FRAME_MS / 1000)
+    usable = len(audio) // n * n
+    return audio[:usable].reshape(-1, n)
+
+
+def energy_scores(audio: np.ndarray, sample_rate: int) -> Dict[str, float]:
+    """Cheap level/SNR/activity/clipping metrics from frame RMS"""
+    frames = _frames(audio, sample_rate)
+    if len(frames) == 0:
+        return {'snr_db': 0.0, 'level_db': -120.0, 'active': 0.0, 'clipped': 0.0}
+    rms_db = 20 * np.log10(np.sqrt(np.mean(frames ** 2, axis=1)) + 1e-9)
+    noise_db, speech_db = np.percentile(rms_db, [10, 90])
+    return {
+        'snr_db': float(speech_db - noise_db),
+        'level_db': float(speech_db),
+        'active': float(np.mean(rms_db > noise_db + 6.0)),
+        'clipped': float(np.mean(np.abs(audio) > 0.99)),
+    }
+
+
+def spectral_profile(audio: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Long-term average spectrum on log-spaced bands, mean-removed dB"""
+    frames = _frames(audio, sample_rate)
+    if len(frames) == 0:
+        return np.zeros(N_BANDS)
+    power = np.mean(np.abs(np.fft.rfft(frames * np.hanning(frames.shape[1]), axis=1)) ** 2, axis=0)
+    freqs = np.fft.rfftfreq(frames.shape[1], 1 / sample_rate)
+    edges = np.geomspace(80, min(8000, sample_rate / 2), N_BANDS + 1)
+    band = np.clip(np.searchsorted(edges, freqs) - 1, 0, N_BANDS - 1)
+    valid = (freqs >= edges[0]) & (freqs <= edges[-1])
+    bands = np.bincount(band[valid], weights=power[valid], minlength=N_BANDS)
+    profile = 10 * np.log10(bands + 1e-12)
+    return profile - profile.mean()
+
+
+def _cosine(a: np.ndarray, b: np.ndarray) -> float:
+    denom = np.linalg.norm(a) * np.linalg.norm(b)
+    return float(np.dot(a, b) / denom) if denom else 0.0
+
+
+def code_histogram(codes: np.ndarray, codebook_size: int = 4096) -> np.ndarray:
+    """Per-codebook token usage histogram, flattened"""
+    codes = np.asarray(codes).reshape(codes.shape[0], -1)
+    return np.concatenate([np.bincount(row, minlength=codebook_size)[:codebook_size] for row in codes]).astype(np.float64)
+
+
+class ReferenceSelector:
+    """Scores candidate windows and picks the best reference clip"""
+
+    def __init__(self, sample_rate: int, target_s: float = 10.0, embedding: Optional[np.ndarray] = None,
+                 encoder=None, rerank_top: int = 5):
+        self.sample_rate = sample_rate
+        self.target_s = target_s
+        self.embedding = embedding
+        self.encoder = encoder
+        self.rerank_top = rerank_top
+
+    def _slice(self, audio: np.ndarray, window: Window) -> np.ndarray:
+        a = window.start_ms * self.sample_rate // 1000
+        b = window.end_ms * self.sample_rate // 1000
+        return audio[a:b]
+
+    def score(self, windows: List[Window], recordings: Dict[str, np.ndarray]) -> List[Window]:
+        """Score every window and return them best-first"""
+        if not windows:
+            return []
+        clips = [self._slice(recordings[w.recording], w) for w in windows]
+        profiles = np.array([spectral_profile(clip, self.sample_rate) for clip in clips])
+        # Median over all of the speaker's windows is a robust voice profile:
+        # crosstalk, music or a different mic pull a window away from it
+        voice_profile = np.median(profiles, axis=0)
+
+        for window, clip, profile in zip(windows, clips, profiles):
+            s = energy_scores(clip, self.sample_rate)
+            quality = (min(s['snr_db'], 40.0) / 40.0) * 0.6 + s['active'] * 0.4 - s['clipped'] * 5.0
+            if s['level_db'] < -40.0:
+                quality -= 0.2
+            similarity = (_cosine(profile, voice_profile) + 1) / 2
+            length = 1.0 - min(abs(window.duration_s - self.target_s) / self.target_s, 1.0)
+            window.scores = {**s, 'quality': quality, 'similarity': similarity, 'length': length}
+            window.scores['total'] = 0.5 * quality + 0.35 * similarity + 0.15 * length
+
+        ranked = sorted(windows, key=lambda w: w.score, reverse=True)
+        if self.encoder is not None and self.embedding is not None:
+            ranked = self._rerank_with_codes(ranked, recordings)
+        return ranked
+
+    def _rerank_with_codes(self, ranked: List[Window], recordings: Dict[str, np.ndarray]) -> List[Window]:
+        """Compare the top windows' codec tokens with the stored voice embedding"""
+        target = code_histogram(self.embedding)
+        head = ranked[:self.rerank_top]
+        with tempfile.TemporaryDirectory() as tmp:
+            for n, window in enumerate(head):
+                clip_path = Path(tmp) / f'window_{n}.wav'
+                sf.write(str(clip_path), self._slice(recordings[window.recording], window), self.sample_rate)
+                codes = self.encoder.encode(clip_path)
+                window.scores['embedding'] = _cosine(code_histogram(codes), target)
+                window.scores['total'] = 0.5 * window.scores['total'] + 0.5 * window.scores['embedding']
+        return sorted(head, key=lambda w: w.score, reverse=True) + ranked[self.rerank_top:]
+
+    def extract(self, window: Window, recordings: Dict[str, np.ndarray]) -> np.ndarray:
+        return self._slice(recordings[window.recording], window)
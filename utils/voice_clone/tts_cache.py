@@ -0,0 +1,150 @@
+"""
+Content-addressed TTS audio cache
+Rendered audio is stored under a hash of everything that affects synthesis,
+so unchanged segments are copied back instead of re-synthesized
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Dict
+
+from utils.hashing import file_digest
+
+DEFAULT_CACHE_DIR = 'output/cache/tts'
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+DEFAULT_REFERENCES_DIR = 'fish-speech/references'
+
+
+def reference_fingerprint(reference_id: str, refs_dir: str = DEFAULT_REFERENCES_DIR) -> str:
+    """Hash every file in a Fish Speech reference directory (audio + .lab)"""
+    ref_dir = Path(refs_dir) / reference_id
+    h = hashlib.sha256(reference_id.encode('utf-8'))
+    if ref_dir.is_dir():
+        for path in sorted(p for p in ref_dir.iterdir() if p.is_file()):
+            h.update(path.name.encode('utf-8'))
+            h.update(file_digest(path).encode('ascii'))
+    return h.hexdigest()
+
+
+def cache_key(text: str, reference_id: str, reference_hash: str, params: Dict) -> str:
+    """Cache key for one synthesis request"""
+    blob = json.dumps({
+        'text': text,
+        'reference_id': reference_id,
+        'reference_hash': reference_hash,
+        'params': params,
+    }, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+
+class TTSCache:
+    """Size-bounded LRU cache of rendered audio files"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.index_file = self.cache_dir / 'index.json'
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Session counts already added to the index's cumulative stats
+        self._saved = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.entries: Dict[str, Dict] = {}
+        if self.index_file.exists():
+            with open(self.index_file) as f:
+                self.entries = json.load(f).get('entries', {})
+        # Drop entries whose file was deleted behind our back
+        self.entries = {k: v for k, v in self.entries.items() if self._path(k).exists()}
+        # Adopt files stored by a run that stopped before saving the index, so
+        # eviction still counts them
+        for path in self.cache_dir.glob('??/*.wav'):
+            if path.stem not in self.entries:
+                stat = path.stat()
+                self.entries[path.stem] = {'size': stat.st_size, 'created': stat.st_mtime,
+                                           'last_access': stat.st_mtime}
+        self._evict()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f'{key}.wav'
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(entry['size'] for entry in self.entries.values())
+
+    def get(self, key: str, dest: Path) -> bool:
+        """Copy a cached file to `dest`; returns False on a miss"""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False
+            entry['last_access'] = time.time()
+            self.hits += 1
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(self._path(key), dest)
+        return True
+
+    def put(self, key: str, src: Path):
+        """Store a rendered file under `key` and evict down to the size limit"""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.part')
+        shutil.copyfile(src, tmp_path)
+        os.replace(tmp_path, path)
+        with self._lock:
+            now = time.time()
+            self.entries[key] = {'size': path.stat().st_size, 'created': now, 'last_access': now}
+            self._evict()
+
+    def _evict(self):
+        total = self.total_bytes
+        for key in sorted(self.entries, key=lambda k: self.entries[k]['last_access']):
+            if total <= self.max_bytes:
+                break
+            total -= self.entries.pop(key)['size']
+            self._path(key).unlink(missing_ok=True)
+            self.evictions += 1
+
+    def save(self):
+        """Persist the index (entries and cumulative stats); safe to call repeatedly"""
+        with self._lock:
+            stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+            if self.index_file.exists():
+                with open(self.index_file) as f:
+                    stats.update(json.load(f).get('stats', {}))
+            session = {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+            for name, count in session.items():
+                stats[name] += count - self._saved[name]
+            tmp_file = self.index_file.with_suffix('.json.part')
+            with open(tmp_file, 'w') as f:
+                json.dump({'entries': self.entries, 'stats': stats}, f, indent=2)
+            os.replace(tmp_file, self.index_file)
+            self._saved = session
+
+    def stats(self) -> Dict:
+        """Stats for the current session"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'bytes': self.total_bytes,
+        }
+
+
+def format_bytes(size: int) -> str:
+    """Human-readable byte count"""
+    size = float(size)
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size < 1024 or unit == 'GB':
+            return f'{size:.1f}{unit}'
+        size /= 1024